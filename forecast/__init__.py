@@ -2,8 +2,66 @@
 # For license information, please see license.txt"
 
 
-from .date_binning import Period
-from .forecast import Forecast, calculate_seasonality_factors
+# Avoids importing typing at startup; type checkers treat TYPE_CHECKING as True
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from .date_binning import DateBins, IntradayBins, Period
+	from .forecast import (
+		Forecast,
+		ForecastModel,
+		calculate_seasonality_factors,
+		croston_sparse,
+		intermittent_batch,
+		run_method,
+		select_method,
+		to_sparse,
+		tsb_sparse,
+	)
+	from .periodicities import PeriodicitySpec, register_periodicity
+
+
+# Submodules are imported on first access of one of their names, so `import forecast` stays
+# cheap for callers that only need part of the package
+_exports = {
+	"DateBins": "date_binning",
+	"IntradayBins": "date_binning",
+	"Period": "date_binning",
+	"Forecast": "forecast",
+	"ForecastModel": "forecast",
+	"calculate_seasonality_factors": "forecast",
+	"croston_sparse": "forecast",
+	"intermittent_batch": "forecast",
+	"run_method": "forecast",
+	"select_method": "forecast",
+	"to_sparse": "forecast",
+	"tsb_sparse": "forecast",
+	"PeriodicitySpec": "periodicities",
+	"register_periodicity": "periodicities",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+	module = _exports.get(name)
+	if module is None:
+		# Submodules themselves, e.g. `forecast.date_binning` after only `import forecast`
+		if not name.startswith("__"):
+			import importlib
+
+			try:
+				return importlib.import_module(f"{__name__}.{name}")
+			except ModuleNotFoundError as e:
+				if e.name != f"{__name__}.{name}":
+					raise
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted(set(globals()) | set(__all__))
 
 
 __version__ = "0.5.0"
@@ -0,0 +1,210 @@
+# Copyright (c) 2024, AgriTheory and contributors
+# For license information, please see license.txt
+
+
+import asyncio
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from functools import partial
+
+from .cache import ResultCache
+from .forecast import run_method
+
+
+def _freeze(value):
+	"""Recursively converts lists and dicts into hashable tuples so they can be used in a key."""
+	if isinstance(value, dict):
+		return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+	if isinstance(value, (list, tuple)):
+		return tuple(_freeze(v) for v in value)
+	return value
+
+
+def request_key(
+	data: typing.Sequence[typing.Sequence[Decimal]], method: str, kwargs: dict
+) -> tuple:
+	"""
+	Returns a hashable key identifying a forecast request. Two requests with equal keys produce
+	the same result, so concurrent identical requests can share one computation.
+
+	:param data: sequence of sequences of Decimal historical data
+	:param method: the name of the forecast method
+	:param kwargs: the keyword arguments for the forecast method
+	:return: hashable tuple of the request's data, method and parameters
+	"""
+	return (_freeze(data), method, _freeze(kwargs))
+
+
+def _release_slot(loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore) -> None:
+	# Called from the worker thread when a job finishes
+	try:
+		loop.call_soon_threadsafe(slots.release)
+	except RuntimeError:
+		# The event loop is closed, so nothing can be waiting for the slot
+		pass
+
+
+class ForecastService:
+	"""
+	Runs forecast methods off the event loop in a thread or process pool.
+
+	Concurrent identical requests are coalesced into a single computation, the number of
+	requests submitted to the pool at once is bounded by `max_pending` (additional callers wait
+	for a free slot), and cancelling a caller cancels the underlying job once no other caller is
+	waiting on it. A job that has already started keeps its slot until it finishes.
+
+	:param backend: "thread" or "process"; ignored if `executor` is given
+	:param max_workers: the number of pool workers; ignored if `executor` is given
+	:param max_pending: the maximum number of distinct requests submitted to the pool at once
+	:param executor: an existing executor to use instead of creating one. It is not shut down
+	by `shutdown`
+	:param cache: if given, results are served from and stored in this cache by the workers
+	"""
+
+	def __init__(
+		self,
+		backend: str = "thread",
+		max_workers: int | None = None,
+		max_pending: int = 64,
+		executor: Executor | None = None,
+		cache: ResultCache | None = None,
+	):
+		if backend not in ("thread", "process"):
+			raise ValueError("backend must be 'thread' or 'process'.")
+		if max_pending < 1:
+			raise ValueError("max_pending must be an integer > 0.")
+
+		self.backend = backend
+		self.max_workers = max_workers
+		self.max_pending = max_pending
+		self._executor = executor
+		self._owns_executor = executor is None
+		self.cache = cache
+		self._loop: asyncio.AbstractEventLoop | None = None
+		self._slots: asyncio.Semaphore | None = None
+		self._inflight: dict[tuple, asyncio.Future] = {}
+		self._waiters: dict[tuple, int] = {}
+
+	@property
+	def executor(self) -> Executor:
+		if self._executor is None:
+			pool = ThreadPoolExecutor if self.backend == "thread" else ProcessPoolExecutor
+			self._executor = pool(max_workers=self.max_workers)
+		return self._executor
+
+	def _bind_loop(self) -> None:
+		# Loop-bound primitives are recreated if the service is used from a new event loop
+		loop = asyncio.get_running_loop()
+		if loop is not self._loop:
+			self._loop = loop
+			self._slots = asyncio.Semaphore(self.max_pending)
+			self._inflight = {}
+			self._waiters = {}
+
+	async def run(
+		self, data: typing.Sequence[typing.Sequence[Decimal]], method: str, **kwargs
+	) -> list[Decimal]:
+		"""
+		Runs the forecast method named `method` on `data` in the pool and returns its result.
+
+		:param data: sequence of sequences of Decimal historical data in chronological order
+		:param method: the name of one of the forecast methods listed in `ForecastModel.methods`
+		:return: the forecasted values
+		"""
+		self._bind_loop()
+		key = request_key(data, method, kwargs)
+		future = self._inflight.get(key)
+		if future is None:
+			future = asyncio.ensure_future(self._submit(key, data, method, kwargs))
+			self._inflight[key] = future
+			future.add_done_callback(partial(self._forget, key))
+
+		self._waiters[key] = self._waiters.get(key, 0) + 1
+		try:
+			# Shield so one cancelled caller doesn't cancel the job for the others
+			return list(await asyncio.shield(future))
+		except asyncio.CancelledError:
+			if self._waiters[key] == 1:
+				# Identical requests arriving after this must start a new job, not join this one
+				self._forget(key, future)
+				future.cancel()
+			raise
+		finally:
+			self._waiters[key] -= 1
+			if not self._waiters[key]:
+				del self._waiters[key]
+
+	def _forget(self, key: tuple, future: asyncio.Future) -> None:
+		# A cancelled job may finish after an identical request has started a new one
+		if self._inflight.get(key) is future:
+			del self._inflight[key]
+
+	async def _submit(self, key: tuple, data, method: str, kwargs: dict) -> list[Decimal]:
+		assert self._slots is not None
+		slots = self._slots
+		await slots.acquire()
+		loop = asyncio.get_running_loop()
+		if self.cache is not None:
+			call = partial(self.cache.get_or_compute, data, method, **kwargs)
+		else:
+			call = partial(run_method, data, method, **kwargs)
+		try:
+			job = self.executor.submit(call)
+		except BaseException:
+			slots.release()
+			raise
+		# A job that is already running can't be cancelled, so its slot is only freed once the
+		# worker is done with it rather than when its callers stop waiting
+		job.add_done_callback(lambda _: _release_slot(loop, slots))
+		return await asyncio.wrap_future(job, loop=loop)
+
+	def shutdown(self, wait: bool = True) -> None:
+		"""Shuts down the executor if it was created by this service."""
+		if self._owns_executor and self._executor is not None:
+			self._executor.shutdown(wait=wait, cancel_futures=True)
+			self._executor = None
+
+	async def __aenter__(self) -> "ForecastService":
+		return self
+
+	async def __aexit__(self, *exc) -> None:
+		self.shutdown()
+
+
+_default_service: ForecastService | None = None
+
+
+def configure(
+	backend: str = "thread", max_workers: int | None = None, max_pending: int = 64
+) -> ForecastService:
+	"""
+	Replaces the module-level service used by `run` with one built from the given options.
+
+	:param backend: "thread" or "process"
+	:param max_workers: the number of pool workers
+	:param max_pending: the maximum number of distinct requests submitted to the pool at once
+	:return: the new default service
+	"""
+	global _default_service
+	if _default_service is not None:
+		_default_service.shutdown(wait=False)
+	_default_service = ForecastService(backend, max_workers, max_pending)
+	return _default_service
+
+
+async def run(
+	data: typing.Sequence[typing.Sequence[Decimal]], method: str, **kwargs
+) -> list[Decimal]:
+	"""
+	Runs the forecast method named `method` on `data` using the module-level service (a thread
+	pool by default, see `configure`) and returns its result.
+
+	:param data: sequence of sequences of Decimal historical data in chronological order
+	:param method: the name of one of the forecast methods listed in `ForecastModel.methods`
+	:return: the forecasted values
+	"""
+	global _default_service
+	if _default_service is None:
+		_default_service = ForecastService()
+	return await _default_service.run(data, method, **kwargs)
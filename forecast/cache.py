@@ -0,0 +1,181 @@
+# Copyright (c) 2024, AgriTheory and contributors
+# For license information, please see license.txt
+
+
+import decimal
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+from decimal import Decimal
+
+from .forecast import run_method
+
+
+def numeric_backend() -> str:
+	"""
+	Identifies the numeric backend used for the forecast calculations. Results depend on the
+	precision and rounding of the current Decimal context, so both are part of the identifier.
+	"""
+	context = decimal.getcontext()
+	return f"decimal:{context.prec}:{context.rounding}"
+
+
+def cache_key(
+	data: typing.Sequence[typing.Sequence[Decimal | None]], method: str, kwargs: dict
+) -> str:
+	"""
+	Returns a stable hash of a forecast request: the data contents, the method name and its
+	parameters, the library version and the numeric backend. Equal keys are safe to serve from
+	a cache across runs and processes.
+
+	:param data: sequence of sequences of Decimal historical data
+	:param method: the name of the forecast method
+	:param kwargs: the keyword arguments for the forecast method
+	:return: hex digest
+	"""
+	from . import __version__
+
+	payload = json.dumps(
+		[
+			[[None if v is None else str(v) for v in segment] for segment in data],
+			method,
+			kwargs,
+			__version__,
+			numeric_backend(),
+		],
+		sort_keys=True,
+		default=str,
+		separators=(",", ":"),
+	)
+	return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+	"""
+	Persistent forecast result cache backed by a local SQLite file. Entries are evicted least
+	recently used first once the cache holds more than `max_entries` results or more than
+	`max_bytes` of serialized results. A cache may be shared between threads, and pickling one
+	(e.g. to send it to a process pool worker) reopens the same file on the other side.
+
+	:param path: the SQLite database file; created if it doesn't exist
+	:param max_entries: the maximum number of cached results
+	:param max_bytes: the maximum total size of the serialized results. If None, only
+	`max_entries` is enforced
+	"""
+
+	def __init__(
+		self, path: str | os.PathLike, max_entries: int = 100_000, max_bytes: int | None = None
+	):
+		if max_entries < 1:
+			raise ValueError("max_entries must be an integer > 0.")
+		if max_bytes is not None and max_bytes < 1:
+			raise ValueError("max_bytes must be an integer > 0.")
+
+		self.path = os.fspath(path)
+		self.max_entries = max_entries
+		self.max_bytes = max_bytes
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+		self._last_access = 0
+		self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+		with self._connection:
+			self._connection.execute(
+				"CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+				"size INTEGER NOT NULL, accessed INTEGER NOT NULL)"
+			)
+			self._connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+	def __getstate__(self) -> dict:
+		return {"path": self.path, "max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+	def __setstate__(self, state: dict) -> None:
+		self.__init__(**state)  # type: ignore[misc]
+
+	def _tick(self) -> int:
+		# Strictly increasing access stamp, so entries touched in the same nanosecond stay ordered
+		self._last_access = max(time.time_ns(), self._last_access + 1)
+		return self._last_access
+
+	def __len__(self) -> int:
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+	def get(self, key: str) -> list[Decimal] | None:
+		"""
+		Returns the cached result for `key` and marks it as recently used, or None if there is no
+		cached result.
+		"""
+		with self._lock, self._connection:
+			row = self._connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+			if row is None:
+				self.misses += 1
+				return None
+			self.hits += 1
+			self._connection.execute(
+				"UPDATE results SET accessed = ? WHERE key = ?", (self._tick(), key)
+			)
+		return [Decimal(v) for v in json.loads(row[0])]
+
+	def set(self, key: str, result: typing.Sequence[Decimal]) -> None:
+		"""Stores `result` under `key`, then evicts least recently used entries over the limits."""
+		value = json.dumps([str(v) for v in result], separators=(",", ":"))
+		with self._lock, self._connection:
+			self._connection.execute(
+				"INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+				(key, value, len(value), self._tick()),
+			)
+			self._evict()
+
+	def _evict(self) -> None:
+		count, size = self._connection.execute(
+			"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+		).fetchone()
+		if count > self.max_entries:
+			self._connection.execute(
+				"DELETE FROM results WHERE key IN "
+				"(SELECT key FROM results ORDER BY accessed LIMIT ?)",
+				(count - self.max_entries,),
+			)
+		if self.max_bytes is not None and size > self.max_bytes:
+			rows = self._connection.execute(
+				"SELECT key, size FROM results ORDER BY accessed"
+			).fetchall()
+			excess, stale = size - self.max_bytes, []
+			for key, entry_size in rows:
+				if excess <= 0:
+					break
+				stale.append((key,))
+				excess -= entry_size
+			self._connection.executemany("DELETE FROM results WHERE key = ?", stale)
+
+	def get_or_compute(
+		self, data: typing.Sequence[typing.Sequence[Decimal | None]], method: str, **kwargs
+	) -> list[Decimal]:
+		"""
+		Returns the cached result for the forecast request if there is one, otherwise runs the
+		forecast method named `method` on `data` and caches its result.
+
+		:param data: sequence of sequences of Decimal historical data in chronological order
+		:param method: the name of one of the forecast methods listed in `ForecastModel.methods`
+		:return: the forecasted values
+		"""
+		key = cache_key(data, method, kwargs)
+		result = self.get(key)
+		if result is None:
+			result = run_method(data, method, **kwargs)
+			self.set(key, result)
+		return result
+
+	def clear(self) -> None:
+		"""Removes all cached results and resets the hit and miss counters."""
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM results")
+			self.hits = self.misses = 0
+
+	def close(self) -> None:
+		self._connection.close()
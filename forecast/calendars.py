@@ -0,0 +1,478 @@
+# Copyright (c) 2024, AgriTheory and contributors
+# For license information, please see license.txt
+
+
+import datetime
+import threading
+import typing
+from array import array
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from itertools import accumulate
+
+
+MONTH_ABBREVIATIONS = (
+	"Jan",
+	"Feb",
+	"Mar",
+	"Apr",
+	"May",
+	"Jun",
+	"Jul",
+	"Aug",
+	"Sep",
+	"Oct",
+	"Nov",
+	"Dec",
+)
+
+
+def weekday(ordinal: int) -> int:
+	"""Returns the weekday of a date ordinal, where Monday is 0 and Sunday is 6."""
+	# datetime.date.fromordinal(1) (0001-01-01) is a Monday
+	return (ordinal - 1) % 7
+
+
+def _iso_week_one_monday(year: int) -> int:
+	# ISO week 1 is the week containing January 4th
+	jan_4 = datetime.date(year, 1, 4).toordinal()
+	return jan_4 - weekday(jan_4)
+
+
+class IsoCalendar:
+	"""
+	Lookup table of ISO years that reduces ISO week arithmetic to integer operations on date
+	ordinals. For each ISO year in the range it stores the ordinal of the Monday of week 1 and
+	the number of weeks in the year (52 or 53). Dates outside of the range fall back to
+	`datetime.date.isocalendar` and `datetime.date.fromisocalendar`.
+
+	:param first_year: the first ISO year in the table
+	:param last_year: the last ISO year in the table
+	"""
+
+	def __init__(self, first_year: int = 1900, last_year: int = 2200):
+		if not (datetime.MINYEAR < first_year <= last_year < datetime.MAXYEAR):
+			raise ValueError("Please provide a valid ISO calendar year range.")
+
+		self.first_year = first_year
+		self.last_year = last_year
+		# One extra entry so the end of the last year is known
+		self.week_one = array("i", (_iso_week_one_monday(y) for y in range(first_year, last_year + 2)))
+		self.weeks = array("B", ((b - a) // 7 for a, b in zip(self.week_one, self.week_one[1:])))
+
+	def _year_index(self, ordinal: int) -> int:
+		"""Returns the table index of the ISO year containing `ordinal`, or -1 if out of range."""
+		if not (self.week_one[0] <= ordinal < self.week_one[-1]):
+			return -1
+		# Estimate from the mean ISO year length (146097 days per 400 years), then correct
+		i = min((ordinal - self.week_one[0]) * 400 // 146097, len(self.weeks) - 1)
+		while ordinal < self.week_one[i]:
+			i -= 1
+		while ordinal >= self.week_one[i + 1]:
+			i += 1
+		return i
+
+	def week_and_year(self, ordinal: int) -> tuple[int, int]:
+		"""
+		Given a date ordinal, returns the ISO week and ISO year.
+
+		:param ordinal: proleptic Gregorian ordinal, as returned by `datetime.date.toordinal`
+		:return: (ISO week, ISO year) for given ordinal
+		"""
+		i = self._year_index(ordinal)
+		if i < 0:
+			iso_year, iso_week, _ = datetime.date.fromordinal(ordinal).isocalendar()
+			return iso_week, iso_year
+		return (ordinal - self.week_one[i]) // 7 + 1, self.first_year + i
+
+	def monday(self, year: int, week: int) -> int:
+		"""
+		Returns the ordinal of the Monday of the given ISO week. Raises ValueError if the ISO year
+		doesn't have that week.
+		"""
+		if not (self.first_year <= year <= self.last_year):
+			return datetime.date.fromisocalendar(year, week, 1).toordinal()
+		if not (1 <= week <= self.weeks[year - self.first_year]):
+			raise ValueError(f"Invalid week: {week}")
+		return self.week_one[year - self.first_year] + (week - 1) * 7
+
+	def week_count(self, year: int) -> int:
+		"""Returns the number of ISO weeks (52 or 53) in the given ISO year."""
+		if not (self.first_year <= year <= self.last_year):
+			return datetime.date(year, 12, 28).isocalendar().week
+		return self.weeks[year - self.first_year]
+
+
+_iso_calendar: IsoCalendar | None = None
+_iso_calendar_lock = threading.Lock()
+
+
+def get_iso_calendar() -> IsoCalendar:
+	"""Returns the shared ISO calendar table, building it with the default range on first use."""
+	global _iso_calendar
+	if _iso_calendar is None:
+		with _iso_calendar_lock:
+			if _iso_calendar is None:
+				_iso_calendar = IsoCalendar()
+	return _iso_calendar
+
+
+def configure_iso_calendar(first_year: int, last_year: int) -> IsoCalendar:
+	"""
+	Replaces the shared ISO calendar table with one covering `first_year` to `last_year`.
+
+	:param first_year: the first ISO year in the table
+	:param last_year: the last ISO year in the table
+	:return: the new shared table
+	"""
+	global _iso_calendar
+	_iso_calendar = IsoCalendar(first_year, last_year)
+	return _iso_calendar
+
+
+def _fiscal_year_end(year: int, end_month: int, end_weekday: int, method: str) -> int:
+	# Fiscal year `year` ends on `end_weekday` nearest (or last on or before) the last day of
+	# `end_month`, in the following calendar year unless the year ends in December
+	calendar_year = year if end_month == 12 else year + 1
+	if end_month == 12:
+		last_day = datetime.date(calendar_year, 12, 31).toordinal()
+	else:
+		last_day = datetime.date(calendar_year, end_month + 1, 1).toordinal() - 1
+	if method == "nearest":
+		delta = (end_weekday - weekday(last_day)) % 7
+		return last_day + (delta - 7 if delta > 3 else delta)
+	return last_day - (weekday(last_day) - end_weekday) % 7
+
+
+class RetailCalendar:
+	"""
+	Lookup table of 52-53 week retail fiscal years, such as the NRF 4-5-4 calendar, whose years
+	end on the same weekday nearest the end of a month. For each fiscal year in the range it
+	stores the ordinal of the first day and the number of weeks, so finding the fiscal year,
+	period and week of a date is a few integer operations. Dates outside of the range are
+	computed directly, without the table.
+
+	A fiscal year is named by the calendar year it mostly falls in: with the default January
+	year end, fiscal 2023 runs from 2023-01-29 to 2024-02-03. Each quarter is 13 weeks split
+	into 3 periods by `pattern`, and the extra week of a 53-week year is added to the last
+	period.
+
+	:param end_month: the month (1-12) in which fiscal years end
+	:param end_weekday: the weekday fiscal years end on, where Monday is 0 and Sunday is 6
+	:param method: "nearest" to end on the weekday nearest the last day of `end_month`, or
+	"last" to end on the last such weekday of `end_month`
+	:param pattern: the number of weeks in each of the 3 periods of a quarter
+	:param first_year: the first fiscal year in the table
+	:param last_year: the last fiscal year in the table
+	"""
+
+	def __init__(
+		self,
+		end_month: int = 1,
+		end_weekday: int = 5,
+		method: str = "nearest",
+		pattern: typing.Sequence[int] = (4, 5, 4),
+		first_year: int = 1900,
+		last_year: int = 2200,
+	):
+		if not 1 <= end_month <= 12 or not 0 <= end_weekday <= 6:
+			raise ValueError("Please provide a valid end month (1-12) and end weekday (0-6).")
+		if method not in ("nearest", "last"):
+			raise ValueError("method must be 'nearest' or 'last'.")
+		if len(pattern) != 3 or sum(pattern) != 13 or min(pattern) < 1:
+			raise ValueError("pattern must be 3 period lengths adding up to a 13 week quarter.")
+		if not (datetime.MINYEAR < first_year <= last_year < datetime.MAXYEAR - 1):
+			raise ValueError("Please provide a valid fiscal year range.")
+
+		self.end_month = end_month
+		self.end_weekday = end_weekday
+		self.method = method
+		self.pattern = tuple(pattern)
+		self.first_year = first_year
+		self.last_year = last_year
+		# Week offsets at which each of the 12 periods starts
+		self.period_weeks = tuple(accumulate(self.pattern * 4, initial=0))[:-1]
+		# One extra entry so the end of the last year is known
+		self.year_start = array(
+			"i", (self._year_end(y - 1) + 1 for y in range(first_year, last_year + 2))
+		)
+		self.weeks = array("B", ((b - a) // 7 for a, b in zip(self.year_start, self.year_start[1:])))
+
+	def _year_end(self, year: int) -> int:
+		return _fiscal_year_end(year, self.end_month, self.end_weekday, self.method)
+
+	def _year_index(self, ordinal: int) -> int:
+		"""Returns the table index of the fiscal year containing `ordinal`, or -1 if out of range."""
+		if not (self.year_start[0] <= ordinal < self.year_start[-1]):
+			return -1
+		# Estimate from the mean year length (146097 days per 400 years), then correct
+		i = min((ordinal - self.year_start[0]) * 400 // 146097, len(self.weeks) - 1)
+		while ordinal < self.year_start[i]:
+			i -= 1
+		while ordinal >= self.year_start[i + 1]:
+			i += 1
+		return i
+
+	def start(self, year: int) -> int:
+		"""Returns the ordinal of the first day of the given fiscal year."""
+		if not (self.first_year <= year <= self.last_year + 1):
+			return self._year_end(year - 1) + 1
+		return self.year_start[year - self.first_year]
+
+	def week_count(self, year: int) -> int:
+		"""Returns the number of weeks (52 or 53) in the given fiscal year."""
+		if not (self.first_year <= year <= self.last_year):
+			return (self._year_end(year) - self._year_end(year - 1)) // 7
+		return self.weeks[year - self.first_year]
+
+	def year_and_week(self, ordinal: int) -> tuple[int, int]:
+		"""
+		Given a date ordinal, returns the fiscal year and the 0-based week of the fiscal year.
+
+		:param ordinal: proleptic Gregorian ordinal, as returned by `datetime.date.toordinal`
+		:return: (fiscal year, week index) for given ordinal
+		"""
+		i = self._year_index(ordinal)
+		if i >= 0:
+			return self.first_year + i, (ordinal - self.year_start[i]) // 7
+
+		year = datetime.date.fromordinal(ordinal).year - (self.end_month != 12)
+		while ordinal < self.start(year):
+			year -= 1
+		while ordinal >= self.start(year + 1):
+			year += 1
+		return year, (ordinal - self.start(year)) // 7
+
+	def period(self, ordinal: int) -> tuple[int, int, int]:
+		"""
+		Given a date ordinal, returns the fiscal year, the 1-based period (1-12) and the 1-based
+		week of the fiscal year.
+		"""
+		year, week = self.year_and_week(ordinal)
+		return year, bisect_right(self.period_weeks, week), week + 1
+
+	def period_start(self, year: int, period: int) -> int:
+		"""Returns the ordinal of the first day of the given 1-based period of a fiscal year."""
+		if not 1 <= period <= 12:
+			raise ValueError(f"Invalid period: {period}")
+		return self.start(year) + self.period_weeks[period - 1] * 7
+
+
+_retail_calendar: RetailCalendar | None = None
+_retail_calendar_lock = threading.Lock()
+
+
+def get_retail_calendar() -> RetailCalendar:
+	"""
+	Returns the shared retail calendar used by the "Retail" periodicities, building the NRF
+	4-5-4 calendar on first use.
+	"""
+	global _retail_calendar
+	if _retail_calendar is None:
+		with _retail_calendar_lock:
+			if _retail_calendar is None:
+				_retail_calendar = RetailCalendar()
+	return _retail_calendar
+
+
+def configure_retail_calendar(**kwargs) -> RetailCalendar:
+	"""
+	Replaces the shared retail calendar with one built from the given `RetailCalendar`
+	arguments, and clears the cached bins and labels built from the previous one.
+
+	:return: the new shared calendar
+	"""
+	from .date_binning import Period
+
+	global _retail_calendar
+	_retail_calendar = RetailCalendar(**kwargs)
+	Period.cache_clear()
+	return _retail_calendar
+
+
+class BusinessCalendar:
+	"""
+	Precomputed working day calendar: a bitmap of the business days in a range of years (every
+	day except the `weekends` weekdays and `holidays`) and the running count of business days,
+	so the number of business days in any span of days is found in O(1). Outside of the range
+	only weekends are excluded.
+
+	It can be used as a `DailyProfile` (it has the same `cumulative` and `total` methods) to
+	redistribute data over business days only, and backs the "Business Days" periodicity.
+
+	:param weekends: the weekdays that aren't business days, where Monday is 0 and Sunday is 6
+	:param holidays: the dates within the range that aren't business days
+	:param first_year: the first year in the table
+	:param last_year: the last year in the table
+	"""
+
+	def __init__(
+		self,
+		weekends: typing.Iterable[int] = (5, 6),
+		holidays: typing.Iterable[datetime.date] = (),
+		first_year: int = 1900,
+		last_year: int = 2200,
+	):
+		weekends = frozenset(weekends)
+		if not weekends <= set(range(7)) or len(weekends) == 7:
+			raise ValueError("weekends must be weekdays from 0 (Monday) to 6, and not all 7.")
+		if not (datetime.MINYEAR <= first_year <= last_year < datetime.MAXYEAR):
+			raise ValueError("Please provide a valid calendar year range.")
+
+		self.weekends = weekends
+		self.first_year = first_year
+		self.last_year = last_year
+		self.origin = datetime.date(first_year, 1, 1).toordinal()
+		self.end = datetime.date(last_year + 1, 1, 1).toordinal()
+		# Business days per weekday from Monday, and the running count through a week
+		week = [int(d not in weekends) for d in range(7)]
+		self.week_prefix = tuple(accumulate(week, initial=0))
+
+		offset = weekday(self.origin)
+		weeks = (self.end - self.origin) // 7 + 1
+		self.days = bytearray((week[offset:] + week[:offset]) * weeks)
+		del self.days[self.end - self.origin :]
+		holiday_ordinals = frozenset(d.toordinal() for d in holidays)
+		for ordinal in holiday_ordinals:
+			if not (self.origin <= ordinal < self.end):
+				raise ValueError("Holidays must fall within the business calendar's years.")
+			self.days[ordinal - self.origin] = 0
+		self.holidays = holiday_ordinals
+		self.prefix = array("i", accumulate(self.days, initial=0))
+
+	def _weekdays_before(self, ordinal: int) -> int:
+		# Business days from ordinal 1 up to, but not including, `ordinal`, ignoring holidays
+		weeks, day = divmod(ordinal - 1, 7)
+		return weeks * self.week_prefix[7] + self.week_prefix[day]
+
+	def is_business_day(self, date: datetime.date | int) -> bool:
+		"""Returns whether `date` (a datetime.date object or date ordinal) is a business day."""
+		ordinal = date if isinstance(date, int) else date.toordinal()
+		if self.origin <= ordinal < self.end:
+			return bool(self.days[ordinal - self.origin])
+		return weekday(ordinal) not in self.weekends
+
+	def cumulative(self, ordinal: int) -> int:
+		"""
+		Returns the number of business days from the start of the calendar up to, but not
+		including, the date with the given ordinal (negative before the start).
+		"""
+		if ordinal < self.origin:
+			return self._weekdays_before(ordinal) - self._weekdays_before(self.origin)
+		if ordinal > self.end:
+			after_end = self._weekdays_before(ordinal) - self._weekdays_before(self.end)
+			return self.prefix[-1] + after_end
+		return self.prefix[ordinal - self.origin]
+
+	def total(self, start: int, end: int) -> int:
+		"""Returns the number of business days from ordinal `start` to ordinal `end`, inclusive."""
+		return self.cumulative(end + 1) - self.cumulative(start)
+
+	def count(self, start_date: datetime.date, end_date: datetime.date) -> int:
+		"""Returns the number of business days from `start_date` to `end_date`, inclusive."""
+		return self.total(start_date.toordinal(), end_date.toordinal())
+
+	def nth_business_day(self, ordinal: int, n: int) -> int:
+		"""
+		Returns the ordinal of the `n`th (from 1) business day on or after the date with the given
+		ordinal, with a binary search over the business day counts.
+		"""
+		target = self.cumulative(ordinal) + n
+		# n weeks are enough unless holidays take up whole weeks
+		hi = ordinal + 7 * n
+		while self.cumulative(hi) < target:
+			hi += 7 * n
+		return ordinal + bisect_left(range(ordinal, hi + 1), target, key=self.cumulative) - 1
+
+
+_business_calendar: BusinessCalendar | None = None
+_business_calendar_lock = threading.Lock()
+
+
+def get_business_calendar() -> BusinessCalendar:
+	"""
+	Returns the shared business calendar used by the "Business Days" periodicity, building a
+	Monday to Friday calendar without holidays on first use.
+	"""
+	global _business_calendar
+	if _business_calendar is None:
+		with _business_calendar_lock:
+			if _business_calendar is None:
+				_business_calendar = BusinessCalendar()
+	return _business_calendar
+
+
+def configure_business_calendar(**kwargs) -> BusinessCalendar:
+	"""
+	Replaces the shared business calendar with one built from the given `BusinessCalendar`
+	arguments, and clears the cached bins and labels built from the previous one.
+
+	:return: the new shared calendar
+	"""
+	from .date_binning import Period
+
+	global _business_calendar
+	_business_calendar = BusinessCalendar(**kwargs)
+	Period.cache_clear()
+	return _business_calendar
+
+
+class DailyProfile:
+	"""
+	Relative weights of the days in a date range, used to redistribute data non-uniformly over
+	the days in a bin. The weights are precomputed into cumulative sums, so the total weight of
+	any span of days is found in O(1).
+
+	Weights may be given as:
+	- a sequence of 7 weights for Monday through Sunday (no `start_date`), repeated indefinitely
+	- a sequence of one weight per day starting on `start_date`
+	- a callable taking a datetime.date and returning its weight, evaluated once per day from
+	`start_date` to `end_date`
+
+	:param weights: the weekday pattern, per-date weights or callable
+	:param start_date: the date of the first per-date weight, or the first date to evaluate the
+	callable for
+	:param end_date: the last date to evaluate the callable for
+	"""
+
+	def __init__(
+		self,
+		weights: typing.Sequence | typing.Callable[[datetime.date], typing.Any],
+		start_date: datetime.date | None = None,
+		end_date: datetime.date | None = None,
+	):
+		if callable(weights):
+			if start_date is None or end_date is None or end_date < start_date:
+				raise ValueError("A callable profile requires a valid start date and end date.")
+			weights = [
+				weights(datetime.date.fromordinal(o))
+				for o in range(start_date.toordinal(), end_date.toordinal() + 1)
+			]
+		elif start_date is None and len(weights) != 7:
+			raise ValueError("A weekday profile requires exactly 7 weights, Monday through Sunday.")
+
+		values = [Decimal(w) for w in weights]
+		if any(w < 0 for w in values):
+			raise ValueError("Profile weights must not be negative.")
+
+		self.weekly = start_date is None
+		self.origin = 1 if self.weekly else start_date.toordinal()  # type: ignore[union-attr]
+		self.prefix = list(accumulate(values, initial=Decimal("0")))
+
+	def cumulative(self, ordinal: int) -> Decimal:
+		"""
+		Returns the total weight of the days from the start of the profile up to, but not
+		including, the date with the given ordinal.
+		"""
+		offset = ordinal - self.origin
+		if self.weekly:
+			# ordinal 1 (0001-01-01) is a Monday
+			weeks, day = divmod(offset, 7)
+			return self.prefix[7] * weeks + self.prefix[day]
+		if not (0 <= offset < len(self.prefix)):
+			raise ValueError("Date falls outside of the daily profile's range.")
+		return self.prefix[offset]
+
+	def total(self, start: int, end: int) -> Decimal:
+		"""Returns the total weight of the days from ordinal `start` to ordinal `end`, inclusive."""
+		return self.cumulative(end + 1) - self.cumulative(start)
@@ -0,0 +1,202 @@
+# Copyright (c) 2024, AgriTheory and contributors
+# For license information, please see license.txt
+
+
+import argparse
+import json
+import sys
+import time
+import typing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from itertools import islice
+
+from .cache import ResultCache
+from .forecast import run_method, select_method
+
+
+# Forecast method parameters that take Decimal values or sequences of them
+_DECIMAL_PARAMS = frozenset({"percent", "alpha", "beta", "weights", "seasonality"})
+
+
+def _parse_data(data: typing.Sequence[typing.Sequence]) -> list[list[Decimal]]:
+	# Strings and ints are accepted as well as JSON floats (which are parsed as Decimal). Nulls
+	# are zero, as in `ForecastModel`
+	return [[Decimal(0) if v is None else Decimal(v) for v in segment] for segment in data]
+
+
+def _to_decimal(value: typing.Any) -> typing.Any:
+	# JSON integers are parsed as int; bools are ints too, but never valid Decimal values
+	return Decimal(value) if isinstance(value, int) and not isinstance(value, bool) else value
+
+
+def _parse_params(params: dict) -> dict:
+	# Integer values given for Decimal parameters (e.g. {"alpha": 1}) are converted to Decimal,
+	# while count-like parameters such as "periods" stay int
+	return {
+		key: (
+			([_to_decimal(v) for v in value] if isinstance(value, list) else _to_decimal(value))
+			if key in _DECIMAL_PARAMS
+			else value
+		)
+		for key, value in params.items()
+	}
+
+
+def process_line(
+	line: str, method: str = "auto", params: dict | None = None, cache: ResultCache | None = None
+) -> str:
+	"""
+	Runs a forecast for one JSON Lines record and returns the JSON result record.
+
+	Input records are objects with a "data" key (a list of lists of numbers in chronological
+	order) and optional "id", "method" and "params" keys which override the command-line
+	defaults. The result record echoes "id" and contains the "method" and "params" used and the
+	"forecast" values as strings, or an "error" message if the forecast failed.
+
+	:param line: one line of JSON input
+	:param method: the default forecast method name, or "auto" to choose one by backtesting
+	:param params: the default keyword arguments for the forecast method
+	:param cache: if given, results are served from and stored in this cache
+	:return: one line of JSON output, without the trailing newline
+	"""
+	record: dict = {}
+	try:
+		record = json.loads(line, parse_float=Decimal)
+		data = _parse_data(record["data"])
+		_method = record.get("method", method)
+		_params = _parse_params({**(params or {}), **record.get("params", {})})
+		if _method == "auto":
+			_method, _params = select_method(data)
+		if cache is not None:
+			result = cache.get_or_compute(data, _method, **_params)
+		else:
+			result = run_method(data, _method, **_params)
+		output = {
+			"id": record.get("id"),
+			"method": _method,
+			"params": _params,
+			"forecast": [str(v) for v in result],
+		}
+	except Exception as e:
+		output = {"id": record.get("id") if isinstance(record, dict) else None, "error": str(e)}
+	return json.dumps(output, default=str)
+
+
+def process_chunk(
+	lines: list[str],
+	method: str = "auto",
+	params: dict | None = None,
+	cache: ResultCache | None = None,
+) -> list[str]:
+	"""Runs `process_line` over a chunk of input lines."""
+	return [process_line(line, method, params, cache) for line in lines]
+
+
+def _chunks(lines: typing.Iterable[str], size: int) -> typing.Iterator[list[str]]:
+	lines = (line for line in lines if line.strip())
+	while chunk := list(islice(lines, size)):
+		yield chunk
+
+
+def run_batch(
+	lines: typing.Iterable[str],
+	method: str = "auto",
+	params: dict | None = None,
+	workers: int = 1,
+	chunk_size: int = 100,
+	backend: str = "serial",
+	cache: ResultCache | None = None,
+) -> typing.Iterator[str]:
+	"""
+	Lazily processes JSON Lines input and yields output lines in input order. At most `workers`
+	chunks of `chunk_size` lines are held in memory at once, regardless of the input length.
+
+	:param lines: iterable of JSON input lines
+	:param method: the default forecast method name, or "auto" to choose one by backtesting
+	:param params: the default keyword arguments for the forecast method
+	:param workers: the number of pool workers; ignored for the "serial" backend
+	:param chunk_size: the number of lines submitted to a worker at a time
+	:param backend: "serial", "thread" or "process"
+	:param cache: if given, results are served from and stored in this cache
+	:return: iterator of JSON output lines
+	"""
+	if backend == "serial":
+		for chunk in _chunks(lines, chunk_size):
+			yield from process_chunk(chunk, method, params, cache)
+		return
+
+	pool: typing.Callable[..., Executor] = (
+		ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+	)
+	with pool(max_workers=workers) as executor:
+		pending: deque[Future] = deque()
+		for chunk in _chunks(lines, chunk_size):
+			pending.append(executor.submit(process_chunk, chunk, method, params, cache))
+			if len(pending) >= workers:
+				yield from pending.popleft().result()
+		while pending:
+			yield from pending.popleft().result()
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(
+		prog="forecast", description="Run forecasts over series streamed as JSON Lines."
+	)
+	parser.add_argument(
+		"input",
+		nargs="?",
+		type=argparse.FileType("r"),
+		default=sys.stdin,
+		help="JSON Lines input file (default: stdin)",
+	)
+	parser.add_argument(
+		"-o",
+		"--output",
+		type=argparse.FileType("w"),
+		default=sys.stdout,
+		help="JSON Lines output file (default: stdout)",
+	)
+	parser.add_argument(
+		"-m",
+		"--method",
+		default="auto",
+		help='forecast method name, or "auto" to choose one per series (default: auto)',
+	)
+	parser.add_argument(
+		"-p", "--params", default="{}", help="JSON object of keyword arguments for the method"
+	)
+	parser.add_argument("--workers", type=int, default=1, help="number of pool workers")
+	parser.add_argument("--chunk-size", type=int, default=100, help="series per worker task")
+	parser.add_argument(
+		"--backend", choices=["serial", "thread", "process"], default="serial", help="execution backend"
+	)
+	parser.add_argument("--cache", help="SQLite file used to cache results between runs")
+	parser.add_argument(
+		"--cache-max-entries", type=int, default=100_000, help="maximum number of cached results"
+	)
+	args = parser.parse_args(argv)
+
+	if args.workers < 1 or args.chunk_size < 1:
+		parser.error("--workers and --chunk-size must be integers > 0")
+
+	params = json.loads(args.params, parse_float=Decimal)
+	cache = ResultCache(args.cache, args.cache_max_entries) if args.cache else None
+	count = 0
+	start = time.perf_counter()
+	for line in run_batch(
+		args.input, args.method, params, args.workers, args.chunk_size, args.backend, cache
+	):
+		args.output.write(line + "\n")
+		count += 1
+	args.output.flush()
+	elapsed = time.perf_counter() - start
+
+	rate = count / elapsed if elapsed else 0.0
+	print(f"Processed {count} series in {elapsed:.2f}s ({rate:.1f} series/s)", file=sys.stderr)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -3,187 +3,603 @@
 
 
 import datetime
+import functools
+import threading
+import typing
+from array import array
+from bisect import bisect_right
 from collections import OrderedDict
 from decimal import Decimal
-from itertools import accumulate, cycle, pairwise
+from itertools import chain, islice, pairwise, repeat, takewhile
+from types import MappingProxyType
 
-from dateutil.relativedelta import relativedelta
+from .calendars import MONTH_ABBREVIATIONS, BusinessCalendar, DailyProfile, get_iso_calendar
+from .periodicities import INTRADAY_PERIODICITIES, PERIODICITIES, get_periodicity
 
 
-class Period:
-	def __init__(self, start_date=None, end_date=None, periodicity="ISO Week"):
-		self.start_date = start_date
-		self.end_date = end_date
-		self.periodicity = periodicity
+class LRUCache:
+	"""
+	Thread-safe mapping of bounded size that evicts the least recently used entry when full.
+	Tracks hit and miss counts for `info`. Values should be immutable, since the same object is
+	returned to every caller.
 
-		self.date_math_patterns = {
-			# ISO pattern: [ISO week number period break points]
-			"ISO Week": list(range(1, 54)),
-			"ISO Biweekly": list(range(1, 54, 2)),
-			"ISO Month (4 Weeks)": [1, 5, 9, 13, 17, 21, 25, 29, 33, 37, 41, 45, 49],
-			"ISO Month (4 + 5 + 4)": [1, 5, 10, 14, 18, 23, 27, 31, 36, 40, 44, 49],
-			"ISO Month (4 + 4 + 5)": [1, 5, 9, 14, 18, 22, 27, 31, 35, 40, 44, 48],
-			"ISO Quarter (13 Weeks)": [1, 14, 27, 40],
-			"ISO Semiannual (26 Weeks)": [1, 27],
-			"ISO Annual": [1],
-			# Calendar pattern: (date part to increment, step to increment by)
-			# "Custom Days" and "Fiscal Weeks" updated in get_date_bins as needed
-			"Custom Days": ("days", 1),
-			"Weekly": ("weeks", 1),
-			"Biweekly": ("weeks", 2),
-			"Fiscal Weeks": ("weeks", 1),
-			"Calendar Month": ("months", 1),
-			"Monthly": ("months", 1),
-			"Calendar Quarter": ("months", 3),
-			"Quarterly": ("months", 3),
-			"Calendar Year": ("years", 1),
-			"Annually": ("years", 1),
-		}
-
-	def _get_iso_week_pattern(self, start_date: datetime.date, periodicity: str) -> list[int]:
-		iso_week = start_date.isocalendar().week
-		pattern = self.date_math_patterns[periodicity]
-
-		# Split pattern based on where start_date falls so cycle starts with the next period
-		index = 0
-		for i, n in enumerate(pattern):
-			if iso_week < n:
-				index = i
-				break
-		return pattern[index:] + pattern[:index]
+	:param maxsize: the maximum number of entries
+	"""
+
+	def __init__(self, maxsize: int = 1024):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._data: OrderedDict = OrderedDict()
+		self._lock = threading.Lock()
 
-	def _get_iso_start_dates(
-		self, start_date: datetime.date, end_date: datetime.date, periodicity: str
-	) -> list[datetime.date]:
+	def get(self, key, default=None):
+		with self._lock:
+			try:
+				value = self._data[key]
+			except KeyError:
+				self.misses += 1
+				return default
+			self._data.move_to_end(key)
+			self.hits += 1
+			return value
+
+	def set(self, key, value) -> None:
+		with self._lock:
+			self._data[key] = value
+			self._data.move_to_end(key)
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last=False)
+
+	def info(self) -> dict[str, int]:
+		with self._lock:
+			return {
+				"hits": self.hits,
+				"misses": self.misses,
+				"size": len(self._data),
+				"maxsize": self.maxsize,
+			}
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+			self.hits = self.misses = 0
+
+
+ONE_DAY = datetime.timedelta(days=1)
+
+# Ordinal of the numpy datetime64 epoch (1970-01-01)
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+SECONDS_PER_DAY = 86400
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(value: datetime.datetime | datetime.date | int) -> int:
+	"""
+	Returns the number of seconds from 1970-01-01 00:00 to `value`, dropping fractions of a
+	second. Naive datetimes are taken as wall clock time and aware datetimes are converted to UTC.
+	Dates are taken as midnight and integers are returned unchanged.
+	"""
+	if isinstance(value, int):
+		return value
+	if isinstance(value, datetime.datetime):
+		if value.tzinfo is not None:
+			value = value.astimezone(datetime.timezone.utc)
+		return (
+			(value.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+			+ value.hour * 3600
+			+ value.minute * 60
+			+ value.second
+		)
+	return (value.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+def interval_overlaps(
+	a_starts: typing.Sequence[int],
+	a_ends: typing.Sequence[int],
+	b_starts: typing.Sequence[int],
+	b_ends: typing.Sequence[int],
+) -> typing.Iterator[tuple[int, int, int]]:
+	"""
+	Merges two sorted lists of non-overlapping, inclusive integer intervals and yields each pair
+	that overlaps, in O(len(a) + len(b)) time.
+
+	:param a_starts: the interval starts of the first list, in ascending order
+	:param a_ends: the (inclusive) interval ends of the first list
+	:param b_starts: the interval starts of the second list, in ascending order
+	:param b_ends: the (inclusive) interval ends of the second list
+	:return: iterator of (index in a, index in b, overlap length)
+	"""
+	i = j = 0
+	while i < len(a_starts) and j < len(b_starts):
+		overlap = min(a_ends[i], b_ends[j]) - max(a_starts[i], b_starts[j]) + 1
+		if overlap > 0:
+			yield i, j, overlap
+		if a_ends[i] < b_ends[j]:
+			i += 1
+		else:
+			j += 1
+
+
+class DateBins:
+	"""
+	Compact, read-only sequence of date bins that stores the start and (inclusive) end date
+	ordinals of each bin in integer arrays instead of a tuple of two datetime.date objects per
+	bin. It behaves like the list of `(start date, end date)` tuples returned by
+	`Period.get_date_bins`: indexing and iteration yield those tuples, slicing returns a
+	`DateBins`, and it compares equal to a list of the same tuples.
+
+	:param starts: the start date ordinals of the bins, in ascending order. Copied
+	:param ends: the inclusive end date ordinals of the bins. Copied
+	"""
+
+	__slots__ = ("starts", "ends")
+
+	def __init__(self, starts: typing.Iterable[int] = (), ends: typing.Iterable[int] = ()):
+		self.starts = array("i", starts)
+		self.ends = array("i", ends)
+		if len(self.starts) != len(self.ends):
+			raise ValueError("Bin starts and ends must have the same length.")
+
+	@classmethod
+	def from_bins(
+		cls, bins: "typing.Iterable[tuple[datetime.date, datetime.date]] | DateBins"
+	) -> "DateBins":
+		"""Builds a `DateBins` from a sequence of `(start date, end date)` tuples."""
+		if isinstance(bins, DateBins):
+			return bins
+		starts, ends = array("i"), array("i")
+		for start, end in bins:
+			starts.append(start.toordinal())
+			ends.append(end.toordinal())
+		return cls(starts, ends)
+
+	@classmethod
+	def from_boundaries(cls, boundaries: typing.Sequence[int]) -> "DateBins":
 		"""
-		Returns a list of datetime.date objects representing the starting date of all ISO periods
-		falling within the time span defined by `start_date` to `end_date`. If `start_date` is not
-		a Monday (the starting weekday for an ISO week), then the first dates in the returned
-		sequence will reflect a partial ("stub") week (`start_date` to Sunday). Likewise if
-		`end_date` is not a Sunday. All other dates will reflect full periods.
+		Builds end-to-end bins from a sequence of bin start ordinals followed by the (exclusive)
+		end ordinal of the last bin.
+		"""
+		return cls(array("i", boundaries[:-1]), array("i", (b - 1 for b in boundaries[1:])))
 
-		:param start_date: the date from which to start binning
-		:param end_date: the date to which to end binning
-		:param periodicity: determines the binning periods within the time span from `start_date`
-		to `end_date`
-		:return: list bin start dates
+	def __len__(self) -> int:
+		return len(self.starts)
+
+	@typing.overload
+	def __getitem__(self, index: int) -> tuple[datetime.date, datetime.date]:
+		...
+
+	@typing.overload
+	def __getitem__(self, index: slice) -> "DateBins":
+		...
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return DateBins(self.starts[index], self.ends[index])
+		return (
+			datetime.date.fromordinal(self.starts[index]),
+			datetime.date.fromordinal(self.ends[index]),
+		)
+
+	def __iter__(self) -> typing.Iterator[tuple[datetime.date, datetime.date]]:
+		fromordinal = datetime.date.fromordinal
+		for start, end in zip(self.starts, self.ends):
+			yield fromordinal(start), fromordinal(end)
+
+	def __eq__(self, other) -> bool:
+		if isinstance(other, DateBins):
+			return self.starts == other.starts and self.ends == other.ends
+		if isinstance(other, (list, tuple)):
+			return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+		return NotImplemented
+
+	def __repr__(self) -> str:
+		if not self:
+			return "DateBins([])"
+		return f"DateBins({len(self)} bins, {self[0][0]} to {self[-1][1]})"
+
+	def key(self) -> tuple[bytes, bytes]:
+		"""Returns a hashable value identifying these bins, for use in cache keys."""
+		return self.starts.tobytes(), self.ends.tobytes()
+
+	def bin_index(self, date: datetime.date | int) -> int:
 		"""
-		r = []
-		pattern = self._get_iso_week_pattern(start_date, periodicity)
-		seq = cycle(pattern)
-		iso_year = start_date.isocalendar().year
+		Returns the index of the bin that `date` falls in, or -1 if no bin covers it, with a
+		binary search over the bin starts.
 
-		while start_date < end_date:
-			r.append(start_date)
-			week = next(seq)
+		:param date: a datetime.date object or date ordinal
+		"""
+		ordinal = date if isinstance(date, int) else date.toordinal()
+		i = bisect_right(self.starts, ordinal) - 1
+		return i if i >= 0 and ordinal <= self.ends[i] else -1
 
-			# Advance year if pattern wraps
-			if start_date.isocalendar().week > week or periodicity == "ISO Annual":
-				iso_year += 1
+	def as_numpy(self):
+		"""
+		Returns read-only NumPy views of the start and end date ordinals, without copying. Add
+		`EPOCH_ORDINAL` and cast to `datetime64[D]` to get NumPy dates.
 
-			try:
-				start_date = datetime.date.fromisocalendar(iso_year, week, 1)
-			except ValueError:
-				# No W53 in current year (weekly calcs only) - advance pattern and increment year
-				week = next(seq)
-				iso_year += 1
-				start_date = datetime.date.fromisocalendar(iso_year, week, 1)
+		:return: tuple of (starts, ends) int32 arrays
+		"""
+		import numpy as np
+
+		starts = np.frombuffer(self.starts, dtype=np.int32)
+		ends = np.frombuffer(self.ends, dtype=np.int32)
+		starts.flags.writeable = ends.flags.writeable = False
+		return starts, ends
+
+
+class IntradayBins:
+	"""
+	Compact, read-only sequence of sub-daily bins that stores the start and (inclusive) end of
+	each bin as seconds since 1970-01-01 00:00 (see `to_epoch_seconds`) in 64-bit integer arrays.
+	Indexing and iteration yield `(start datetime, end datetime)` tuples, where the end is the
+	last second of the bin, and slicing returns an `IntradayBins`. Built by
+	`Period.get_intraday_bins`.
+
+	:param starts: the start seconds of the bins, in ascending order
+	:param ends: the inclusive end seconds of the bins
+	"""
+
+	__slots__ = ("starts", "ends")
+
+	def __init__(self, starts: typing.Iterable[int] = (), ends: typing.Iterable[int] = ()):
+		self.starts = starts if isinstance(starts, array) else array("q", starts)
+		self.ends = ends if isinstance(ends, array) else array("q", ends)
+		if len(self.starts) != len(self.ends):
+			raise ValueError("Bin starts and ends must have the same length.")
+
+	def __len__(self) -> int:
+		return len(self.starts)
+
+	@typing.overload
+	def __getitem__(self, index: int) -> tuple[datetime.datetime, datetime.datetime]:
+		...
+
+	@typing.overload
+	def __getitem__(self, index: slice) -> "IntradayBins":
+		...
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return IntradayBins(self.starts[index], self.ends[index])
+		return (
+			_EPOCH + datetime.timedelta(seconds=self.starts[index]),
+			_EPOCH + datetime.timedelta(seconds=self.ends[index]),
+		)
 
-		return r
+	def __iter__(self) -> typing.Iterator[tuple[datetime.datetime, datetime.datetime]]:
+		for start, end in zip(self.starts, self.ends):
+			yield (
+				_EPOCH + datetime.timedelta(seconds=start),
+				_EPOCH + datetime.timedelta(seconds=end),
+			)
+
+	def __eq__(self, other) -> bool:
+		if isinstance(other, IntradayBins):
+			return self.starts == other.starts and self.ends == other.ends
+		if isinstance(other, (list, tuple)):
+			return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+		return NotImplemented
+
+	def __repr__(self) -> str:
+		if not self:
+			return "IntradayBins([])"
+		return f"IntradayBins({len(self)} bins, {self[0][0]} to {self[-1][1]})"
+
+	def key(self) -> tuple[bytes, bytes]:
+		"""Returns a hashable value identifying these bins, for use in cache keys."""
+		return self.starts.tobytes(), self.ends.tobytes()
+
+	def bin_index(self, timestamp: datetime.datetime | int) -> int:
+		"""
+		Returns the index of the bin that `timestamp` falls in, or -1 if no bin covers it.
+
+		:param timestamp: a datetime.datetime object or epoch seconds
+		"""
+		seconds = to_epoch_seconds(timestamp)
+		i = bisect_right(self.starts, seconds) - 1
+		return i if i >= 0 and seconds <= self.ends[i] else -1
 
-	def _get_current_quarter_start(self, date: datetime.date) -> datetime.date:
+	def as_numpy(self):
 		"""
-		Given a `date`, finds the calendar quarter it falls in and returns that quarter's starting
-		date.
+		Returns read-only NumPy views of the start and end seconds, without copying. Cast to
+		`datetime64[s]` to get NumPy datetimes.
 
-		:param date: the date to use to find the quarter start date
-		:return: the start date of the quarter `date` falls in
+		:return: tuple of (starts, ends) int64 arrays
 		"""
-		cy = date.year
-		calendar_quarters = [
-			(datetime.date(cy, 1, 1), datetime.date(cy, 3, 31)),
-			(datetime.date(cy, 4, 1), datetime.date(cy, 6, 30)),
-			(datetime.date(cy, 7, 1), datetime.date(cy, 9, 30)),
-			(datetime.date(cy, 10, 1), datetime.date(cy, 12, 31)),
+		import numpy as np
+
+		starts = np.frombuffer(self.starts, dtype=np.int64)
+		ends = np.frombuffer(self.ends, dtype=np.int64)
+		starts.flags.writeable = ends.flags.writeable = False
+		return starts, ends
+
+
+def _second_edges(bins: DateBins | IntradayBins) -> tuple[array, array]:
+	"""Returns the start and inclusive end seconds of date or intraday bins."""
+	if isinstance(bins, IntradayBins):
+		return bins.starts, bins.ends
+	offset = EPOCH_ORDINAL * SECONDS_PER_DAY
+	starts = array("q", (s * SECONDS_PER_DAY - offset for s in bins.starts))
+	ends = array("q", ((e + 1) * SECONDS_PER_DAY - offset - 1 for e in bins.ends))
+	return starts, ends
+
+
+class RedistributionPlan:
+	"""
+	Sparse matrix of the weights that move data from one set of date bins (`bins`) to another
+	(`new_bins`), stored as (row, column, overlap) entries: the new bin index, the original bin
+	index and the number of days (or seconds, if either side is `IntradayBins`) they share. By
+	default an original bin's data is spread uniformly over its days, so its weight in a new bin
+	is overlap / `source_days`. With a daily profile, the weight is instead the profile's weight
+	of the shared days (`shares`) over that of all the original bin's days (`source_weights`).
+	Built by `Period.redistribution_plan`.
+	"""
+
+	__slots__ = (
+		"bins",
+		"new_bins",
+		"rows",
+		"cols",
+		"overlaps",
+		"source_days",
+		"shares",
+		"source_weights",
+	)
+
+	def __init__(
+		self,
+		bins: "list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins",
+		new_bins: "list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins",
+		entries: typing.Iterable[tuple[int, int, int]],
+		source_days: typing.Sequence[int],
+		profile: DailyProfile | BusinessCalendar | None = None,
+	):
+		self.bins = bins
+		self.new_bins = new_bins
+		self.rows = array("i")
+		self.cols = array("i")
+		self.overlaps = array("i")
+		for row, col, overlap in entries:
+			self.rows.append(row)
+			self.cols.append(col)
+			self.overlaps.append(overlap)
+		self.source_days = array("q", source_days)
+		self.shares: list[Decimal] | None = None
+		self.source_weights: list[Decimal] | None = None
+		if profile is not None:
+			self._apply_profile(profile)
+
+	def _apply_profile(self, profile: DailyProfile | BusinessCalendar) -> None:
+		starts = DateBins.from_bins(self.bins).starts
+		new_starts = DateBins.from_bins(self.new_bins).starts
+		# BusinessCalendar totals are day counts, so weights are converted to Decimal
+		source_weights = [
+			Decimal(profile.total(s, s + n - 1)) for s, n in zip(starts, self.source_days)
 		]
-		for sq, eq in calendar_quarters:
-			if date <= eq:
-				result = sq
-				break
+		shares = []
+		for row, col, overlap in zip(self.rows, self.cols, self.overlaps):
+			start = max(starts[col], new_starts[row])
+			shares.append(Decimal(profile.total(start, start + overlap - 1)))
+
+		# Bins without any profile weight keep the uniform distribution so no data is lost
+		for k, col in enumerate(self.cols):
+			if not source_weights[col]:
+				shares[k] = Decimal(self.overlaps[k])
+		self.source_weights = [w or Decimal(n) for w, n in zip(source_weights, self.source_days)]
+		self.shares = shares
+
+	def __len__(self) -> int:
+		return len(self.rows)
+
+	def apply(self, data: typing.Sequence) -> OrderedDict:
+		"""
+		Redistributes `data` with exact Decimal arithmetic.
 
-		return result
+		:param data: sequence of numeric data points aligned with `bins`
+		:return: OrderedDict; the keys are the new bins, the values are the redistributed data in
+		Decimal format
+		"""
+		return OrderedDict(zip(self.new_bins, self._apply(data)))
 
-	def _get_cal_start_dates(
-		self, start_date: datetime.date, end_date: datetime.date, periodicity: str
-	) -> list[datetime.date]:
+	def apply_many(self, rows: typing.Iterable[typing.Sequence] | typing.Any) -> list | typing.Any:
 		"""
-		Returns a list of datetime.date objects representing the starting date of all calendar-
-		based periods (per periodicity) falling within the time span defined by `start_date` to
-		`end_date`.
+		Redistributes many data sequences aligned with `bins`.
 
-		A step of "days", "weeks", or "months" will not include a "stub" (incomplete) week - the
-		returned sequence of dates starts with the given `start_date` and calculates from there.
+		:param rows: iterable of sequences of numeric data points, or a 2-D NumPy array with one
+		series per row. NumPy arrays are redistributed with a single floating point matrix product
+		:return: list of lists of Decimal values, or a 2-D NumPy array if `rows` is one
+		"""
+		if hasattr(rows, "dtype"):
+			return rows @ self.to_numpy().T
+		return [self._apply(data) for data in rows]
 
-		:param start_date: the date from which to start binning
-		:param end_date: the date to which to end binning
-		:param periodicity: determines the binning periods within the time span from `start_date`
-		to `end_date`
-		:return: list bin start dates
+	def _apply(self, data: typing.Sequence) -> list[Decimal]:
+		if len(data) != len(self.bins):
+			raise ValueError("Data length must match with bin length.")
+
+		# Day (or second) counts unless a profile weighted them
+		totals: typing.Sequence[Decimal | int] = self.source_weights or self.source_days
+		shares: typing.Sequence[Decimal | int] = self.shares or self.overlaps
+		per_unit = [Decimal(d) / n for d, n in zip(data, totals)]
+		new_data = [Decimal("0")] * len(self.new_bins)
+		for row, col, share in zip(self.rows, self.cols, shares):
+			new_data[row] += per_unit[col] * share
+		return new_data
+
+	def to_numpy(self):
+		"""
+		Returns the weights as a dense NumPy array of shape (len(new_bins), len(bins)), so that
+		`weights @ data` redistributes a data vector.
 		"""
-		period, delta = self.date_math_patterns[periodicity]
-		delta = [delta] if isinstance(delta, int) else delta
-		seq = cycle(delta)
+		import numpy as np
+
+		weights = np.zeros((len(self.new_bins), len(self.bins)))
+		rows = np.frombuffer(self.rows, dtype=np.int32)
+		cols = np.frombuffer(self.cols, dtype=np.int32)
+		if self.shares is None or self.source_weights is None:
+			shares = np.frombuffer(self.overlaps, dtype=np.int32)
+			totals = np.frombuffer(self.source_days, dtype=np.int64)
+		else:
+			shares = np.array([float(w) for w in self.shares])
+			totals = np.array([float(w) for w in self.source_weights])
+		weights[rows, cols] = shares / totals[cols]
+		return weights
+
+
+@functools.cache
+def iso_bucket_labels(pattern: tuple[int, ...]) -> tuple[str, ...]:
+	"""
+	Builds the label of every ISO week (indexed 1 to 53) for an ISO pattern of week number break
+	points, as used by the grouped ISO periodicities. Each week is labeled by the bucket it falls
+	in:
+	- 12 or 13 buckets: "MMM (Nw)" by month (the 13th is "M13"), where N is the number of weeks in
+	the bucket
+	- 4 buckets: "QN" by quarter
+	- 2 buckets: "HYN" by half year
+	- any other number of buckets: "PN (Nw)", by 1-based bucket number and number of weeks
+
+	Bucket lengths assume a 52-week year; week 53 falls in the last bucket and adds a week to
+	its length. Weeks before the first break point belong to the last bucket of the year. Built
+	once per pattern.
+
+	:param pattern: the ISO week numbers that start each bucket, in ascending order
+	:return: tuple of 54 labels, indexed by ISO week number (index 0 is unused)
+	"""
+	lengths = [b - a for a, b in pairwise(pattern)] + [53 - pattern[-1] + pattern[0] - 1]
+	labels = [""]
+	for week in range(1, 54):
+		i = (bisect_right(pattern, week) - 1) % len(pattern)
+		n = lengths[i] + (week == 53)
+		if len(pattern) in (12, 13):
+			labels.append(f"{(MONTH_ABBREVIATIONS + ('M13',))[i]} ({n}w)")
+		elif len(pattern) == 4:
+			labels.append(f"Q{i + 1}")
+		elif len(pattern) == 2:
+			labels.append(f"HY{i + 1}")
+		else:
+			labels.append(f"P{i + 1} ({n}w)")
+	return tuple(labels)
+
+
+# Label fragments, built once so labels are assembled by indexing and concatenation
+_WEEK_PREFIXES = tuple(f"Week {week}-" for week in range(54))
+_MONTH_PREFIXES = ("",) + tuple(f"{month}-" for month in MONTH_ABBREVIATIONS)
+_MONTH_NUMBER_PREFIXES = tuple(f"{month:02d}-" for month in range(13))
+_MONTH_DAY_PREFIXES = tuple(
+	tuple(f"{month:02d}/{day:02d}/" for day in range(32)) for month in range(13)
+)
+
+
+@functools.cache
+def _year_suffixes() -> tuple[str, ...]:
+	"""Returns the two-digit year label fragment of every year, indexed by year."""
+	return tuple(str(year)[-2:] for year in range(datetime.MAXYEAR + 1))
+
+
+def _ordinal_labeler(
+	periodicity: str, date_format_string: str
+) -> typing.Callable[[int], str] | None:
+	"""
+	Returns a function that builds the label of a bin from the ordinal of its label date, or
+	None if the periodicity's labels depend on more than that date.
+	"""
+	fromordinal = datetime.date.fromordinal
+	if date_format_string:
+		return lambda ordinal: fromordinal(ordinal).strftime(date_format_string)
+
+	spec = PERIODICITIES.get(periodicity)
+	if periodicity in ("Entire Period", "ISO Biweekly", "Fiscal Weeks") or (
+		spec is not None and spec.labeler is not None
+	):
+		return None
 
-		r = []
+	yy = _year_suffixes()
+	if spec is not None and spec.iso:
+		week_and_year = get_iso_calendar().week_and_year
+		if periodicity == "ISO Week":
+			prefixes = _WEEK_PREFIXES
+		elif periodicity == "ISO Annual":
+			return lambda ordinal: str(week_and_year(ordinal)[1])
+		else:
+			prefixes = tuple(f"{label}-" for label in iso_bucket_labels(spec.pattern))
+
+		def iso_label(ordinal: int) -> str:
+			week, year = week_and_year(ordinal)
+			return prefixes[week] + yy[year]
+
+		return iso_label
+
+	if periodicity in ("Calendar Month", "Monthly"):
+
+		def month_label(ordinal: int) -> str:
+			date = fromordinal(ordinal)
+			return _MONTH_PREFIXES[date.month] + yy[date.year]
+
+		return month_label
 
-		if period == "days":
-			while start_date < end_date:
-				r.append(start_date)
-				start_date += relativedelta(days=next(seq))
+	if periodicity in ("Calendar Quarter", "Quarterly"):
 
-		elif period == "weeks":
-			while start_date < end_date:
-				r.append(start_date)
-				start_date += relativedelta(weeks=next(seq))
+		def quarter_label(ordinal: int) -> str:
+			date = fromordinal(ordinal)
+			return _MONTH_NUMBER_PREFIXES[date.month] + yy[date.year] + "Q"
 
-		# For "Calendar" periodicities, adjust start_date before incrementing if not first day of period
-		elif period == "months":
-			if periodicity == "Calendar Month" and start_date.day != 1:
-				r.append(start_date)
-				start_date = start_date.replace(day=1) + relativedelta(months=next(seq))
-			elif periodicity == "Calendar Quarter":
-				r.append(start_date)
-				start_date = self._get_current_quarter_start(start_date) + relativedelta(months=next(seq))
+		return quarter_label
 
-			while start_date < end_date:
-				r.append(start_date)
-				start_date += relativedelta(months=next(seq))
+	def day_label(ordinal: int) -> str:
+		date = fromordinal(ordinal)
+		return _MONTH_DAY_PREFIXES[date.month][date.day] + yy[date.year]
 
-		elif period == "years":
-			if periodicity == "Calendar Year" and (start_date.day != 1 or start_date.month != 1):
-				r.append(start_date)
-				start_date = start_date.replace(month=1, day=1) + relativedelta(years=next(seq))
+	return day_label
 
-			while start_date < end_date:
-				r.append(start_date)
-				start_date += relativedelta(years=next(seq))
 
-		return r
+class Period:
+	# Generated bins and labels are shared by all instances; see `cache_info` and `cache_clear`
+	_bins_cache = LRUCache(maxsize=1024)
+	_labels_cache = LRUCache(maxsize=256)
+	# Labels by label date ordinal, per (periodicity, date format string)
+	_ordinal_labels_cache = LRUCache(maxsize=64)
+	_max_ordinal_labels = 1 << 17
+	_ordinal_labels_lock = threading.Lock()
+
+	def __init__(self, start_date=None, end_date=None, periodicity="ISO Week"):
+		self.start_date = start_date
+		self.end_date = end_date
+		self.periodicity = periodicity
 
-	def _get_period_end_dates(
-		self, start_dates: list[datetime.date]
-	) -> list[tuple[datetime.date, datetime.date]]:
+	@property
+	def date_math_patterns(self) -> typing.Mapping[str, list[int] | tuple]:
 		"""
-		Accepts a sequence of period start dates and adds the period end date for each item, which
-		is the day prior to the next start date in the sequence. Assumes the final date is the
-		(exclusive) end date for the entire sequence.
+		Read-only view of the registered periodicity patterns: the ISO week number break points of
+		ISO periodicities, and the (date part to increment, step to increment by) of calendar
+		periodicities. See `register_periodicity` to add periodicities.
+		"""
+		patterns: dict[str, list[int] | tuple] = {}
+		for name, spec in PERIODICITIES.items():
+			if spec.iso:
+				patterns[name] = list(spec.pattern)
+			elif spec.unit is not None:
+				step = spec.pattern[0] if len(spec.pattern) == 1 else list(spec.pattern)
+				patterns[name] = (spec.unit, step)
+		return MappingProxyType(patterns)
+
+	@classmethod
+	def cache_info(cls) -> dict[str, int]:
+		"""
+		Returns the hit, miss and size counters of the date bin cache shared by all `Period`
+		instances.
+		"""
+		return cls._bins_cache.info()
 
-		:param start_dates: sequence of datetime.date objects
-		:return: list of tuples of datetime.date objects; each tuple represents the start and end
-		dates of end-to-end periods
+	@classmethod
+	def cache_clear(cls) -> None:
 		"""
-		# Generate (from, to) period pairs off start dates
-		return [(p[0], p[1] - relativedelta(days=1)) for p in pairwise(start_dates)]
+		Empties the date bin and label caches shared by all `Period` instances and resets their
+		counters.
+		"""
+		cls._bins_cache.clear()
+		cls._labels_cache.clear()
+		cls._ordinal_labels_cache.clear()
 
 	def get_date_bins(
 		self,
@@ -192,7 +608,8 @@ class Period:
 		periodicity: str | None = None,
 		inclusive: bool = True,
 		custom_period: int | list[int] = 1,
-	) -> list[tuple[datetime.date, datetime.date]]:
+		compact: bool = False,
+	) -> list[tuple[datetime.date, datetime.date]] | DateBins:
 		"""
 		Gets the starting dates for all periods falling within the time span from `start_date` to
 		`end_date`, then returns a list of tuples with the start and end dates for each date bin
@@ -237,12 +654,22 @@ class Period:
 		    - "Annually": yearly bins starting from `start_date`
 		    - "Entire Period": one bin from `start_date` to either `end_date` (if
 		    inclusive=True) or the day prior to `end_date` (if inclusive=False)
+		    - "Business Days": bins starting on `start_date` that each hold the number of business
+		    days given by `custom_period` of the shared business calendar (see
+		    `configure_business_calendar`), with non-business days in the bin before them
+		    - "Retail Week", "Retail Month (4 + 5 + 4)", "Retail Month (4 + 4 + 5)", "Retail Month
+		    (5 + 4 + 4)", "Retail Quarter", "Retail Year": bins of the 52-53 week fiscal years of
+		    the shared retail calendar (NRF 4-5-4 by default, see `configure_retail_calendar`)
+		    - any periodicity added with `register_periodicity`
 		:param inclusive: if resulting bins include the end_date (inclusive=True) or ends the day
 		before (inclusive=False)
 		:param custom_period: a single or sequence of integers that specifies the number of days
-		(for "Custom Days") or weeks (for "Fiscal Weeks") in a bin. Ignored for other periodicity
-		options
-		:return: list of tuples in form `(datetime.date object, datetime.date object)`
+		(for "Custom Days"), weeks (for "Fiscal Weeks") or business days (for "Business Days") in a
+		bin. Ignored for other periodicity options
+		:param compact: if True, returns the bins as a `DateBins`, which stores them as ordinal
+		arrays and is shared with the bin cache instead of copied
+		:return: list of tuples in form `(datetime.date object, datetime.date object)`, or a
+		`DateBins` if `compact` is True
 		"""
 		start_date = start_date or self.start_date
 		end_date = end_date or self.end_date
@@ -257,125 +684,579 @@ class Period:
 		if end_date <= start_date:
 			raise ValueError("End date must be after start date.")
 
-		if periodicity in ["Custom Days", "Fiscal Weeks"]:
-			if not (isinstance(custom_period, int) or isinstance(custom_period, list)) or (
-				isinstance(custom_period, list) and not all([isinstance(n, int) for n in custom_period])
-			):
-				raise ValueError("custom_period must be an integer or list of integers.")
+		spec = get_periodicity(periodicity)
+		steps = spec.steps(custom_period)
+		effective_end_date = end_date if not inclusive else end_date + ONE_DAY
+
+		# Results are cached as DateBins; compact callers get a copy, since its arrays are mutable
+		key = (start_date, effective_end_date, spec, steps)
+		bins = self._bins_cache.get(key)
+		if bins is None:
+			starts = takewhile(lambda d: d < effective_end_date, spec.start_dates(start_date, steps))
+			boundaries = [d.toordinal() for d in starts]
+			boundaries.append(effective_end_date.toordinal())
+			bins = DateBins.from_boundaries(boundaries)
+			self._bins_cache.set(key, bins)
+		return DateBins(bins.starts, bins.ends) if compact else list(bins)
+
+	def iter_date_bins(
+		self,
+		start_date: datetime.date | None = None,
+		end_date: datetime.date | None = None,
+		periodicity: str | None = None,
+		inclusive: bool = True,
+		custom_period: int | list[int] = 1,
+	) -> typing.Iterator[tuple[datetime.date, datetime.date]]:
+		"""
+		Lazily yields the same `(start date, end date)` bins as `get_date_bins`, one at a time,
+		so callers that only need the first few bins, or stream them elsewhere, don't pay for
+		the whole time span. Bins are not cached.
+
+		:param start_date: the date from which to start binning. If None, uses class start date
+		:param end_date: the date to which to end binning. If None, bins are yielded without an
+		end (until the end of the supported date range), so the caller decides when to stop
+		:param periodicity: determines the binning periods, see `get_date_bins`. If None, uses
+		class periodicity
+		:param inclusive: if the last bin includes the end_date (inclusive=True) or ends the day
+		before (inclusive=False). Ignored if `end_date` is None
+		:param custom_period: see `get_date_bins`
+		:return: iterator of tuples in form `(datetime.date object, datetime.date object)`
+		"""
+		start_date = start_date or self.start_date
+		periodicity = periodicity or self.periodicity
+
+		if start_date is None or not isinstance(start_date, datetime.date):
+			raise ValueError("Please provide a valid start date.")
+
+		if end_date is not None:
+			if not isinstance(end_date, datetime.date):
+				raise ValueError("Please provide a valid end date.")
+
+			if end_date <= start_date:
+				raise ValueError("End date must be after start date.")
+
+		if periodicity == "Entire Period" and end_date is None:
+			raise ValueError("Entire Period periodicity requires an end date.")
+
+		spec = get_periodicity(periodicity)
+		steps = spec.steps(custom_period)
+		effective_end_date = end_date + ONE_DAY if end_date and inclusive else end_date
+		return self._iter_date_bins(spec.start_dates(start_date, steps), effective_end_date)
+
+	def get_intraday_bins(
+		self,
+		start: datetime.datetime | datetime.date | None = None,
+		end: datetime.datetime | datetime.date | None = None,
+		periodicity: str = "Hourly",
+		inclusive: bool = True,
+	) -> IntradayBins:
+		"""
+		Returns the sub-daily bins for `periodicity` over the time span from `start` to `end`.
+		Bins are computed with integer arithmetic on epoch seconds, and every bin is the width
+		of the periodicity counted from `start`, except the last which ends with the time span.
+
+		:param start: the datetime (or date, from midnight) from which to start binning. If None,
+		uses class start date
+		:param end: the datetime or date to which to end binning. If None, uses class end date
+		:param periodicity: one of `INTRADAY_PERIODICITIES`: "15 Minutes", "30 Minutes" or
+		"Hourly". Default is "Hourly"
+		:param inclusive: if the last bin includes `end` (the whole day, if `end` is a date) or
+		ends just before it
+		:return: IntradayBins
+		"""
+		start = start or self.start_date
+		end = end or self.end_date
+
+		if start is None or not isinstance(start, datetime.date):
+			raise ValueError("Please provide a valid start date.")
+
+		if end is None or not isinstance(end, datetime.date):
+			raise ValueError("Please provide a valid end date.")
+
+		width = INTRADAY_PERIODICITIES.get(periodicity)
+		if width is None:
+			raise ValueError(f"Unknown intraday periodicity: {periodicity}")
+
+		first = to_epoch_seconds(start)
+		effective_end = to_epoch_seconds(end)
+		if inclusive:
+			effective_end += 1 if isinstance(end, datetime.datetime) else SECONDS_PER_DAY
+		if effective_end <= first:
+			raise ValueError("End date must be after start date.")
+
+		starts = array("q", range(first, effective_end, width))
+		ends = array("q", range(first + width - 1, effective_end - 1, width))
+		ends.append(effective_end - 1)
+		return IntradayBins(starts, ends)
 
-			if isinstance(custom_period, int) and custom_period < 1:
-				raise ValueError(f"{periodicity} periodicity requires an integer value > 0 for custom_period.")
+	def extend_bins(
+		self,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins,
+		new_end_date: datetime.date,
+		periodicity: str | None = None,
+		custom_period: int | list[int] = 1,
+		inclusive: bool = True,
+	) -> list[tuple[datetime.date, datetime.date]] | DateBins:
+		"""
+		Extends bins produced by `get_date_bins` to a new end date, returning the same bins
+		`get_date_bins` would for the original start date and `new_end_date`. Binning resumes
+		from the start of the last bin (which may have been cut short by the previous end date),
+		continuing the ISO pattern, `custom_period` cycle and calendar alignment from there, so
+		only the new bins are generated. Only `bins[len(bins) - 1:]` of the result need new
+		labels.
+
+		:param bins: the bins to extend, as a list of tuples or a `DateBins`
+		:param new_end_date: the date to which to end binning
+		:param periodicity: the periodicity `bins` were generated with. If None, uses class
+		periodicity
+		:param custom_period: the `custom_period` `bins` were generated with
+		:param inclusive: if the last bin includes `new_end_date` (inclusive=True) or ends the day
+		before (inclusive=False)
+		:return: the extended bins, in the same form as `bins`
+		"""
+		periodicity = periodicity or self.periodicity
+
+		if not bins:
+			raise ValueError("Please provide the date bins to extend.")
 
-			if isinstance(custom_period, list) and any([n < 1 for n in custom_period]):
-				raise ValueError(f"{periodicity} periodicity requires integer values > 0 for custom_period.")
+		if new_end_date is None or not isinstance(new_end_date, datetime.date):
+			raise ValueError("Please provide a valid end date.")
 
-		effective_end_date = end_date if not inclusive else end_date + relativedelta(days=1)
-		is_iso = "iso" in periodicity.lower()
+		last_start = bins[-1][0]
+		if new_end_date <= last_start:
+			raise ValueError("End date must be after start date.")
 
-		if periodicity == "Custom Days":
-			self.date_math_patterns.update({"Custom Days": ("days", custom_period)})
+		starts = self._resume_start_dates(bins, periodicity, custom_period)
+		effective_end_date = new_end_date + ONE_DAY if inclusive else new_end_date
+		new_bins = self._iter_date_bins(starts, effective_end_date)
 
-		if periodicity == "Fiscal Weeks":
-			self.date_math_patterns.update({"Fiscal Weeks": ("weeks", custom_period)})
+		if isinstance(bins, DateBins):
+			tail = DateBins.from_bins(new_bins)
+			return DateBins(bins.starts[:-1] + tail.starts, bins.ends[:-1] + tail.ends)
+		return list(bins[:-1]) + list(new_bins)
+
+	def iter_horizon_bins(
+		self,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins,
+		n: int,
+		periodicity: str | None = None,
+		custom_period: int | list[int] = 1,
+	) -> typing.Iterator[tuple[datetime.date, datetime.date]]:
+		"""
+		Lazily yields the `n` bins that follow `bins`, e.g. the periods a forecast from binned
+		history covers. Binning resumes from the last bin of `bins` the same way as
+		`extend_bins`, so nothing is recomputed from the start of the history. If the last bin of
+		`bins` was cut short by the history's end date, the first bin yielded is the rest of it.
+
+		:param bins: the history bins, as generated by `get_date_bins`
+		:param n: the number of future bins to yield
+		:param periodicity: the periodicity `bins` were generated with. If None, uses class
+		periodicity
+		:param custom_period: the `custom_period` `bins` were generated with
+		:return: iterator of `n` tuples in form `(datetime.date object, datetime.date object)`
+		"""
+		periodicity = periodicity or self.periodicity
+
+		if not bins:
+			raise ValueError("Please provide the date bins to extend.")
+
+		if not isinstance(n, int) or n < 0:
+			raise ValueError("Please provide a non-negative number of bins.")
 
 		if periodicity == "Entire Period":
-			return [(start_date, end_date if inclusive else end_date - relativedelta(days=1))]
+			raise ValueError("Entire Period periodicity has no bins after the history.")
 
-		if is_iso:
-			r = self._get_iso_start_dates(start_date, effective_end_date, periodicity)
-		else:
-			r = self._get_cal_start_dates(start_date, effective_end_date, periodicity)
+		future = self._iter_date_bins(
+			self._resume_start_dates(bins, periodicity, custom_period), None
+		)
+		# The first bin is the last history bin in full, so continue with any part `bins` cut off
+		end = next(future)[1]
+		history_end = bins[-1][-1]
+		if end > history_end:
+			future = chain([(history_end + ONE_DAY, end)], future)
+		return islice(future, n)
+
+	def bin_index(
+		self,
+		date: datetime.date | int,
+		anchor_start: datetime.date | None = None,
+		periodicity: str | None = None,
+		custom_period: int | list[int] = 1,
+	) -> int:
+		"""
+		Returns the index of the bin that `date` falls in, of the bins for `periodicity` starting
+		on `anchor_start` (as generated by `iter_date_bins`), or -1 if `date` is before
+		`anchor_start`. For calendar periodicities ("Custom Days", "Weekly", "Fiscal Weeks",
+		"Calendar Month", "Quarterly", etc.) the index is computed arithmetically, so the cost
+		doesn't depend on how far `date` is from `anchor_start`. Other periodicities step through
+		the preceding bins.
+
+		:param date: a datetime.date object or date ordinal
+		:param anchor_start: the start date of the first bin. If None, uses class start date
+		:param periodicity: see `get_date_bins`. If None, uses class periodicity
+		:param custom_period: see `get_date_bins`
+		:return: the 0-based bin index
+		"""
+		found = self._locate(date, anchor_start, periodicity, custom_period)
+		return -1 if found is None else found[0]
+
+	def bin_for(
+		self,
+		date: datetime.date | int,
+		anchor_start: datetime.date | None = None,
+		periodicity: str | None = None,
+		custom_period: int | list[int] = 1,
+	) -> tuple[datetime.date, datetime.date] | None:
+		"""
+		Returns the `(start date, end date)` bounds of the bin that `date` falls in, of the bins
+		for `periodicity` starting on `anchor_start`, or None if `date` is before
+		`anchor_start`. See `bin_index`.
+		"""
+		found = self._locate(date, anchor_start, periodicity, custom_period)
+		return None if found is None else found[1:]
+
+	def _locate(
+		self,
+		date: datetime.date | int,
+		anchor_start: datetime.date | None,
+		periodicity: str | None,
+		custom_period: int | list[int],
+	) -> tuple[int, datetime.date, datetime.date] | None:
+		anchor_start = anchor_start or self.start_date
+		periodicity = periodicity or self.periodicity
+
+		if anchor_start is None or not isinstance(anchor_start, datetime.date):
+			raise ValueError("Please provide a valid start date.")
+
+		if periodicity == "Entire Period":
+			raise ValueError("Entire Period periodicity requires an end date.")
+
+		date = datetime.date.fromordinal(date) if isinstance(date, int) else date
+		spec = get_periodicity(periodicity)
+		steps = spec.steps(custom_period)
+		if spec.locator is not None:
+			return spec.locator(spec, anchor_start, steps, date)
+
+		if date < anchor_start:
+			return None
+		bins = self._iter_date_bins(spec.start_dates(anchor_start, steps), None)
+		for i, (start, end) in enumerate(bins):
+			if end >= date:
+				return i, start, end
+		return None
+
+	def _resume_start_dates(
+		self,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins,
+		periodicity: str,
+		custom_period: int | list[int],
+	) -> typing.Iterator[datetime.date]:
+		# Bin i is followed by step i of the cycle, with or without a leading stub bin
+		spec = get_periodicity(periodicity)
+		steps = spec.steps(custom_period)
+		k = (len(bins) - 1) % len(steps)
+		return spec.start_dates(bins[-1][0], steps[k:] + steps[:k])
+
+	def _iter_date_bins(
+		self, starts: typing.Iterator[datetime.date], effective_end_date: datetime.date | None
+	) -> typing.Iterator[tuple[datetime.date, datetime.date]]:
+		previous = next(starts)
+		for start in starts:
+			if effective_end_date is not None and start >= effective_end_date:
+				break
+			yield previous, start - ONE_DAY
+			previous = start
+		if effective_end_date is not None:
+			yield previous, effective_end_date - ONE_DAY
 
-		r.append(effective_end_date)
-		results = self._get_period_end_dates(r)
-		return results
+	@typing.overload
+	def convert_dates(
+		self,
+		bins: DateBins | IntradayBins,
+		periodicity: str = ...,
+		custom_period: int | list[int] = ...,
+	) -> DateBins | IntradayBins:
+		...
 
+	@typing.overload
 	def convert_dates(
 		self,
 		bins: list[tuple[datetime.date, datetime.date]],
+		periodicity: str = ...,
+		custom_period: int | list[int] = ...,
+	) -> list[tuple[datetime.date, datetime.date]] | IntradayBins:
+		...
+
+	def convert_dates(
+		self,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins,
 		periodicity: str = "ISO Week",
 		custom_period: int | list[int] = 1,
-	) -> list[tuple[datetime.date, datetime.date]]:
+	) -> list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins:
 		"""
 		Converts date bins from their original periodicity into bins for new given `periodicity`
 		over the same time span.
 
-		:param bins: list of tuples in form `(datetime.date object, datetime.date object)`
+		:param bins: list of tuples in form `(datetime.date object, datetime.date object)`, or a
+		`DateBins` or `IntradayBins`
 		:param periodicity: str; how to determine the periods within the time span from
-		`start_date` to `end_date`. Default is "ISO Week"
+		`start_date` to `end_date`. Default is "ISO Week". Intraday periodicities return
+		`IntradayBins` over the same time span, and intraday `bins` are converted over the days
+		they span
 		:param custom_period: a single or sequence of integers that specifies the number of days
 		(for "Custom Days") or weeks (for "Fiscal Weeks") in a bin. Ignored for other periodicity
 		options
-		:return: list of tuples in form `(datetime.date object, datetime.date object)`
+		:return: list of tuples in form `(datetime.date object, datetime.date object)`, or a
+		`DateBins` if `bins` is a `DateBins` or `IntradayBins`, or an `IntradayBins` for intraday
+		periodicities
 		"""
 		if not bins:
-			return []
+			return DateBins() if isinstance(bins, DateBins) else []
 		start_date = bins[0][0]
 		end_date = bins[-1][-1]
+		if periodicity in INTRADAY_PERIODICITIES:
+			return self.get_intraday_bins(start_date, end_date, periodicity)
+		if isinstance(bins, IntradayBins):
+			start_date, end_date = bins[0][0].date(), bins[-1][-1].date()
 		return self.get_date_bins(
 			start_date=start_date,
 			end_date=end_date,
 			periodicity=periodicity,
 			inclusive=True,
 			custom_period=custom_period,
+			compact=isinstance(bins, (DateBins, IntradayBins)),
 		)
 
+	def _bin_edges(
+		self, bins: list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins
+	) -> tuple[array, array]:
+		"""
+		Returns the start and end date ordinals (or epoch seconds, for `IntradayBins`) of `bins`
+		as integer arrays. Bins must be in chronological order and may not overlap.
+		"""
+		if not isinstance(bins, IntradayBins):
+			bins = DateBins.from_bins(bins)
+		return bins.starts, bins.ends
+
+	def assign_bins(
+		self,
+		dates: typing.Iterable[datetime.date | int] | typing.Any,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins,
+	) -> list[int] | typing.Any:
+		"""
+		Returns the index of the bin in `bins` that each date falls in, or -1 for dates not
+		covered by any bin. Each lookup is a binary search over the bin start ordinals.
+
+		:param dates: an iterable of datetime.date objects or date ordinals (as returned by
+		`datetime.date.toordinal`), or a NumPy array of `datetime64` values or of integer ordinals.
+		NumPy arrays are assigned with `numpy.searchsorted` without creating Python objects per
+		date. For `IntradayBins`, datetime.datetime objects or epoch seconds (see
+		`to_epoch_seconds`), or a NumPy array of either
+		:param bins: list of tuples in form `(datetime.date object, datetime.date object)`, or a
+		`DateBins` or `IntradayBins`, in chronological order
+		:return: list of bin indices, or a NumPy integer array if `dates` is a NumPy array
+		"""
+		starts, ends = self._bin_edges(bins)
+		intraday = isinstance(bins, IntradayBins)
+
+		if hasattr(dates, "dtype"):
+			import numpy as np
+
+			values = np.asarray(dates)
+			if np.issubdtype(values.dtype, np.datetime64):
+				if intraday:
+					ordinals = values.astype("datetime64[s]").astype(np.int64)
+				else:
+					ordinals = values.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+			else:
+				ordinals = values.astype(np.int64)
+			if not bins:
+				return np.full(ordinals.shape, -1, dtype=np.int64)
+			dtype: type[np.signedinteger] = np.int64 if intraday else np.int32
+			np_starts = np.frombuffer(starts, dtype=dtype)
+			np_ends = np.frombuffer(ends, dtype=dtype)
+			indices = np.searchsorted(np_starts, ordinals, side="right") - 1
+			covered = (indices >= 0) & (ordinals <= np_ends[np.maximum(indices, 0)])
+			return np.where(covered, indices, -1)
+
+		result = []
+		for d in dates:
+			if intraday:
+				ordinal = to_epoch_seconds(d)
+			else:
+				ordinal = d if isinstance(d, int) else d.toordinal()
+			i = bisect_right(starts, ordinal) - 1
+			result.append(i if i >= 0 and ordinal <= ends[i] else -1)
+		return result
+
+	def aggregate(
+		self,
+		dates: typing.Iterable[datetime.date | int],
+		values: typing.Iterable,
+		periodicity: str | None = None,
+		start_date: datetime.date | None = None,
+		end_date: datetime.date | None = None,
+		keys: typing.Iterable[typing.Hashable] | None = None,
+		inclusive: bool = True,
+		custom_period: int | list[int] = 1,
+		segment_length: int | None = None,
+	) -> list | dict[typing.Hashable, list]:
+		"""
+		Sums a stream of (date, value) pairs into the bins for `periodicity` over the time span
+		from `start_date` to `end_date`. The inputs are consumed lazily, and only one running
+		total per bin is kept for each series, so memory doesn't grow with the number of pairs.
+		Dates outside of the time span are ignored.
+
+		:param dates: iterable of datetime.date objects or date ordinals
+		:param values: iterable of numeric values, in the same order as `dates`. Floats are
+		converted to Decimal from their shortest repr, e.g. 0.1 becomes Decimal("0.1")
+		:param periodicity: determines the bins, see `get_date_bins`. If None, uses class
+		periodicity
+		:param start_date: the date from which to start binning. If None, uses class start date
+		:param end_date: the date to which to end binning. If None, uses class end date
+		:param keys: optional iterable of series keys, in the same order as `dates`, to aggregate
+		many series in one pass
+		:param inclusive: if bins include the end_date (inclusive=True) or end the day before
+		(inclusive=False)
+		:param custom_period: see `get_date_bins`
+		:param segment_length: if given, each series' totals are split into consecutive lists of
+		this many bins (the last may be shorter), the sequence of sequences shape `Forecast` uses
+		:return: the list of Decimal totals per bin (aligned with `get_date_bins` for the same
+		arguments), or segments of it if `segment_length` is given. If `keys` is given, returns a
+		dict of series key to totals, in order of first appearance
+		"""
+		if segment_length is not None and segment_length < 1:
+			raise ValueError("segment_length must be an integer > 0.")
+
+		bins = self.get_date_bins(start_date, end_date, periodicity, inclusive, custom_period, True)
+		starts, ends = self._bin_edges(bins)
+		first, last = starts[0], ends[-1]
+		zero = Decimal("0")
+		totals: dict[typing.Hashable, list[Decimal]] = {}
+		if keys is None:
+			totals[None] = [zero] * len(bins)
+
+		i = 0
+		for d, v, key in zip(dates, values, repeat(None) if keys is None else keys):
+			ordinal = d if isinstance(d, int) else d.toordinal()
+			if not (first <= ordinal <= last):
+				continue
+			# Sorted input usually stays in the same bin, so check it before searching
+			if not (starts[i] <= ordinal <= ends[i]):
+				i = bisect_right(starts, ordinal) - 1
+			series = totals.get(key)
+			if series is None:
+				series = totals[key] = [zero] * len(bins)
+			if not isinstance(v, Decimal):
+				# Floats are converted from their repr, not their exact binary value
+				v = Decimal(str(v)) if isinstance(v, float) else Decimal(v)
+			series[i] += v
+
+		if segment_length:
+			segments = {
+				key: [series[j : j + segment_length] for j in range(0, len(series), segment_length)]
+				for key, series in totals.items()
+			}
+			return segments[None] if keys is None else segments
+
+		return totals[None] if keys is None else totals
+
 	def redistribute_data(
 		self,
 		data,
-		bins: list[tuple[datetime.date, datetime.date]],
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins,
 		periodicity: str = "ISO Week",
 		custom_period: int | list[int] = 1,
+		profile: DailyProfile | BusinessCalendar | None = None,
 	):
 		"""
 		Redistributes numeric `data` for the periods specified by `bins` into new date periods
 		based on `periodicity`. Returns an OrderedDict where the keys are the new period bins and
 		the values are the redistributed data. Assumes data are uniformly distributed over the
-		days within the original periods.
+		days within the original periods, unless a daily `profile` is given.
 
 		:param data: sequence of numeric data points
 		:param bins: list of tuples in form `(datetime.date object, datetime.date object)` that
-		represent the date ranges aligning with the given numeric data
+		represent the date ranges aligning with the given numeric data, or a `DateBins`
 		:param periodicity: str; how to determine the periods within the same time span as `bins`.
 		Default is "ISO Week"
 		:param custom_period: a single or sequence of integers that specifies the number of days
 		(for "Custom Days") or weeks (for "Fiscal Weeks") in a bin. Ignored for other periodicity
 		options
+		:param profile: optional DailyProfile of relative day weights (e.g. a weekday pattern),
+		or a BusinessCalendar to distribute over business days only, used to distribute the data
+		over the days within the original periods
 		:return: OrderedDict; the keys are tuples of datetime.date objects representing the bins
 		for the new periodicity, the values are the redistributed numeric data in Decimal format
 		"""
 		if len(data) != len(bins):
 			raise ValueError("Data length must match with bin length.")
 
-		# Build data by day
-		n_days = [(b[1] - b[0]).days + 1 for b in bins]
-		d_per_day = []
-		for d, n in zip([Decimal(d) for d in data], n_days):
-			d_per_day += [d / n] * n
-
-		# Get new bins
-		new_bins = self.convert_dates(bins, periodicity, custom_period)
-
-		# Get number of days of new bins and convert to cumulative indices
-		indices = accumulate([(b[1] - b[0]).days + 1 for b in new_bins], initial=0)
+		return self.redistribution_plan(bins, periodicity, custom_period, profile).apply(data)
 
-		# Rebuild data by summing over data by day using cumulative indices as breakpoints
-		new_data = [sum(d_per_day[i[0] : i[1]]) for i in pairwise(indices)]
+	def redistribution_plan(
+		self,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins,
+		periodicity: str = "ISO Week",
+		custom_period: int | list[int] = 1,
+		profile: DailyProfile | BusinessCalendar | None = None,
+	) -> "RedistributionPlan":
+		"""
+		Builds the overlap weights that redistribute data for the periods specified by `bins` into
+		new date periods based on `periodicity`. The returned plan can be applied to any number of
+		data sequences aligned with `bins`, so re-binning many series with the same bins only
+		computes the new bins and their overlaps once.
 
-		return OrderedDict(zip(new_bins, new_data))
+		:param bins: list of tuples in form `(datetime.date object, datetime.date object)` that
+		represent the date ranges of the data the plan will be applied to, or a `DateBins`
+		:param periodicity: str; how to determine the periods within the same time span as `bins`.
+		Default is "ISO Week"
+		:param custom_period: a single or sequence of integers that specifies the number of days
+		(for "Custom Days") or weeks (for "Fiscal Weeks") in a bin. Ignored for other periodicity
+		options
+		:param profile: optional DailyProfile of relative day weights, or a BusinessCalendar, used
+		to distribute the data over the days within the original periods. Each overlap's weight is
+		computed from the profile's cumulative sums in O(1). Original periods whose days all have
+		zero weight are distributed uniformly
+		:return: RedistributionPlan
+
+		`IntradayBins` can be redistributed into date periods (or coarser intraday ones) and date
+		bins into an intraday periodicity; the overlaps are then measured in seconds, and data is
+		assumed uniform over each original period's seconds.
+		"""
+		if not isinstance(bins, IntradayBins):
+			bins = DateBins.from_bins(bins)
+		new_bins = self.convert_dates(bins, periodicity, custom_period)
+		if isinstance(bins, IntradayBins) or isinstance(new_bins, IntradayBins):
+			if profile is not None:
+				raise ValueError("Daily profiles can't be applied to intraday bins.")
+			old_starts, old_ends = _second_edges(bins)
+			new_starts, new_ends = _second_edges(new_bins)
+		else:
+			old_starts, old_ends = bins.starts, bins.ends
+			new_starts, new_ends = self._bin_edges(new_bins)
+		return RedistributionPlan(
+			bins,
+			new_bins,
+			interval_overlaps(new_starts, new_ends, old_starts, old_ends),
+			[e - s + 1 for s, e in zip(old_starts, old_ends)],
+			profile,
+		)
 
 	def get_period_labels(
 		self,
-		bins: list[tuple[datetime.date, datetime.date]],
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins | IntradayBins,
 		periodicity: str | None = None,
 		date_format_string: str = "",
 		use_bin_start_date_for_label: bool | None = None,
+		first_index: int = 1,
 	) -> list[str]:
 		"""
 		Returns the formatted date labels for the provided bins.
 
 		:param bins: list of tuples in form (datetime.date object, datetime.date object); the date
-		bins from which to generate the labels
+		bins from which to generate the labels, or a `DateBins`. `IntradayBins` (or bins of
+		datetime.datetime objects with an intraday periodicity) are labeled with their times
 		:param periodicity: ignored if `date_format_string` provided, otherwise determines the
 		label format for the given `bins`. Uses the class periodicity as a fallback
 		:param date_format_string: a custom date format string to apply to the bins to generate
@@ -383,7 +1264,10 @@ class Period:
 		:param use_bin_start_date_for_label: Date bins are pairs of datetime.date objects that
 		represent the start date and end date of each bin. If True, it uses the bin's start date
 		to create the label, if False it uses the bin's end date. If None, it uses the start date
-		for any ISO-based periodicity and it uses the end date for all other periodicity options
+		for any ISO-based or intraday periodicity and it uses the end date for all other
+		periodicity options
+		:param first_index: the number of the first bin in "Fiscal Weeks" labels, e.g. to continue
+		the numbering of earlier bins. Default is 1
 		:return: the labels for the given date bins
 
 		If `date_format_string` isn't provided, function returns the following built-in formats by
@@ -399,16 +1283,24 @@ class Period:
 		- "Custom Days": "MM/DD/YY"
 		- "Weekly": "MM/DD/YY"
 		- "Biweekly": "MM/DD/YY"
-		- "Fiscal Weeks": "I (Nw)-YY" (where I is the 1-based bin index, N is the number of weeks
-		in the bin group), the year is calculated per `use_bin_start_date_for_label`
+		- "Fiscal Weeks": "I (Nw)-YY" (where I is the bin number counted from `first_index`, N is
+		the number of weeks in the bin group), the year is calculated per
+		`use_bin_start_date_for_label`
 		- "Calendar Month": "MMM-YY"
 		- "Calendar Quarter": "MM-YYQ"
 		- "Calendar Year": "MM/DD/YY"
 		- "Annually": "MM/DD/YY"
 		- "Entire Period": "MM/DD/YY-MM/DD/YY"
+		- "Business Days": "MM/DD/YY"
+		- "Retail Week": "Week N-YY" (where N is the fiscal week number and YY the fiscal year)
+		- "Retail Month (...)": "MMM (Nw)-YY" (where N is the number of weeks in the period)
+		- "Retail Quarter": "QN-YY"
+		- "Retail Year": "YYYY"
+		- "15 Minutes", "30 Minutes", "Hourly" and `IntradayBins`: "MM/DD/YY HH:MM"
 		"""
 		periodicity = periodicity or self.periodicity
-		is_iso = "iso" in periodicity.lower()
+		spec = PERIODICITIES.get(periodicity)
+		is_iso = spec is not None and spec.iso
 		date_idx = (
 			int(not is_iso)
 			if use_bin_start_date_for_label is None
@@ -418,429 +1310,94 @@ class Period:
 		if not bins:
 			return []
 
-		if is_iso:
-			iso_data: list[tuple[int, int]] = [self._get_iso_week_and_year(p[date_idx]) for p in bins]
-
-		if date_format_string:
-			return [p[date_idx].strftime(date_format_string) for p in bins]
-
-		# ISO Month, Quarter, and Semiannual labels lookup by week number
-		iso_buckets = {
-			1: {
-				"ISO Month (4 Weeks)": "Jan (4w)",
-				"ISO Month (4 + 5 + 4)": "Jan (4w)",
-				"ISO Month (4 + 4 + 5)": "Jan (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			2: {
-				"ISO Month (4 Weeks)": "Jan (4w)",
-				"ISO Month (4 + 5 + 4)": "Jan (4w)",
-				"ISO Month (4 + 4 + 5)": "Jan (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			3: {
-				"ISO Month (4 Weeks)": "Jan (4w)",
-				"ISO Month (4 + 5 + 4)": "Jan (4w)",
-				"ISO Month (4 + 4 + 5)": "Jan (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			4: {
-				"ISO Month (4 Weeks)": "Jan (4w)",
-				"ISO Month (4 + 5 + 4)": "Jan (4w)",
-				"ISO Month (4 + 4 + 5)": "Jan (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			5: {
-				"ISO Month (4 Weeks)": "Feb (4w)",
-				"ISO Month (4 + 5 + 4)": "Feb (5w)",
-				"ISO Month (4 + 4 + 5)": "Feb (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			6: {
-				"ISO Month (4 Weeks)": "Feb (4w)",
-				"ISO Month (4 + 5 + 4)": "Feb (5w)",
-				"ISO Month (4 + 4 + 5)": "Feb (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			7: {
-				"ISO Month (4 Weeks)": "Feb (4w)",
-				"ISO Month (4 + 5 + 4)": "Feb (5w)",
-				"ISO Month (4 + 4 + 5)": "Feb (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			8: {
-				"ISO Month (4 Weeks)": "Feb (4w)",
-				"ISO Month (4 + 5 + 4)": "Feb (5w)",
-				"ISO Month (4 + 4 + 5)": "Feb (4w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			9: {
-				"ISO Month (4 Weeks)": "Mar (4w)",
-				"ISO Month (4 + 5 + 4)": "Feb (5w)",
-				"ISO Month (4 + 4 + 5)": "Mar (5w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			10: {
-				"ISO Month (4 Weeks)": "Mar (4w)",
-				"ISO Month (4 + 5 + 4)": "Mar (4w)",
-				"ISO Month (4 + 4 + 5)": "Mar (5w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			11: {
-				"ISO Month (4 Weeks)": "Mar (4w)",
-				"ISO Month (4 + 5 + 4)": "Mar (4w)",
-				"ISO Month (4 + 4 + 5)": "Mar (5w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			12: {
-				"ISO Month (4 Weeks)": "Mar (4w)",
-				"ISO Month (4 + 5 + 4)": "Mar (4w)",
-				"ISO Month (4 + 4 + 5)": "Mar (5w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			13: {
-				"ISO Month (4 Weeks)": "Apr (4w)",
-				"ISO Month (4 + 5 + 4)": "Mar (4w)",
-				"ISO Month (4 + 4 + 5)": "Mar (5w)",
-				"ISO Quarter (13 Weeks)": "Q1",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			14: {
-				"ISO Month (4 Weeks)": "Apr (4w)",
-				"ISO Month (4 + 5 + 4)": "Apr (4w)",
-				"ISO Month (4 + 4 + 5)": "Apr (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			15: {
-				"ISO Month (4 Weeks)": "Apr (4w)",
-				"ISO Month (4 + 5 + 4)": "Apr (4w)",
-				"ISO Month (4 + 4 + 5)": "Apr (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			16: {
-				"ISO Month (4 Weeks)": "Apr (4w)",
-				"ISO Month (4 + 5 + 4)": "Apr (4w)",
-				"ISO Month (4 + 4 + 5)": "Apr (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			17: {
-				"ISO Month (4 Weeks)": "May (4w)",
-				"ISO Month (4 + 5 + 4)": "Apr (4w)",
-				"ISO Month (4 + 4 + 5)": "Apr (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			18: {
-				"ISO Month (4 Weeks)": "May (4w)",
-				"ISO Month (4 + 5 + 4)": "May (5w)",
-				"ISO Month (4 + 4 + 5)": "May (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			19: {
-				"ISO Month (4 Weeks)": "May (4w)",
-				"ISO Month (4 + 5 + 4)": "May (5w)",
-				"ISO Month (4 + 4 + 5)": "May (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			20: {
-				"ISO Month (4 Weeks)": "May (4w)",
-				"ISO Month (4 + 5 + 4)": "May (5w)",
-				"ISO Month (4 + 4 + 5)": "May (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			21: {
-				"ISO Month (4 Weeks)": "Jun (4w)",
-				"ISO Month (4 + 5 + 4)": "May (5w)",
-				"ISO Month (4 + 4 + 5)": "May (4w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			22: {
-				"ISO Month (4 Weeks)": "Jun (4w)",
-				"ISO Month (4 + 5 + 4)": "May (5w)",
-				"ISO Month (4 + 4 + 5)": "Jun (5w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			23: {
-				"ISO Month (4 Weeks)": "Jun (4w)",
-				"ISO Month (4 + 5 + 4)": "Jun (4w)",
-				"ISO Month (4 + 4 + 5)": "Jun (5w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			24: {
-				"ISO Month (4 Weeks)": "Jun (4w)",
-				"ISO Month (4 + 5 + 4)": "Jun (4w)",
-				"ISO Month (4 + 4 + 5)": "Jun (5w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			25: {
-				"ISO Month (4 Weeks)": "Jul (4w)",
-				"ISO Month (4 + 5 + 4)": "Jun (4w)",
-				"ISO Month (4 + 4 + 5)": "Jun (5w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			26: {
-				"ISO Month (4 Weeks)": "Jul (4w)",
-				"ISO Month (4 + 5 + 4)": "Jun (4w)",
-				"ISO Month (4 + 4 + 5)": "Jun (5w)",
-				"ISO Quarter (13 Weeks)": "Q2",
-				"ISO Semiannual (26 Weeks)": "HY1",
-			},
-			27: {
-				"ISO Month (4 Weeks)": "Jul (4w)",
-				"ISO Month (4 + 5 + 4)": "Jul (4w)",
-				"ISO Month (4 + 4 + 5)": "Jul (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			28: {
-				"ISO Month (4 Weeks)": "Jul (4w)",
-				"ISO Month (4 + 5 + 4)": "Jul (4w)",
-				"ISO Month (4 + 4 + 5)": "Jul (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			29: {
-				"ISO Month (4 Weeks)": "Aug (4w)",
-				"ISO Month (4 + 5 + 4)": "Jul (4w)",
-				"ISO Month (4 + 4 + 5)": "Jul (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			30: {
-				"ISO Month (4 Weeks)": "Aug (4w)",
-				"ISO Month (4 + 5 + 4)": "Jul (4w)",
-				"ISO Month (4 + 4 + 5)": "Jul (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			31: {
-				"ISO Month (4 Weeks)": "Aug (4w)",
-				"ISO Month (4 + 5 + 4)": "Aug (5w)",
-				"ISO Month (4 + 4 + 5)": "Aug (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			32: {
-				"ISO Month (4 Weeks)": "Aug (4w)",
-				"ISO Month (4 + 5 + 4)": "Aug (5w)",
-				"ISO Month (4 + 4 + 5)": "Aug (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			33: {
-				"ISO Month (4 Weeks)": "Sep (4w)",
-				"ISO Month (4 + 5 + 4)": "Aug (5w)",
-				"ISO Month (4 + 4 + 5)": "Aug (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			34: {
-				"ISO Month (4 Weeks)": "Sep (4w)",
-				"ISO Month (4 + 5 + 4)": "Aug (5w)",
-				"ISO Month (4 + 4 + 5)": "Aug (4w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			35: {
-				"ISO Month (4 Weeks)": "Sep (4w)",
-				"ISO Month (4 + 5 + 4)": "Aug (5w)",
-				"ISO Month (4 + 4 + 5)": "Sep (5w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			36: {
-				"ISO Month (4 Weeks)": "Sep (4w)",
-				"ISO Month (4 + 5 + 4)": "Sep (4w)",
-				"ISO Month (4 + 4 + 5)": "Sep (5w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			37: {
-				"ISO Month (4 Weeks)": "Oct (4w)",
-				"ISO Month (4 + 5 + 4)": "Sep (4w)",
-				"ISO Month (4 + 4 + 5)": "Sep (5w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			38: {
-				"ISO Month (4 Weeks)": "Oct (4w)",
-				"ISO Month (4 + 5 + 4)": "Sep (4w)",
-				"ISO Month (4 + 4 + 5)": "Sep (5w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			39: {
-				"ISO Month (4 Weeks)": "Oct (4w)",
-				"ISO Month (4 + 5 + 4)": "Sep (4w)",
-				"ISO Month (4 + 4 + 5)": "Sep (5w)",
-				"ISO Quarter (13 Weeks)": "Q3",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			40: {
-				"ISO Month (4 Weeks)": "Oct (4w)",
-				"ISO Month (4 + 5 + 4)": "Oct (4w)",
-				"ISO Month (4 + 4 + 5)": "Oct (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			41: {
-				"ISO Month (4 Weeks)": "Nov (4w)",
-				"ISO Month (4 + 5 + 4)": "Oct (4w)",
-				"ISO Month (4 + 4 + 5)": "Oct (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			42: {
-				"ISO Month (4 Weeks)": "Nov (4w)",
-				"ISO Month (4 + 5 + 4)": "Oct (4w)",
-				"ISO Month (4 + 4 + 5)": "Oct (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			43: {
-				"ISO Month (4 Weeks)": "Nov (4w)",
-				"ISO Month (4 + 5 + 4)": "Oct (4w)",
-				"ISO Month (4 + 4 + 5)": "Oct (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			44: {
-				"ISO Month (4 Weeks)": "Nov (4w)",
-				"ISO Month (4 + 5 + 4)": "Nov (5w)",
-				"ISO Month (4 + 4 + 5)": "Nov (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			45: {
-				"ISO Month (4 Weeks)": "Dec (4w)",
-				"ISO Month (4 + 5 + 4)": "Nov (5w)",
-				"ISO Month (4 + 4 + 5)": "Nov (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			46: {
-				"ISO Month (4 Weeks)": "Dec (4w)",
-				"ISO Month (4 + 5 + 4)": "Nov (5w)",
-				"ISO Month (4 + 4 + 5)": "Nov (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			47: {
-				"ISO Month (4 Weeks)": "Dec (4w)",
-				"ISO Month (4 + 5 + 4)": "Nov (5w)",
-				"ISO Month (4 + 4 + 5)": "Nov (4w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			48: {
-				"ISO Month (4 Weeks)": "Dec (4w)",
-				"ISO Month (4 + 5 + 4)": "Nov (5w)",
-				"ISO Month (4 + 4 + 5)": "Dec (5w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			49: {
-				"ISO Month (4 Weeks)": "M13 (4w)",
-				"ISO Month (4 + 5 + 4)": "Dec (4w)",
-				"ISO Month (4 + 4 + 5)": "Dec (5w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			50: {
-				"ISO Month (4 Weeks)": "M13 (4w)",
-				"ISO Month (4 + 5 + 4)": "Dec (4w)",
-				"ISO Month (4 + 4 + 5)": "Dec (5w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			51: {
-				"ISO Month (4 Weeks)": "M13 (4w)",
-				"ISO Month (4 + 5 + 4)": "Dec (4w)",
-				"ISO Month (4 + 4 + 5)": "Dec (5w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			52: {
-				"ISO Month (4 Weeks)": "M13 (4w)",
-				"ISO Month (4 + 5 + 4)": "Dec (4w)",
-				"ISO Month (4 + 4 + 5)": "Dec (5w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-			53: {
-				"ISO Month (4 Weeks)": "M13 (5w)",
-				"ISO Month (4 + 5 + 4)": "Dec (5w)",
-				"ISO Month (4 + 4 + 5)": "Dec (6w)",
-				"ISO Quarter (13 Weeks)": "Q4",
-				"ISO Semiannual (26 Weeks)": "HY2",
-			},
-		}
+		if isinstance(bins, IntradayBins) or periodicity in INTRADAY_PERIODICITIES:
+			# Date bins keep only the dates, so intraday bins are labeled from their datetimes
+			time_idx = int(use_bin_start_date_for_label is False)
+			fmt = date_format_string or "%m/%d/%y %H:%M"
+			return [p[time_idx].strftime(fmt) for p in bins]
+
+		# Labels are cached as tuples so callers can't modify the shared value
+		key = (
+			DateBins.from_bins(bins).key(),
+			spec,
+			periodicity,
+			date_format_string,
+			date_idx,
+			first_index,
+		)
+		cached = self._labels_cache.get(key)
+		if cached is not None:
+			return list(cached)
+
+		labels = self._build_period_labels(
+			bins, periodicity, date_format_string, date_idx, first_index
+		)
+		self._labels_cache.set(key, tuple(labels))
+		return labels
 
+	def _build_period_labels(
+		self,
+		bins: list[tuple[datetime.date, datetime.date]] | DateBins,
+		periodicity: str,
+		date_format_string: str,
+		date_idx: int,
+		first_index: int = 1,
+	) -> list[str]:
+		ordinals: typing.Sequence[int]
+		if isinstance(bins, DateBins):
+			ordinals = bins.ends if date_idx else bins.starts
+		else:
+			ordinals = [p[date_idx].toordinal() for p in bins]
+
+		labeler = _ordinal_labeler(periodicity, date_format_string)
+		if labeler is not None:
+			# Labels only depend on the label date, so each distinct date is labeled once and
+			# kept for later calls. Entries are only ever added, under the lock, so a dict being
+			# filled by another thread can still be read
+			key = (PERIODICITIES.get(periodicity), periodicity, date_format_string)
+			labels = self._ordinal_labels_cache.get(key)
+			if labels is None or len(labels) > self._max_ordinal_labels:
+				labels = {}
+				self._ordinal_labels_cache.set(key, labels)
+			missing = [ordinal for ordinal in set(ordinals) if ordinal not in labels]
+			if missing:
+				new_labels = {ordinal: labeler(ordinal) for ordinal in missing}
+				with self._ordinal_labels_lock:
+					labels.update(new_labels)
+			return list(map(labels.__getitem__, ordinals))
+
+		spec = PERIODICITIES.get(periodicity)
+		if spec is not None and spec.labeler is not None:
+			return spec.labeler(spec, bins, date_idx)
+
+		yy = _year_suffixes()
 		# Entire period
 		if periodicity == "Entire Period":
 			# Returns format: "MM/DD/YY-MM/DD/YY"
 			p = bins[0]
 			return [f"{p[0].strftime('%m/%d/%y')}-{p[1].strftime('%m/%d/%y')}"]
 
-		# ISO-based periodicity
-		elif periodicity == "ISO Week":
-			# Returns format: "Week N-YY"
-			return [f"Week {iso_w}-{str(iso_y)[-2:]}" for iso_w, iso_y in iso_data]
-		elif periodicity == "ISO Biweekly":
+		bins = DateBins.from_bins(bins)
+		if periodicity == "ISO Biweekly":
 			# Returns format: "Weeks N-N YY"
-			return [
-				f"Weeks {p[0].isocalendar().week}-{p[1].isocalendar().week} {str(p[date_idx].isocalendar().year)[-2:]}"
-				for p in bins
-			]
-		elif periodicity == "ISO Annual":
-			# Returns format: "YYYY"
-			return [f"{iso_y}" for iso_w, iso_y in iso_data]
-		elif "ISO" in periodicity:
-			# Returns format: "MMM (Nw)-YY", "QN-YY", or "HYN-YY" for month, quarter, or semiannual periodicity
-			return [f"{iso_buckets[iso_w][periodicity]}-{str(iso_y)[-2:]}" for iso_w, iso_y in iso_data]
+			week_and_year = get_iso_calendar().week_and_year
+			labels = []
+			for start, end, ordinal in zip(bins.starts, bins.ends, ordinals):
+				first, last = week_and_year(start)[0], week_and_year(end)[0]
+				labels.append(f"Weeks {first}-{last} {yy[week_and_year(ordinal)[1]]}")
+			return labels
 
 		# Fiscal Weeks
-		elif periodicity == "Fiscal Weeks":
+		else:
 			# Returns format: "I (Nw)-YY"
+			fromordinal = datetime.date.fromordinal
 			return [
-				f"{i} ({int(((p[1] - p[0]).days + 1) / 7)}w)-{p[date_idx].strftime('%y')}"
-				for i, p in enumerate(bins, start=1)
+				f"{i} ({(end - start + 1) // 7}w)-{yy[fromordinal(o).year]}"
+				for i, (start, end, o) in enumerate(
+					zip(bins.starts, bins.ends, ordinals), start=first_index
+				)
 			]
 
-		# Calendar-based periodicity
-		elif periodicity in ["Calendar Month", "Monthly"]:
-			# Returns format: "MMM-YY"
-			return [p[date_idx].strftime("%b-%y") for p in bins]
-		elif periodicity in ["Calendar Quarter", "Quarterly"]:
-			# Returns format: "MM-YYQ"
-			return [f"{p[date_idx].strftime('%m-%y')}Q" for p in bins]
-		else:  # periodicity in ("Custom Days", "Weekly", "Biweekly", "Calendar Year", "Annually")
-			# Returns format: "MM/DD/YY"
-			return [p[date_idx].strftime("%m/%d/%y") for p in bins]
-
 	def _get_iso_week_and_year(self, date: datetime.date) -> tuple[int, int]:
 		"""
 		Given a datetime.date object, returns the ISO week and ISO year.
@@ -848,5 +1405,4 @@ class Period:
 		:param date: datetime.date object for which to get ISO data
 		:return: (ISO week, ISO year) for given date
 		"""
-		iso_year, iso_week, _ = date.isocalendar()
-		return iso_week, iso_year
+		return get_iso_calendar().week_and_year(date.toordinal())
@@ -0,0 +1,56 @@
+# Copyright (c) 2024, AgriTheory and contributors
+# For license information, please see license.txt
+
+
+import datetime
+import typing
+
+# Days in each month of a common year, indexed by month number (index 0 is unused)
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_leap_year(year: int) -> bool:
+	return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int) -> int:
+	return 29 if month == 2 and is_leap_year(year) else _MONTH_DAYS[month]
+
+
+def add_days(date: datetime.date, days: int) -> datetime.date:
+	"""Returns `date` moved by `days` days. Raises ValueError outside of the supported range."""
+	return datetime.date.fromordinal(date.toordinal() + days)
+
+
+def add_weeks(date: datetime.date, weeks: int) -> datetime.date:
+	"""Returns `date` moved by `weeks` weeks. Raises ValueError outside of the supported range."""
+	return datetime.date.fromordinal(date.toordinal() + weeks * 7)
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+	"""
+	Returns `date` moved by `months` months, clamping the day to the end of the resulting month
+	(e.g. January 31 plus one month is February 28 or 29). Raises ValueError outside of the
+	supported range.
+	"""
+	year, month = divmod(date.year * 12 + date.month - 1 + months, 12)
+	month += 1
+	return datetime.date(year, month, min(date.day, days_in_month(year, month)))
+
+
+def add_years(date: datetime.date, years: int) -> datetime.date:
+	"""
+	Returns `date` moved by `years` years, clamping February 29 to February 28 in common years.
+	Raises ValueError outside of the supported range.
+	"""
+	year = date.year + years
+	return datetime.date(year, date.month, min(date.day, days_in_month(year, date.month)))
+
+
+# Date stepping functions by date part
+STEPS: dict[str, typing.Callable[[datetime.date, int], datetime.date]] = {
+	"days": add_days,
+	"weeks": add_weeks,
+	"months": add_months,
+	"years": add_years,
+}
@@ -4,44 +4,85 @@
 
 import typing
 import warnings
+from dataclasses import dataclass, field
 from decimal import Decimal
 from itertools import cycle
 
 
-class Forecast:
-	"""
-	The input data must be Decimal objects. Should be structured as a list of lists which are in
-	chronological order (the most historical/oldest data is the first list, the most recent data is the
-	last list).
-	"""
+if typing.TYPE_CHECKING:
+	import datetime
 
-	data: list = []
-	forecast: list | None = None
+	from .date_binning import DateBins
 
-	def __init__(self, **kwargs):
-		self.__dvzero = Decimal("0.0")
-		self.__dvone = Decimal("1.0")
-		self.__dvtwo = Decimal("2.0")
-		self.__dvhundred = Decimal("100.0")
-		self(**kwargs)
 
-	def __call__(
-		self, data: typing.Sequence[typing.Sequence[Decimal]] | None, **kwargs
-	) -> "Forecast":
-		if not self.data and not data:
+DVZERO = Decimal("0.0")
+DVONE = Decimal("1.0")
+DVTWO = Decimal("2.0")
+DVHUNDRED = Decimal("100.0")
+
+
+@dataclass(frozen=True, slots=True, init=False)
+class ForecastModel:
+	"""
+	Immutable, stateless counterpart to `Forecast`. The provided data is validated and frozen into
+	a tuple of tuples on creation, and every forecast method returns a new list of Decimal values
+	instead of storing it on the instance, so a single model can be shared freely across threads.
+
+	The input data must be Decimal objects. Should be structured as a sequence of sequences which
+	are in chronological order (the most historical/oldest data is the first sequence, the most
+	recent data is the last sequence). None values are replaced with 0.0.
+	"""
+
+	data: tuple[tuple[Decimal, ...], ...]
+	flat_data: tuple[Decimal, ...] = field(init=False, repr=False, compare=False)
+
+	methods: typing.ClassVar[tuple[str, ...]] = (
+		"percent_over_previous_period",
+		"calculated_percent_over_previous_period",
+		"previous_period_to_current_period",
+		"moving_average",
+		"linear_approximation",
+		"least_squares_regression",
+		"second_degree_approximation",
+		"flexible_method",
+		"weighted_moving_average",
+		"linear_smoothing",
+		"exponential_smoothing",
+		"exponential_smoothing_with_trend_and_seasonality",
+		"croston",
+		"sba",
+		"tsb",
+	)
+
+	def __init__(self, data: typing.Sequence[typing.Sequence[Decimal | None]]):
+		if not data:
 			raise Exception("There is no data to forecast.")
 
 		# Replace None values with 0.0
-		self.data = [[n if n else self.__dvzero for n in lst] for lst in data] if data else []
+		frozen = tuple(tuple(n if n else DVZERO for n in lst) for lst in data)
 
 		# Verify data is of Decimal type
-		for n in self.data:
+		for n in frozen:
 			if any([not isinstance(m, Decimal) for m in n]):
 				raise TypeError("Data must be of type Decimal.")
 
-		return self
+		object.__setattr__(self, "data", frozen)
+		object.__setattr__(self, "flat_data", tuple(item for sublist in frozen for item in sublist))
 
-	def percent_over_previous_period(self, percent: Decimal, n: int | None = None) -> "Forecast":
+	def run(self, method: str, **kwargs) -> list[Decimal]:
+		"""
+		Dispatches to the forecast method named `method` with the given keyword arguments.
+
+		:param method: the name of one of the forecast methods listed in `ForecastModel.methods`
+		:return: the forecasted values
+		"""
+		if method not in self.methods:
+			raise ValueError(f"Unknown forecast method: {method}.")
+		return getattr(self, method)(**kwargs)
+
+	def percent_over_previous_period(
+		self, percent: Decimal, n: int | None = None
+	) -> list[Decimal]:
 		"""
 		Applies the given percent to the items in the most recent provided data to generate the
 		forecasted data.
@@ -55,15 +96,11 @@ class Forecast:
 
 		n = n or len(self.data[-1])
 		previous_period = cycle(self.data[-1])
-		self.forecast = [
-			next(previous_period) * (self.__dvone + (percent / self.__dvhundred)) for _ in range(n)
-		]
-
-		return self
+		return [next(previous_period) * (DVONE + (percent / DVHUNDRED)) for _ in range(n)]
 
 	def calculated_percent_over_previous_period(
 		self, periods: int = 0, n: int | None = None
-	) -> "Forecast":
+	) -> list[Decimal]:
 		"""
 		Calculates the percent change of the most recent provided data over the second most recent
 		provided data and applies that rate to the values starting with the most recent provided
@@ -94,19 +131,15 @@ class Forecast:
 				UserWarning,
 			)
 
-		n_minus_2_data = sum(self.data[-2][-periods:])
-		n_minus_1_data = sum(self.data[-1][-periods:])
-		percent = ((n_minus_1_data / n_minus_2_data) - self.__dvone) * self.__dvhundred
+		n_minus_2_data = sum(self.data[-2][-periods:], Decimal(0))
+		n_minus_1_data = sum(self.data[-1][-periods:], Decimal(0))
+		percent = ((n_minus_1_data / n_minus_2_data) - DVONE) * DVHUNDRED
 
 		n = n or len(self.data[-1])
 		previous_period = cycle(self.data[-1])
-		self.forecast = [
-			next(previous_period) * (self.__dvone + (percent / self.__dvhundred)) for _ in range(n)
-		]
-
-		return self
+		return [next(previous_period) * (DVONE + (percent / DVHUNDRED)) for _ in range(n)]
 
-	def previous_period_to_current_period(self, n: int | None = None) -> "Forecast":
+	def previous_period_to_current_period(self, n: int | None = None) -> list[Decimal]:
 		"""
 		Generates the forecasted data by setting it equal to the most recent provided data with
 		no changes. If `n` is given and requires more periods to forecast than are in the recent
@@ -117,11 +150,9 @@ class Forecast:
 		"""
 		n = n or len(self.data[-1])
 		previous_period = cycle(self.data[-1])
-		self.forecast = [next(previous_period) for _ in range(n)]
-
-		return self
+		return [next(previous_period) for _ in range(n)]
 
-	def moving_average(self, periods: int, n: int | None = None) -> "Forecast":
+	def moving_average(self, periods: int, n: int | None = None) -> list[Decimal]:
 		"""
 		Generates the forecasted data by calculating a moving average of the prior number of
 		`periods` in the provided data.
@@ -130,22 +161,20 @@ class Forecast:
 		:param n: the number of periods to forecast. If None, the forecast is same length as the
 		most recent previous period, which is stored as the last sequence in `data`
 		"""
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
-		if (periods - 1) > len(self.__flat_data):
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
+		if (periods - 1) > len(self.flat_data):
 			raise Exception("Cannot average more periods than existing in data.")
 
 		n = n or len(self.data[-1])
-		moving_average = _data[-periods:]
+		moving_average = list(_data[-periods:])
 		for i in range(n):
 			moving_average.append(mean(moving_average[-periods:]))
 
 		# Remove the historical data needed for the first several forecast period calcs
 		del moving_average[:periods]
-		self.forecast = moving_average
-
-		return self
+		return moving_average
 
-	def linear_approximation(self, periods: int, n: int | None = None) -> "Forecast":
+	def linear_approximation(self, periods: int, n: int | None = None) -> list[Decimal]:
 		"""
 		Extrapolates the slope, or trend line, from the most recent value in the provided data to
 		the value that is `periods` back from it, then applies that trend to the most recent
@@ -157,7 +186,7 @@ class Forecast:
 		:param n: the number of periods to forecast. If None, the forecast is same length as the
 		most recent previous period, which is stored as the last sequence in `data`
 		"""
-		_data = self.__flat_data if periods >= len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods >= len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception(
 				"Cannot calculate the linear approximation slope for more periods than existing in data."
@@ -165,11 +194,9 @@ class Forecast:
 
 		n = n or len(self.data[-1])
 		slope = (_data[-1] - _data[-periods - 1]) / Decimal(periods)
-		self.forecast = [_data[-1] + (slope * Decimal(i + 1)) for i in range(n)]
-
-		return self
+		return [_data[-1] + (slope * Decimal(i + 1)) for i in range(n)]
 
-	def least_squares_regression(self, periods: int, n: int | None = None) -> "Forecast":
+	def least_squares_regression(self, periods: int, n: int | None = None) -> list[Decimal]:
 		"""
 		Finds a line of best fit via the Least Squares Regression method using the given `periods`
 		of provided data. It applies the calculated slope (m) and intercept (b) to generate the
@@ -180,18 +207,16 @@ class Forecast:
 		most recent previous period, which is stored as the last sequence in `data`
 		"""
 		x = [Decimal(i) for i in range(1, periods + 1)]
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception("Cannot determine line of best fit using more periods than existing in data.")
 
-		y = _data[-periods:]
+		y = list(_data[-periods:])
 		n = n or len(self.data[-1])
 		slope, intercept, _, _, _ = linregress(x, y)
-		self.forecast = [(Decimal(i) * slope) + intercept for i in range(periods + 1, periods + 1 + n)]
-
-		return self
+		return [(Decimal(i) * slope) + intercept for i in range(periods + 1, periods + 1 + n)]
 
-	def second_degree_approximation(self, periods: int, n: int | None = None) -> "Forecast":
+	def second_degree_approximation(self, periods: int, n: int | None = None) -> list[Decimal]:
 		"""
 		Fits a second-degree polynomial of the form y = a + bx + cx^2 using the given `periods` of
 		provided data as inputs. It applies the calculated coefficients (a, b, and c) to generate
@@ -203,21 +228,21 @@ class Forecast:
 		most recent previous period, which is stored as the last sequence in `data`
 		"""
 		x = [Decimal(i) for i in range(1, periods + 1)]
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception(
 				"Cannot determine second-degree polynomial trend using more periods than existing in data."
 			)
-		y = _data[-periods:]
+		y = list(_data[-periods:])
 		n = n or len(self.data[-1])
 		c, b, a = polyfit(x, y, deg=2)
-		self.forecast = [
+		return [
 			a + (b * Decimal(i)) + (c * (Decimal(i) ** 2)) for i in range(periods + 1, periods + 1 + n)
 		]
 
-		return self
-
-	def flexible_method(self, percent: Decimal, periods: int, n: int | None = None) -> "Forecast":
+	def flexible_method(
+		self, percent: Decimal, periods: int, n: int | None = None
+	) -> list[Decimal]:
 		"""
 		Applies the given `percent` growth rate to provided data, starting with `periods` most
 		recent value.
@@ -232,25 +257,22 @@ class Forecast:
 		if not isinstance(percent, Decimal):
 			raise TypeError("percent must be of type Decimal.")
 
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception("Cannot build forecast off a period farther back from what's in existing data.")
 
-		flexible_method = _data[-periods:]
+		flexible_method = list(_data[-periods:])
 		n = n or len(self.data[-1])
 		for i in range(n):
-			flexible_method.append(flexible_method[i] * (self.__dvone + (percent / self.__dvhundred)))
+			flexible_method.append(flexible_method[i] * (DVONE + (percent / DVHUNDRED)))
 
 		# Remove the historical data needed for the first several forecast period calcs
 		del flexible_method[:periods]
-
-		self.forecast = flexible_method
-
-		return self
+		return flexible_method
 
 	def weighted_moving_average(
 		self, periods: int, weights: list | tuple, n: int | None = None
-	) -> "Forecast":
+	) -> list[Decimal]:
 		"""
 		Similar to moving average, but applies the given `weights` to the `periods` included in
 		the average to generate the forecasted values.
@@ -266,17 +288,17 @@ class Forecast:
 		if any([not isinstance(w, Decimal) for w in weights]):
 			raise TypeError("Weights must be of type Decimal.")
 
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception("Cannot average more periods than existing in data.")
-		if abs(sum(weights) - self.__dvone) > Decimal("1e-13"):
+		if abs(sum(weights) - DVONE) > Decimal("1e-13"):
 			raise Exception(f"The sum of the weights must total 1. The given values sum to {sum(weights)}")
 		if len(weights) != periods:
 			raise Exception(
 				f"Weights must have as many elements as periods. Weights: {len(weights)} Periods: {periods}."
 			)
 
-		weighted_moving_average_data = _data[-periods:]
+		weighted_moving_average_data = list(_data[-periods:])
 
 		n = n or len(self.data[-1])
 		for i in range(n):
@@ -286,11 +308,9 @@ class Forecast:
 
 		# Remove the historical data needed for the first several forecast period calcs
 		del weighted_moving_average_data[:periods]
-		self.forecast = weighted_moving_average_data
+		return weighted_moving_average_data
 
-		return self
-
-	def linear_smoothing(self, periods: int, n: int | None = None) -> "Forecast":
+	def linear_smoothing(self, periods: int, n: int | None = None) -> list[Decimal]:
 		"""
 		Similar to the weighted moving average method, but instead of user-provided weights, uses
 		linearly-increasing weight values based on the number of `periods`. The calculated weights
@@ -300,27 +320,30 @@ class Forecast:
 		:param n: the number of periods to forecast. If None, the forecast is same length as the
 		most recent previous period, which is stored as the last sequence in `data`
 		"""
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception("Cannot average more periods than existing in data.")
 
-		W = ((Decimal(periods) ** 2) + Decimal(periods)) / self.__dvtwo
+		W = ((Decimal(periods) ** 2) + Decimal(periods)) / DVTWO
 		weights = [Decimal(n) / W for n in range(1, periods + 1)]
-		linear_smoothing_data = _data[-periods:]
+		linear_smoothing_data = list(_data[-periods:])
 
 		n = n or len(self.data[-1])
 		for i in range(n):
 			linear_smoothing_data.append(
-				sum(weights[j] * linear_smoothing_data[i : i + periods][j] for j in range(len(weights)))
+				sum(
+					(weights[j] * linear_smoothing_data[i : i + periods][j] for j in range(len(weights))),
+					Decimal(0),
+				)
 			)
 
 		# Remove the historical data needed for the first several forecast period calcs
 		del linear_smoothing_data[:periods]
-		self.forecast = linear_smoothing_data
-
-		return self
+		return linear_smoothing_data
 
-	def exponential_smoothing(self, periods: int, alpha: Decimal, n: int | None = None) -> "Forecast":
+	def exponential_smoothing(
+		self, periods: int, alpha: Decimal, n: int | None = None
+	) -> list[Decimal]:
 		"""
 		Calculates a smoothed average over the given number of `periods` in the provided data and
 		uses the last calculated value for all forecasted periods. `alpha` is the smoothing
@@ -337,7 +360,7 @@ class Forecast:
 		if not (0 <= alpha <= 1):
 			raise Exception("alpha must be a value between 0 and 1.")
 
-		_data = self.__flat_data if periods > len(self.data[-1]) else self.data[-1]
+		_data = self.flat_data if periods > len(self.data[-1]) else self.data[-1]
 		if (periods - 1) > len(_data):
 			raise Exception("Cannot exponentially smooth over more periods than existing in data.")
 		smoothed = [_data[-periods]]
@@ -345,11 +368,9 @@ class Forecast:
 
 		n = n or len(self.data[-1])
 		for i, d in enumerate(values):
-			smoothed.append(alpha * d + (self.__dvone - alpha) * smoothed[i])
-
-		self.forecast = [smoothed[-1]] * n
+			smoothed.append(alpha * d + (DVONE - alpha) * smoothed[i])
 
-		return self
+		return [smoothed[-1]] * n
 
 	def exponential_smoothing_with_trend_and_seasonality(
 		self,
@@ -357,7 +378,7 @@ class Forecast:
 		beta: Decimal,
 		n: int | None = None,
 		seasonality: list[Decimal] | tuple[Decimal] | None = None,
-	) -> "Forecast":
+	) -> list[Decimal]:
 		"""
 		This method calculates a trend, a seasonal index, and an exponentially smoothed average
 		from the provided data. It applies the trend to project the forecast, then adjusts that
@@ -402,14 +423,14 @@ class Forecast:
 
 		# Initialize first value for de-seasonalized averages and trends
 		averages = [self.data[-1][0] / next(avg_seasonality)]
-		trends = [self.__dvzero]
+		trends = [DVZERO]
 
 		# Calculate the remaining averages and trends in provided data
 		for i in range(1, len(self.data[-1])):
 			A_t = (alpha * (self.data[-1][i] / next(avg_seasonality))) + (
-				(self.__dvone - alpha) * (averages[i - 1] + trends[i - 1])
+				(DVONE - alpha) * (averages[i - 1] + trends[i - 1])
 			)
-			T_t = beta * (A_t - averages[i - 1]) + ((self.__dvone - beta) * trends[i - 1])
+			T_t = beta * (A_t - averages[i - 1]) + ((DVONE - beta) * trends[i - 1])
 			averages.append(A_t)
 			trends.append(T_t)
 
@@ -419,13 +440,258 @@ class Forecast:
 			F = (averages[-1] + (trends[-1] * Decimal(m))) * next(fc_seasonality)
 			exponential_smoothing_trend_seasonality.append(F)
 
-		self.forecast = exponential_smoothing_trend_seasonality
+		return exponential_smoothing_trend_seasonality
+
+	def croston(self, alpha: Decimal, n: int | None = None) -> list[Decimal]:
+		"""
+		Croston's method for intermittent (mostly zero) demand. Smooths the non-zero demand sizes
+		and the intervals between them separately and forecasts their ratio for all periods. Only
+		the non-zero values in the provided data are visited, see `croston_sparse`.
+
+		:param alpha: the smoothing parameter, must be a value between 0 and 1
+		:param n: the number of periods to forecast. If None, the forecast is same length as the
+		most recent previous period, which is stored as the last sequence in `data`
+		"""
+		points, length = to_sparse(self.flat_data)
+		return croston_sparse(points, length, alpha, n or len(self.data[-1]))
+
+	def sba(self, alpha: Decimal, n: int | None = None) -> list[Decimal]:
+		"""
+		Syntetos-Boylan Approximation: Croston's method with the bias correction factor
+		(1 - alpha / 2) applied to the forecast.
+
+		:param alpha: the smoothing parameter, must be a value between 0 and 1
+		:param n: the number of periods to forecast. If None, the forecast is same length as the
+		most recent previous period, which is stored as the last sequence in `data`
+		"""
+		points, length = to_sparse(self.flat_data)
+		return croston_sparse(points, length, alpha, n or len(self.data[-1]), bias_correction=True)
+
+	def tsb(self, alpha: Decimal, beta: Decimal, n: int | None = None) -> list[Decimal]:
+		"""
+		Teunter-Syntetos-Babai method for intermittent demand. Smooths the non-zero demand sizes
+		and the probability of a demand occurring in a period, which decays through periods
+		without demand, and forecasts their product for all periods.
+
+		:param alpha: the demand size smoothing parameter, must be a value between 0 and 1
+		:param beta: the demand probability smoothing parameter, must be a value between 0 and 1
+		:param n: the number of periods to forecast. If None, the forecast is same length as the
+		most recent previous period, which is stored as the last sequence in `data`
+		"""
+		points, length = to_sparse(self.flat_data)
+		return tsb_sparse(points, length, alpha, beta, n or len(self.data[-1]))
+
+
+class Forecast:
+	"""
+	The input data must be Decimal objects. Should be structured as a list of lists which are in
+	chronological order (the most historical/oldest data is the first list, the most recent data is the
+	last list).
+
+	`Forecast` is a mutable convenience wrapper around `ForecastModel`: each method stores its
+	result in `forecast` and returns the instance for chaining. Use `ForecastModel` (or
+	`run_method`) directly when an instance needs to be shared between threads.
+
+	If the data was binned with `Period.get_date_bins`, pass those `bins` along with their
+	`periodicity` and `custom_period` to get the bins and labels of the forecasted periods from
+	`horizon_bins` and `horizon_labels`. Passing new data without bins clears them.
+	"""
+
+	def __init__(self, **kwargs):
+		self._model: ForecastModel | None = None
+		self.forecast: list | None = None
+		self.bins: list[tuple[datetime.date, datetime.date]] | DateBins | None = None
+		self.periodicity: str | None = None
+		self.custom_period: int | list[int] = 1
+		self(**kwargs)
+
+	def __call__(
+		self,
+		data: typing.Sequence[typing.Sequence[Decimal | None]] | None = None,
+		bins: "list[tuple[datetime.date, datetime.date]] | DateBins | None" = None,
+		periodicity: str | None = None,
+		custom_period: int | list[int] = 1,
+		**kwargs,
+	) -> "Forecast":
+		if not self._model and not data:
+			raise Exception("There is no data to forecast.")
+
+		# Keep the previously provided data if none is given
+		if data:
+			self._model = ForecastModel(data)
+
+		# Bins given with earlier data don't describe new data
+		if data or bins:
+			self.bins = bins or None
+			self.periodicity = periodicity
+			self.custom_period = custom_period
 
 		return self
 
+	def horizon_bins(self, n: int | None = None) -> typing.Iterator[tuple]:
+		"""
+		Lazily yields the date bins of the forecasted periods, continuing on from the last of the
+		history `bins`. See `Period.iter_horizon_bins`.
+
+		:param n: the number of bins to yield. If None, yields one bin per value in `forecast`
+		:return: iterator of tuples in form `(datetime.date object, datetime.date object)`
+		"""
+		if not self.bins:
+			raise ValueError("Horizon bins require the date bins of the forecast data.")
+
+		if n is None:
+			if self.forecast is None:
+				raise ValueError("There is no forecast to generate bins for.")
+			n = len(self.forecast)
+
+		from .date_binning import Period
+
+		return Period().iter_horizon_bins(self.bins, n, self.periodicity, self.custom_period)
+
+	def horizon_labels(self, n: int | None = None, date_format_string: str = "") -> list[str]:
+		"""
+		Returns the labels of the forecasted periods' date bins. See `horizon_bins` and
+		`Period.get_period_labels`.
+
+		:param n: the number of labels to return. If None, returns one label per value in
+		`forecast`
+		:param date_format_string: a custom strftime format string for the labels
+		:return: the labels for the forecasted periods
+		"""
+		from .date_binning import Period
+
+		bins = list(self.horizon_bins(n))
+		first_index = 1
+		if bins and self.bins and self.periodicity == "Fiscal Weeks":
+			# Continue the history's bin numbers; a first bin that completes the last history bin
+			# keeps its number
+			first_index += Period().bin_index(
+				bins[0][0], self.bins[0][0], self.periodicity, self.custom_period
+			)
+		return Period().get_period_labels(
+			bins, self.periodicity, date_format_string, first_index=first_index
+		)
+
 	@property
-	def __flat_data(self):
-		return [item for sublist in self.data for item in sublist]
+	def model(self) -> ForecastModel:
+		"""The `ForecastModel` of the provided data. Raises an exception if no data was given."""
+		if self._model is None:
+			raise Exception("There is no data to forecast.")
+		return self._model
+
+	@model.setter
+	def model(self, model: ForecastModel) -> None:
+		self._model = model
+
+	@property
+	def data(self) -> list[list[Decimal]]:
+		return [list(segment) for segment in self._model.data] if self._model else []
+
+	@data.setter
+	def data(self, data: typing.Sequence[typing.Sequence[Decimal | None]]) -> None:
+		self._model = ForecastModel(data)
+
+	def percent_over_previous_period(self, percent: Decimal, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.percent_over_previous_period`."""
+		self.forecast = self.model.percent_over_previous_period(percent, n)
+		return self
+
+	def calculated_percent_over_previous_period(
+		self, periods: int = 0, n: int | None = None
+	) -> "Forecast":
+		"""See `ForecastModel.calculated_percent_over_previous_period`."""
+		self.forecast = self.model.calculated_percent_over_previous_period(periods, n)
+		return self
+
+	def previous_period_to_current_period(self, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.previous_period_to_current_period`."""
+		self.forecast = self.model.previous_period_to_current_period(n)
+		return self
+
+	def moving_average(self, periods: int, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.moving_average`."""
+		self.forecast = self.model.moving_average(periods, n)
+		return self
+
+	def linear_approximation(self, periods: int, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.linear_approximation`."""
+		self.forecast = self.model.linear_approximation(periods, n)
+		return self
+
+	def least_squares_regression(self, periods: int, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.least_squares_regression`."""
+		self.forecast = self.model.least_squares_regression(periods, n)
+		return self
+
+	def second_degree_approximation(self, periods: int, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.second_degree_approximation`."""
+		self.forecast = self.model.second_degree_approximation(periods, n)
+		return self
+
+	def flexible_method(self, percent: Decimal, periods: int, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.flexible_method`."""
+		self.forecast = self.model.flexible_method(percent, periods, n)
+		return self
+
+	def weighted_moving_average(
+		self, periods: int, weights: list | tuple, n: int | None = None
+	) -> "Forecast":
+		"""See `ForecastModel.weighted_moving_average`."""
+		self.forecast = self.model.weighted_moving_average(periods, weights, n)
+		return self
+
+	def linear_smoothing(self, periods: int, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.linear_smoothing`."""
+		self.forecast = self.model.linear_smoothing(periods, n)
+		return self
+
+	def exponential_smoothing(self, periods: int, alpha: Decimal, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.exponential_smoothing`."""
+		self.forecast = self.model.exponential_smoothing(periods, alpha, n)
+		return self
+
+	def exponential_smoothing_with_trend_and_seasonality(
+		self,
+		alpha: Decimal,
+		beta: Decimal,
+		n: int | None = None,
+		seasonality: list[Decimal] | tuple[Decimal] | None = None,
+	) -> "Forecast":
+		"""See `ForecastModel.exponential_smoothing_with_trend_and_seasonality`."""
+		self.forecast = self.model.exponential_smoothing_with_trend_and_seasonality(
+			alpha, beta, n, seasonality
+		)
+		return self
+
+	def croston(self, alpha: Decimal, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.croston`."""
+		self.forecast = self.model.croston(alpha, n)
+		return self
+
+	def sba(self, alpha: Decimal, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.sba`."""
+		self.forecast = self.model.sba(alpha, n)
+		return self
+
+	def tsb(self, alpha: Decimal, beta: Decimal, n: int | None = None) -> "Forecast":
+		"""See `ForecastModel.tsb`."""
+		self.forecast = self.model.tsb(alpha, beta, n)
+		return self
+
+
+def run_method(
+	data: typing.Sequence[typing.Sequence[Decimal | None]], method: str, **kwargs
+) -> list[Decimal]:
+	"""
+	Stateless functional entry point: builds a `ForecastModel` from `data` and returns the result
+	of the forecast method named `method`, called with the given keyword arguments.
+
+	:param data: sequence of sequences of Decimal historical data in chronological order. None
+	values are replaced with 0.0
+	:param method: the name of one of the forecast methods listed in `ForecastModel.methods`
+	:return: the forecasted values
+	"""
+	return ForecastModel(data).run(method, **kwargs)
 
 
 def mean(x):
@@ -599,6 +865,132 @@ def linregress(x, y, alternative="two-sided"):
 	return slope, intercept, rvalue, pvalue, slope_stderr
 
 
+def to_sparse(
+	series: typing.Sequence[Decimal | None],
+) -> tuple[list[tuple[int, Decimal]], int]:
+	"""
+	Encodes a series as its non-zero values and their indices.
+
+	:param series: sequence of Decimal values; None is treated as zero
+	:return: the list of (index, value) pairs of the non-zero values, and the series length
+	"""
+	return [(i, v) for i, v in enumerate(series) if v], len(series)
+
+
+def _validate_smoothing_parameter(name: str, value: Decimal) -> None:
+	if not isinstance(value, Decimal):
+		raise TypeError(f"{name} must be of type Decimal.")
+	if not (0 <= value <= 1):
+		raise Exception(f"{name} must be a value between 0 and 1.")
+
+
+def croston_sparse(
+	points: typing.Sequence[tuple[int, Decimal]],
+	length: int,
+	alpha: Decimal,
+	n: int,
+	bias_correction: bool = False,
+) -> list[Decimal]:
+	"""
+	Croston's method over a sparse series. The demand size and the interval between demands
+	are only updated when a demand occurs, so the cost scales with the number of non-zero
+	values rather than the series length. The first demand initializes the size, and its
+	position (counting from one) initializes the interval.
+
+	:param points: (index, value) pairs of the non-zero values in ascending index order
+	:param length: the length of the full series
+	:param alpha: the smoothing parameter, must be a value between 0 and 1
+	:param n: the number of periods to forecast
+	:param bias_correction: if True, applies the Syntetos-Boylan (SBA) factor (1 - alpha / 2)
+	:return: `n` forecasted values
+	"""
+	_validate_smoothing_parameter("alpha", alpha)
+	if points and not (0 <= points[0][0] and points[-1][0] < length):
+		raise ValueError("Sparse indices must fall within the series length.")
+	if not points:
+		return [DVZERO] * n
+
+	first_index, size = points[0]
+	interval = Decimal(first_index + 1)
+	previous = first_index
+	for index, value in points[1:]:
+		size += alpha * (value - size)
+		interval += alpha * (Decimal(index - previous) - interval)
+		previous = index
+
+	forecast = size / interval
+	if bias_correction:
+		forecast *= DVONE - (alpha / DVTWO)
+	return [forecast] * n
+
+
+def tsb_sparse(
+	points: typing.Sequence[tuple[int, Decimal]],
+	length: int,
+	alpha: Decimal,
+	beta: Decimal,
+	n: int,
+) -> list[Decimal]:
+	"""
+	Teunter-Syntetos-Babai method over a sparse series. The decay of the demand probability
+	through a run of k zero periods is applied in one step as (1 - beta) ** k, so the cost scales
+	with the number of non-zero values rather than the series length. The first demand
+	initializes the size, and the inverse of its position (counting from one) initializes the
+	probability.
+
+	:param points: (index, value) pairs of the non-zero values in ascending index order
+	:param length: the length of the full series
+	:param alpha: the demand size smoothing parameter, must be a value between 0 and 1
+	:param beta: the demand probability smoothing parameter, must be a value between 0 and 1
+	:param n: the number of periods to forecast
+	:return: `n` forecasted values
+	"""
+	_validate_smoothing_parameter("alpha", alpha)
+	_validate_smoothing_parameter("beta", beta)
+	if points and not (0 <= points[0][0] and points[-1][0] < length):
+		raise ValueError("Sparse indices must fall within the series length.")
+	if not points:
+		return [DVZERO] * n
+
+	decay = DVONE - beta
+	first_index, size = points[0]
+	probability = DVONE / Decimal(first_index + 1)
+	previous = first_index
+	for index, value in points[1:]:
+		# Decimal(0) ** 0 is undefined, so only decay through actual runs of zero periods
+		if index - previous > 1:
+			probability *= decay ** (index - previous - 1)
+		probability += beta * (DVONE - probability)
+		size += alpha * (value - size)
+		previous = index
+	if length - previous > 1:
+		probability *= decay ** (length - previous - 1)
+
+	return [probability * size] * n
+
+
+def intermittent_batch(
+	series: typing.Iterable[tuple[typing.Sequence[tuple[int, Decimal]], int]],
+	method: str = "croston",
+	**kwargs,
+) -> list[list[Decimal]]:
+	"""
+	Runs an intermittent demand method over many sparse series.
+
+	:param series: iterable of (points, length) pairs as returned by `to_sparse`
+	:param method: "croston", "sba" or "tsb"
+	:param kwargs: the remaining arguments of `croston_sparse` or `tsb_sparse` (`alpha`, `n`,
+	and `beta` for "tsb")
+	:return: the forecasted values for each series, in order
+	"""
+	if method in ("croston", "sba"):
+		kwargs["bias_correction"] = method == "sba"
+		return [croston_sparse(points, length, **kwargs) for points, length in series]
+	if method == "tsb":
+		return [tsb_sparse(points, length, **kwargs) for points, length in series]
+	raise ValueError(f"Unknown intermittent demand method: {method}.")
+
+
 def calculate_seasonality_factors(
 	data: typing.Sequence[typing.Sequence[Decimal]],
 ) -> list[Decimal]:
@@ -624,3 +1016,56 @@ def calculate_seasonality_factors(
 		for i in range(num_periods)
 	]
 	return seasonality
+
+
+def select_method(
+	data: typing.Sequence[typing.Sequence[Decimal]],
+	candidates: typing.Sequence[tuple[str, dict]] | None = None,
+) -> tuple[str, dict]:
+	"""
+	Chooses a forecast method for `data` by backtesting: each candidate is fit on all but the
+	most recent sequence of `data` and scored by its mean absolute error against the most recent
+	sequence. Candidates that can't be fit on the reduced data are skipped. If `data` has fewer
+	than two sequences, or no candidate can be scored, falls back to
+	"previous_period_to_current_period". Raises ValueError if the most recent sequence is empty,
+	since there is nothing to score against.
+
+	:param data: sequence of sequences of Decimal historical data in chronological order
+	:param candidates: sequence of (method name, keyword arguments) pairs to choose from. If
+	None, uses a default set of methods that don't require user-supplied factors
+	:return: the (method name, keyword arguments) pair with the lowest backtest error
+	"""
+	fallback: tuple[str, dict] = ("previous_period_to_current_period", {})
+	model = ForecastModel(data)
+	if len(model.data) < 2:
+		return fallback
+
+	actual = model.data[-1]
+	if not actual:
+		raise ValueError("The most recent sequence of data is empty, so it can't be backtested.")
+	periods = len(model.data[-2])
+	if candidates is None:
+		candidates = [
+			fallback,
+			("moving_average", {"periods": min(3, periods)}),
+			("linear_smoothing", {"periods": min(3, periods)}),
+			("exponential_smoothing", {"periods": periods, "alpha": Decimal("0.3")}),
+			("least_squares_regression", {"periods": periods}),
+		]
+	if len(model.data) > 2:
+		candidates = [*candidates, ("calculated_percent_over_previous_period", {})]
+
+	backtest = ForecastModel(model.data[:-1])
+	best, best_error = fallback, None
+	for method, kwargs in candidates:
+		try:
+			predicted = backtest.run(method, **{**kwargs, "n": len(actual)})
+		except Exception:
+			continue
+		if not predicted:
+			continue
+		error = mean([abs(p - a) for p, a in zip(predicted, actual)])
+		if best_error is None or error < best_error:
+			best, best_error = (method, kwargs), error
+
+	return best
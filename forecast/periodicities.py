@@ -0,0 +1,531 @@
+# Copyright (c) 2024, AgriTheory and contributors
+# For license information, please see license.txt
+
+
+import datetime
+import functools
+import math
+import threading
+import typing
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, cycle, islice
+from types import MappingProxyType
+
+from .calendars import (
+	MONTH_ABBREVIATIONS,
+	get_business_calendar,
+	get_iso_calendar,
+	get_retail_calendar,
+)
+from .date_math import STEPS, days_in_month
+
+
+StartDateGenerator = typing.Callable[
+	["PeriodicitySpec", datetime.date, tuple[int, ...]], typing.Iterator[datetime.date]
+]
+Labeler = typing.Callable[
+	["PeriodicitySpec", typing.Iterable[tuple[datetime.date, datetime.date]], int], list[str]
+]
+Locator = typing.Callable[
+	["PeriodicitySpec", datetime.date, tuple[int, ...], datetime.date],
+	tuple[int, datetime.date, datetime.date] | None,
+]
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodicitySpec:
+	"""
+	Immutable description of a periodicity, compiled once by `register_periodicity`. Its
+	`generator` yields the start date of each bin from a given start date on, without an end;
+	`Period` pairs consecutive start dates into bins.
+
+	:param name: the periodicity name passed to `Period` methods
+	:param generator: callable taking the spec, the start date and the step sequence, and
+	yielding bin start dates
+	:param pattern: ISO week number break points for ISO periodicities, otherwise the default
+	step sequence
+	:param iso: if the bins follow ISO weeks; ISO periodicities are labeled by ISO week and year
+	:param unit: the date part stepped by calendar periodicities ("days", "weeks", "months" or
+	"years")
+	:param anchor: for calendar periodicities, the period ("month", "quarter" or "year") whose
+	start the bins are aligned to after a leading stub bin
+	:param custom: if the step sequence is given per call by `custom_period` instead of `pattern`
+	:param labeler: optional callable taking the spec, an iterable of the `(start, end)` date
+	pairs of the bins and the index of the bin date to label by (0 for start, 1 for end), and
+	returning the default labels for the bins
+	:param locator: optional callable taking the spec, the first bin's start date, the step
+	sequence and a date, and returning the index, start date and end date of the bin the date
+	falls in (or None if it is before the first bin) without generating the preceding bins
+	"""
+
+	name: str
+	generator: StartDateGenerator
+	pattern: tuple[int, ...] = (1,)
+	iso: bool = False
+	unit: str | None = None
+	anchor: str | None = None
+	custom: bool = False
+	labeler: Labeler | None = None
+	locator: Locator | None = None
+
+	def steps(self, custom_period: int | list[int] = 1) -> tuple[int, ...]:
+		"""
+		Returns the step sequence for a call: `custom_period` for custom periodicities, otherwise
+		the spec's own pattern. Raises ValueError if `custom_period` is invalid.
+		"""
+		if not self.custom:
+			return self.pattern
+
+		if not (isinstance(custom_period, int) or isinstance(custom_period, list)) or (
+			isinstance(custom_period, list) and not all([isinstance(n, int) for n in custom_period])
+		):
+			raise ValueError("custom_period must be an integer or list of integers.")
+
+		if isinstance(custom_period, int) and custom_period < 1:
+			raise ValueError(f"{self.name} periodicity requires an integer value > 0 for custom_period.")
+
+		if isinstance(custom_period, list) and any([n < 1 for n in custom_period]):
+			raise ValueError(f"{self.name} periodicity requires integer values > 0 for custom_period.")
+
+		return (custom_period,) if isinstance(custom_period, int) else tuple(custom_period)
+
+	def start_dates(
+		self, start_date: datetime.date, steps: tuple[int, ...] | None = None
+	) -> typing.Iterator[datetime.date]:
+		"""
+		Yields the start date of each bin from `start_date` on, until the end of the supported
+		date range.
+
+		:param start_date: the date from which to start binning
+		:param steps: the step sequence, as returned by `steps`. If None, uses `pattern`
+		:return: iterator of bin start dates
+		"""
+		return self.generator(self, start_date, steps or self.pattern)
+
+
+def iso_start_dates(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...]
+) -> typing.Iterator[datetime.date]:
+	"""
+	Yields the start dates of bins grouped by the ISO week break points in `spec.pattern`. If
+	`start_date` is not the Monday of a break point week, the first bin is a partial ("stub")
+	period up to the next break point.
+	"""
+	iso = get_iso_calendar()
+	current = start_date.toordinal()
+	current_week, iso_year = iso.week_and_year(current)
+
+	# Split pattern based on where start_date falls so cycle starts with the next period
+	pattern = spec.pattern
+	index = next((i for i, n in enumerate(pattern) if current_week < n), 0)
+	seq = cycle(pattern[index:] + pattern[:index])
+
+	while True:
+		yield datetime.date.fromordinal(current)
+		week = next(seq)
+
+		# Advance year if pattern wraps (every step wraps for a single break point)
+		if current_week >= week:
+			iso_year += 1
+
+		try:
+			if week > iso.week_count(iso_year):
+				# No W53 in current year (weekly calcs only) - advance pattern and increment year
+				week = next(seq)
+				iso_year += 1
+
+			current = iso.monday(iso_year, week)
+		except ValueError:
+			# Past datetime.MAXYEAR
+			return
+		current_week = week
+
+
+def _anchor_date(date: datetime.date, anchor: str) -> datetime.date:
+	# Start of the calendar month, quarter or year that `date` falls in
+	if anchor == "month":
+		return date.replace(day=1)
+	if anchor == "quarter":
+		return date.replace(month=(date.month - 1) // 3 * 3 + 1, day=1)
+	return date.replace(month=1, day=1)
+
+
+def calendar_start_dates(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...]
+) -> typing.Iterator[datetime.date]:
+	"""
+	Yields `start_date`, then steps forward by `steps` (cycled over) of `spec.unit`. With an
+	`anchor`, a `start_date` that isn't the first day of its month, quarter or year is a stub
+	bin, and the following bins are aligned to the anchor period.
+	"""
+	assert spec.unit is not None
+	seq = cycle(steps)
+	step = STEPS[spec.unit]
+	try:
+		if spec.anchor is not None:
+			anchored = _anchor_date(start_date, spec.anchor)
+			if anchored != start_date:
+				yield start_date
+				start_date = step(anchored, next(seq))
+
+		if spec.unit in ("days", "weeks"):
+			# Fixed length steps are plain ordinal arithmetic
+			ordinal = start_date.toordinal()
+			days = 7 if spec.unit == "weeks" else 1
+			while True:
+				yield datetime.date.fromordinal(ordinal)
+				ordinal += next(seq) * days
+
+		# Month and year steps clamp to the end of the month, so each step builds on the last
+		while True:
+			yield start_date
+			start_date = step(start_date, next(seq))
+	except (OverflowError, ValueError):
+		# Past datetime.MAXYEAR
+		return
+
+
+@functools.cache
+def _month_drops(
+	year: int, month: int, day: int, steps: tuple[int, ...]
+) -> tuple[tuple[int, int], ...]:
+	"""
+	Returns the (step number, new day) pairs at which the day of the month drops when stepping
+	from `day` of `month` of `year` by `steps` months, since each step clamps to the end of the
+	month and the next steps start from the clamped day. The day drops at most three times, and
+	the sequence of visited months repeats within one 400 year Gregorian cycle, so the search
+	is bounded. `year` only matters modulo 400.
+	"""
+	drops = []
+	total = sum(steps)
+	limit = len(steps) * 4800 // math.gcd(total, 4800)
+	months = year * 12 + month - 1
+	for i, step in enumerate(islice(cycle(steps), limit), start=1):
+		if day == 28:
+			break
+		months += step
+		month_days = days_in_month(months // 12, months % 12 + 1)
+		if month_days < day:
+			day = month_days
+			drops.append((i, day))
+	return tuple(drops)
+
+
+def _month_step(anchor: datetime.date, k: int, steps: tuple[int, ...], prefix: list[int]) -> int:
+	# Ordinal of the start of the bin `k` month steps after `anchor`, with end of month drift
+	months = k // len(steps) * prefix[-1] + prefix[k % len(steps)]
+	year, month = divmod(anchor.year * 12 + anchor.month - 1 + months, 12)
+	day = anchor.day
+	if day > 28:
+		for step, clamped in _month_drops(anchor.year % 400, anchor.month, anchor.day, steps):
+			if step > k:
+				break
+			day = clamped
+	return datetime.date(year, month + 1, day).toordinal()
+
+
+def calendar_locate(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...], date: datetime.date
+) -> tuple[int, datetime.date, datetime.date] | None:
+	"""
+	Finds the bin of a calendar periodicity that `date` falls in, for bins starting on
+	`start_date`, with arithmetic on the prefix sums of the step cycle instead of stepping
+	through the preceding bins.
+
+	:return: (bin index, bin start date, bin end date), or None if `date` is before `start_date`
+	"""
+	assert spec.unit is not None
+	if date < start_date:
+		return None
+
+	first_index = 0
+	step = STEPS[spec.unit]
+	if spec.anchor is not None:
+		anchored = _anchor_date(start_date, spec.anchor)
+		if anchored != start_date:
+			# Stub bin, then aligned bins continuing the cycle from its second step
+			aligned = step(anchored, steps[0])
+			if date < aligned:
+				return 0, start_date, aligned - datetime.timedelta(days=1)
+			first_index, start_date, steps = 1, aligned, steps[1:] + steps[:1]
+
+	fromordinal = datetime.date.fromordinal
+	if spec.unit in ("days", "weeks"):
+		lengths = [n * (7 if spec.unit == "weeks" else 1) for n in steps]
+		prefix = list(accumulate(lengths, initial=0))
+		cycles, offset = divmod(date.toordinal() - start_date.toordinal(), prefix[-1])
+		j = bisect_right(prefix, offset) - 1
+		start = start_date.toordinal() + cycles * prefix[-1] + prefix[j]
+		index = cycles * len(steps) + j
+		return first_index + index, fromordinal(start), fromordinal(start + lengths[j] - 1)
+
+	# Years are stepped as 12 months, which clamps February 29 the same way
+	steps = tuple(n * 12 for n in steps) if spec.unit == "years" else steps
+	prefix = list(accumulate(steps, initial=0))
+	months = (date.year - start_date.year) * 12 + date.month - start_date.month
+	cycles, offset = divmod(months, prefix[-1])
+	index = cycles * len(steps) + bisect_right(prefix, offset) - 1
+	start = _month_step(start_date, index, steps, prefix)
+	if start > date.toordinal():
+		# Falls before the drifted start day in the same month as a bin start
+		index -= 1
+		start = _month_step(start_date, index, steps, prefix)
+	end = _month_step(start_date, index + 1, steps, prefix) - 1
+	return first_index + index, fromordinal(start), fromordinal(end)
+
+
+def retail_start_dates(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...]
+) -> typing.Iterator[datetime.date]:
+	"""
+	Yields the start dates of bins of the shared retail calendar (see `get_retail_calendar`)
+	grouped by the fiscal week offsets in `spec.pattern`. Offsets past the last week of a
+	52-week year are skipped. If `start_date` is not the first day of a bin, the first bin is a
+	stub up to the next offset.
+	"""
+	calendar = get_retail_calendar()
+	breaks = spec.pattern
+	year, week = calendar.year_and_week(start_date.toordinal())
+	i = bisect_right(breaks, week)
+
+	yield start_date
+	while True:
+		if i == len(breaks) or breaks[i] >= calendar.week_count(year):
+			year += 1
+			i = 0
+		try:
+			yield datetime.date.fromordinal(calendar.start(year) + breaks[i] * 7)
+		except (OverflowError, ValueError):
+			# Past datetime.MAXYEAR
+			return
+		i += 1
+
+
+def retail_labels(
+	spec: PeriodicitySpec,
+	bins: typing.Iterable[tuple[datetime.date, datetime.date]],
+	date_idx: int,
+) -> list[str]:
+	"""
+	Labels retail calendar bins by fiscal year, depending on the number of bins per year in
+	`spec.pattern`: "YYYY" for years, "QN-YY" for quarters, "MMM (Nw)-YY" for periods (named
+	by the calendar month they mostly fall in) and "Week N-YY" otherwise.
+	"""
+	calendar = get_retail_calendar()
+	breaks = spec.pattern
+	labels = []
+	for p in bins:
+		year, week = calendar.year_and_week(p[date_idx].toordinal())
+		i = bisect_right(breaks, week) - 1
+		yy = str(year)[-2:]
+		if len(breaks) == 1:
+			labels.append(f"{year}")
+		elif len(breaks) == 4:
+			labels.append(f"Q{i + 1}-{yy}")
+		elif len(breaks) == 12:
+			end = breaks[i + 1] if i + 1 < len(breaks) else calendar.week_count(year)
+			month = MONTH_ABBREVIATIONS[(calendar.end_month + i) % 12]
+			labels.append(f"{month} ({end - breaks[i]}w)-{yy}")
+		else:
+			labels.append(f"Week {week + 1}-{yy}")
+	return labels
+
+
+def business_day_start_dates(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...]
+) -> typing.Iterator[datetime.date]:
+	"""
+	Yields bin start dates so that each bin holds the next number of business days in `steps`
+	(cycled over) of the shared business calendar (see `get_business_calendar`). Non-business
+	days belong to the bin of the business day before them.
+	"""
+	calendar = get_business_calendar()
+	ordinal = start_date.toordinal()
+	try:
+		for step in cycle(steps):
+			yield datetime.date.fromordinal(ordinal)
+			ordinal = calendar.nth_business_day(ordinal, step + 1)
+	except (OverflowError, ValueError):
+		# Past datetime.MAXYEAR
+		return
+
+
+def business_day_locate(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...], date: datetime.date
+) -> tuple[int, datetime.date, datetime.date] | None:
+	"""
+	Finds the "Business Days" bin that `date` falls in, for bins starting on `start_date`, from
+	the business day count between them and the prefix sums of the step cycle.
+
+	:return: (bin index, bin start date, bin end date), or None if `date` is before `start_date`
+	"""
+	if date < start_date:
+		return None
+
+	calendar = get_business_calendar()
+	start = start_date.toordinal()
+	# Non-business days before the first business day belong to the first bin
+	count = calendar.total(start, date.toordinal())
+	prefix = list(accumulate(steps, initial=0))
+	cycles, offset = divmod(max(count - 1, 0), prefix[-1])
+	j = bisect_right(prefix, offset) - 1
+	before = cycles * prefix[-1] + prefix[j]
+	bin_start = calendar.nth_business_day(start, before + 1) if before else start
+	bin_end = calendar.nth_business_day(start, before + steps[j] + 1) - 1
+	fromordinal = datetime.date.fromordinal
+	return cycles * len(steps) + j, fromordinal(bin_start), fromordinal(bin_end)
+
+
+def entire_period_start_dates(
+	spec: PeriodicitySpec, start_date: datetime.date, steps: tuple[int, ...]
+) -> typing.Iterator[datetime.date]:
+	"""Yields only `start_date`, so a single bin spans the whole time span."""
+	yield start_date
+
+
+_registry: dict[str, PeriodicitySpec] = {}
+_registry_lock = threading.Lock()
+
+# Read-only view of the registered periodicities by name
+PERIODICITIES: typing.Mapping[str, PeriodicitySpec] = MappingProxyType(_registry)
+
+
+def register_periodicity(
+	name: str,
+	generator: StartDateGenerator | None = None,
+	*,
+	iso_weeks: typing.Sequence[int] | None = None,
+	unit: str | None = None,
+	step: int | list[int] = 1,
+	anchor: str | None = None,
+	custom: bool = False,
+	iso: bool = False,
+	pattern: typing.Sequence[int] | None = None,
+	labeler: Labeler | None = None,
+	locator: Locator | None = None,
+	replace: bool = False,
+) -> PeriodicitySpec:
+	"""
+	Compiles a periodicity into a `PeriodicitySpec` and adds it to the registry used by all
+	`Period` instances. Give exactly one of:
+	- `iso_weeks`: ISO week numbers that start each bin, e.g. [1, 14, 27, 40] for ISO quarters
+	- `unit` (with `step` and optionally `anchor` or `custom`): a calendar step such as
+	("months", 3)
+	- `generator`: a callable taking the spec, the start date and the step sequence and
+	yielding bin start dates from the start date on, without an end
+
+	:param name: the periodicity name passed to `Period` methods
+	:param generator: custom start date generator
+	:param iso_weeks: ascending ISO week number break points
+	:param unit: "days", "weeks", "months" or "years"
+	:param step: a single or sequence of integers to step by, cycled over
+	:param anchor: "month", "quarter" or "year"; aligns bins after a leading stub bin to the
+	start of that calendar period
+	:param custom: if the steps are given per call by `custom_period` instead of `step`
+	:param iso: for a custom `generator`, if its bins are labeled by ISO week and year
+	:param pattern: for a custom `generator`, the `PeriodicitySpec.pattern` it reads, if not
+	`step`
+	:param labeler: optional callable that returns the default labels, see `PeriodicitySpec`
+	:param locator: for a custom `generator`, optional callable that finds the bin a date falls
+	in, see `PeriodicitySpec`. Calendar periodicities get one computed from `unit` and `step`
+	:param replace: if True, replaces an existing periodicity with the same name
+	:return: the registered spec
+	"""
+	if sum(x is not None for x in (generator, iso_weeks, unit)) != 1:
+		raise ValueError("Please provide exactly one of generator, iso_weeks or unit.")
+
+	if iso_weeks is not None:
+		weeks = tuple(iso_weeks)
+		if not weeks or any(not 1 <= w <= 53 for w in weeks) or list(weeks) != sorted(set(weeks)):
+			raise ValueError("iso_weeks must be ascending ISO week numbers from 1 to 53.")
+		spec = PeriodicitySpec(name, iso_start_dates, weeks, iso=True, labeler=labeler)
+	elif unit is not None:
+		if unit not in ("days", "weeks", "months", "years"):
+			raise ValueError("unit must be 'days', 'weeks', 'months' or 'years'.")
+		if anchor not in (None, "month", "quarter", "year"):
+			raise ValueError("anchor must be 'month', 'quarter' or 'year'.")
+		steps = (step,) if isinstance(step, int) else tuple(step)
+		if not steps or any(not isinstance(n, int) or n < 1 for n in steps):
+			raise ValueError("step must be an integer or list of integers > 0.")
+		spec = PeriodicitySpec(
+			name,
+			calendar_start_dates,
+			steps,
+			unit=unit,
+			anchor=anchor,
+			custom=custom,
+			labeler=labeler,
+			locator=calendar_locate,
+		)
+	else:
+		if not callable(generator):
+			raise ValueError("generator must be callable.")
+		steps = (step,) if isinstance(step, int) else tuple(step)
+		if pattern is not None:
+			steps = tuple(pattern)
+		spec = PeriodicitySpec(
+			name, generator, steps, iso=iso, custom=custom, labeler=labeler, locator=locator
+		)
+
+	with _registry_lock:
+		if name in _registry and not replace:
+			raise ValueError(f"Periodicity {name} is already registered.")
+		_registry[name] = spec
+	return spec
+
+
+def get_periodicity(name: str) -> PeriodicitySpec:
+	"""Returns the registered spec for the periodicity `name`. Raises ValueError if unknown."""
+	try:
+		return _registry[name]
+	except KeyError:
+		raise ValueError(f"Unknown periodicity: {name}") from None
+
+
+# ISO pattern: [ISO week number period break points]
+register_periodicity("ISO Week", iso_weeks=range(1, 54))
+register_periodicity("ISO Biweekly", iso_weeks=range(1, 54, 2))
+register_periodicity("ISO Month (4 Weeks)", iso_weeks=range(1, 53, 4))
+register_periodicity(
+	"ISO Month (4 + 5 + 4)", iso_weeks=[1, 5, 10, 14, 18, 23, 27, 31, 36, 40, 44, 49]
+)
+register_periodicity(
+	"ISO Month (4 + 4 + 5)", iso_weeks=[1, 5, 9, 14, 18, 22, 27, 31, 35, 40, 44, 48]
+)
+register_periodicity("ISO Quarter (13 Weeks)", iso_weeks=[1, 14, 27, 40])
+register_periodicity("ISO Semiannual (26 Weeks)", iso_weeks=[1, 27])
+register_periodicity("ISO Annual", iso_weeks=[1])
+# Calendar pattern: date part to increment and step to increment by
+register_periodicity("Custom Days", unit="days", custom=True)
+register_periodicity("Weekly", unit="weeks")
+register_periodicity("Biweekly", unit="weeks", step=2)
+register_periodicity("Fiscal Weeks", unit="weeks", custom=True)
+register_periodicity("Calendar Month", unit="months", anchor="month")
+register_periodicity("Monthly", unit="months")
+register_periodicity("Calendar Quarter", unit="months", step=3, anchor="quarter")
+register_periodicity("Quarterly", unit="months", step=3)
+register_periodicity("Calendar Year", unit="years", anchor="year")
+register_periodicity("Annually", unit="years")
+register_periodicity("Entire Period", entire_period_start_dates)
+register_periodicity(
+	"Business Days", business_day_start_dates, custom=True, locator=business_day_locate
+)
+# Retail pattern: fiscal week offsets of the shared retail calendar's period break points
+register_periodicity("Retail Week", retail_start_dates, pattern=range(53), labeler=retail_labels)
+for _weeks in ((4, 5, 4), (4, 4, 5), (5, 4, 4)):
+	register_periodicity(
+		f"Retail Month ({' + '.join(map(str, _weeks))})",
+		retail_start_dates,
+		pattern=list(accumulate(_weeks * 4, initial=0))[:-1],
+		labeler=retail_labels,
+	)
+register_periodicity(
+	"Retail Quarter", retail_start_dates, pattern=[0, 13, 26, 39], labeler=retail_labels
+)
+register_periodicity("Retail Year", retail_start_dates, pattern=[0], labeler=retail_labels)
+
+# Sub-daily periodicities: the bin width in seconds. See `Period.get_intraday_bins`
+INTRADAY_PERIODICITIES: typing.Mapping[str, int] = MappingProxyType(
+	{"15 Minutes": 900, "30 Minutes": 1800, "Hourly": 3600}
+)
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from forecast import aio, run_method
+
+
+@pytest.fixture
+def data():
+	return [
+		[Decimal("128"), Decimal("117"), Decimal("115"), Decimal("125")],
+		[Decimal("125"), Decimal("123"), Decimal("115"), Decimal("137")],
+	]
+
+
+@pytest.fixture
+def slow_run_method(monkeypatch):
+	calls = []
+	lock = threading.Lock()
+
+	def _slow(data, method, **kwargs):
+		with lock:
+			calls.append((method, kwargs))
+		time.sleep(0.05)
+		return run_method(data, method, **kwargs)
+
+	monkeypatch.setattr(aio, "run_method", _slow)
+	return calls
+
+
+def test_run_matches_sync_result(data):
+	result = asyncio.run(aio.run(data, "moving_average", periods=2))
+	assert result == run_method(data, "moving_average", periods=2)
+
+
+def test_identical_requests_are_coalesced(data, slow_run_method):
+	async def main():
+		async with aio.ForecastService(max_workers=4) as service:
+			return await asyncio.gather(
+				*[service.run(data, "linear_smoothing", periods=3) for _ in range(8)],
+				service.run(data, "linear_smoothing", periods=2),
+			)
+
+	results = asyncio.run(main())
+	assert len(slow_run_method) == 2
+	assert all(r == results[0] for r in results[:8])
+
+
+def test_max_pending_bounds_submissions(data, monkeypatch):
+	active = []
+	peak = []
+	lock = threading.Lock()
+
+	def _tracked(data, method, **kwargs):
+		with lock:
+			active.append(1)
+			peak.append(len(active))
+		time.sleep(0.02)
+		with lock:
+			active.pop()
+		return run_method(data, method, **kwargs)
+
+	monkeypatch.setattr(aio, "run_method", _tracked)
+
+	async def main():
+		async with aio.ForecastService(max_workers=8, max_pending=2) as service:
+			await asyncio.gather(*[service.run(data, "moving_average", periods=p) for p in range(1, 7)])
+
+	asyncio.run(main())
+	assert len(peak) == 6 and max(peak) <= 2
+
+
+@pytest.fixture
+def blocking_run_method(monkeypatch):
+	"""Runs forecasts that wait for `release`, setting `started` once the first one starts."""
+	calls = []
+	started = threading.Event()
+	release = threading.Event()
+
+	def _blocking(data, method, **kwargs):
+		calls.append(kwargs)
+		started.set()
+		release.wait(5)
+		return run_method(data, method, **kwargs)
+
+	monkeypatch.setattr(aio, "run_method", _blocking)
+	return calls, started, release
+
+
+def test_cancellation(data, blocking_run_method):
+	calls, started, release = blocking_run_method
+
+	async def main():
+		async with aio.ForecastService(max_workers=1, max_pending=1) as service:
+			first = asyncio.ensure_future(service.run(data, "moving_average", periods=1))
+			await asyncio.to_thread(started.wait, 5)
+			# The second request is still waiting for a slot, so it is never submitted
+			second = asyncio.ensure_future(service.run(data, "moving_average", periods=2))
+			await asyncio.sleep(0)
+			second.cancel()
+			with pytest.raises(asyncio.CancelledError):
+				await second
+			release.set()
+			await first
+
+	asyncio.run(main())
+	assert calls == [{"periods": 1}]
+
+
+def test_cancelled_running_job_keeps_slot(data, blocking_run_method):
+	calls, started, release = blocking_run_method
+
+	async def main():
+		async with aio.ForecastService(max_workers=2, max_pending=1) as service:
+			first = asyncio.ensure_future(service.run(data, "moving_average", periods=1))
+			await asyncio.to_thread(started.wait, 5)
+			first.cancel()
+			with pytest.raises(asyncio.CancelledError):
+				await first
+			# The cancelled job is still running in the pool, so it still holds the only slot
+			second = asyncio.ensure_future(service.run(data, "moving_average", periods=2))
+			await asyncio.sleep(0)
+			assert service._slots.locked() and calls == [{"periods": 1}]
+			release.set()
+			await second
+
+	asyncio.run(main())
+	assert calls == [{"periods": 1}, {"periods": 2}]
+
+
+def test_request_after_cancellation_runs(data, blocking_run_method):
+	calls, started, release = blocking_run_method
+
+	async def main():
+		async with aio.ForecastService(max_workers=1, max_pending=1) as service:
+			first = asyncio.ensure_future(service.run(data, "moving_average", periods=1))
+			await asyncio.to_thread(started.wait, 5)
+			second = asyncio.ensure_future(service.run(data, "moving_average", periods=2))
+			await asyncio.sleep(0)
+			second.cancel()
+			await asyncio.sleep(0)
+			# An identical request made while the cancelled job winds down gets its own job
+			third = asyncio.ensure_future(service.run(data, "moving_average", periods=2))
+			with pytest.raises(asyncio.CancelledError):
+				await second
+			release.set()
+			await first
+			return await third
+
+	assert asyncio.run(main()) == run_method(data, "moving_average", periods=2)
+	assert calls == [{"periods": 1}, {"periods": 2}]
+
+
+def test_service_errors(data):
+	with pytest.raises(ValueError):
+		aio.ForecastService(backend="gpu")
+
+	with pytest.raises(ValueError):
+		asyncio.run(aio.run(data, "not_a_method"))
@@ -0,0 +1,79 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from forecast import run_method
+from forecast.cache import ResultCache, cache_key
+
+
+@pytest.fixture
+def data():
+	return [
+		[Decimal("128"), Decimal("117"), Decimal("115"), Decimal("125")],
+		[Decimal("125"), Decimal("123"), Decimal("115"), Decimal("137")],
+	]
+
+
+@pytest.fixture
+def cache(tmp_path):
+	return ResultCache(tmp_path / "results.sqlite3")
+
+
+def test_cache_key(data):
+	key = cache_key(data, "moving_average", {"periods": 2})
+	assert key == cache_key([list(d) for d in data], "moving_average", {"periods": 2})
+	assert key != cache_key(data, "moving_average", {"periods": 3})
+	assert key != cache_key(data, "linear_smoothing", {"periods": 2})
+	assert key != cache_key(data[:1], "moving_average", {"periods": 2})
+
+
+def test_get_or_compute(cache, data, monkeypatch):
+	expected = run_method(data, "moving_average", periods=2)
+	assert cache.get_or_compute(data, "moving_average", periods=2) == expected
+	assert (cache.hits, cache.misses) == (0, 1)
+
+	# Served from the cache without recomputing
+	monkeypatch.setattr("forecast.cache.run_method", None)
+	assert cache.get_or_compute(data, "moving_average", periods=2) == expected
+	assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_or_compute_null_values(cache, data):
+	data[0][1] = None
+	expected = run_method([[n or Decimal(0) for n in d] for d in data], "moving_average", periods=2)
+	assert cache.get_or_compute(data, "moving_average", periods=2) == expected
+	assert cache.get_or_compute(data, "moving_average", periods=2) == expected
+	assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_persists(tmp_path, data):
+	path = tmp_path / "results.sqlite3"
+	ResultCache(path).get_or_compute(data, "linear_smoothing", periods=3)
+	reopened = ResultCache(path)
+	assert reopened.get(cache_key(data, "linear_smoothing", {"periods": 3})) is not None
+	assert len(pickle.loads(pickle.dumps(reopened))) == 1
+
+
+def test_lru_eviction(tmp_path, data):
+	cache = ResultCache(tmp_path / "results.sqlite3", max_entries=2)
+	cache.set("a", [Decimal(1)])
+	cache.set("b", [Decimal(2)])
+	cache.get("a")
+	cache.set("c", [Decimal(3)])
+	assert len(cache) == 2
+	assert cache.get("b") is None and cache.get("a") == [Decimal(1)]
+
+
+def test_size_eviction(tmp_path):
+	cache = ResultCache(tmp_path / "results.sqlite3", max_bytes=20)
+	cache.set("a", [Decimal("1.5")])
+	cache.set("b", [Decimal("2.5")])
+	cache.set("c", [Decimal("123456789")])
+	assert cache.get("a") is None and cache.get("c") == [Decimal("123456789")]
+
+
+def test_clear(cache):
+	cache.set("a", [Decimal(1)])
+	cache.clear()
+	assert len(cache) == 0 and cache.get("a") is None
@@ -0,0 +1,183 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from forecast import Period
+from forecast.calendars import (
+	BusinessCalendar,
+	DailyProfile,
+	IsoCalendar,
+	RetailCalendar,
+	configure_business_calendar,
+	configure_iso_calendar,
+	configure_retail_calendar,
+	get_business_calendar,
+	get_iso_calendar,
+	get_retail_calendar,
+	weekday,
+)
+
+
+class TestIsoCalendar:
+	"""
+	Tests for the IsoCalendar lookup table
+	"""
+
+	def test_week_and_year_matches_isocalendar(self):
+		iso = IsoCalendar(2019, 2022)
+		start = datetime.date(2018, 12, 1).toordinal()
+		for ordinal in range(start, datetime.date(2023, 2, 1).toordinal()):
+			iso_year, iso_week, _ = datetime.date.fromordinal(ordinal).isocalendar()
+			assert iso.week_and_year(ordinal) == (iso_week, iso_year)
+
+	def test_week_count_and_monday(self):
+		iso = IsoCalendar(2015, 2025)
+		assert iso.week_count(2020) == 53 and iso.week_count(2021) == 52
+		assert iso.monday(2020, 53) == datetime.date(2020, 12, 28).toordinal()
+		assert iso.monday(2026, 1) == datetime.date(2025, 12, 29).toordinal()
+		with pytest.raises(ValueError):
+			iso.monday(2021, 53)
+
+	def test_weekday(self):
+		assert weekday(datetime.date(2023, 1, 2).toordinal()) == 0
+		assert weekday(datetime.date(2023, 1, 1).toordinal()) == 6
+
+	def test_configure_range(self):
+		default = get_iso_calendar()
+		try:
+			iso = configure_iso_calendar(2000, 2010)
+			assert get_iso_calendar() is iso and iso.last_year == 2010
+		finally:
+			configure_iso_calendar(default.first_year, default.last_year)
+
+		with pytest.raises(ValueError):
+			IsoCalendar(2030, 2020)
+
+
+class TestRetailCalendar:
+	"""
+	Tests for the RetailCalendar fiscal year table
+	"""
+
+	def test_nrf_year_starts(self):
+		retail = RetailCalendar()
+		assert retail.start(2022) == datetime.date(2022, 1, 30).toordinal()
+		assert retail.start(2023) == datetime.date(2023, 1, 29).toordinal()
+		assert retail.start(2024) == datetime.date(2024, 2, 4).toordinal()
+		assert retail.week_count(2022) == 52 and retail.week_count(2023) == 53
+
+	def test_period_lookup(self):
+		retail = RetailCalendar()
+		assert retail.period(datetime.date(2023, 1, 29).toordinal()) == (2023, 1, 1)
+		assert retail.period(datetime.date(2023, 3, 5).toordinal()) == (2023, 2, 6)
+		assert retail.period(datetime.date(2024, 2, 3).toordinal()) == (2023, 12, 53)
+		assert retail.period_start(2023, 2) == datetime.date(2023, 2, 26).toordinal()
+
+	def test_lookup_outside_table_range(self):
+		table = RetailCalendar()
+		retail = RetailCalendar(first_year=2010, last_year=2012)
+		start = datetime.date(2005, 1, 1).toordinal()
+		for ordinal in range(start, datetime.date(2016, 1, 1).toordinal(), 3):
+			assert retail.year_and_week(ordinal) == table.year_and_week(ordinal)
+		assert retail.week_count(2023) == 53
+
+	def test_last_weekday_method(self):
+		retail = RetailCalendar(end_month=12, end_weekday=6, method="last")
+		# Years end on the last Sunday of December
+		assert retail.start(2023) == datetime.date(2022, 12, 26).toordinal()
+		assert retail.start(2024) == datetime.date(2024, 1, 1).toordinal()
+		assert retail.week_count(2023) == 53
+
+	def test_configure(self):
+		try:
+			retail = configure_retail_calendar(pattern=(4, 4, 5))
+			assert get_retail_calendar() is retail and retail.period_weeks[:4] == (0, 4, 8, 13)
+		finally:
+			configure_retail_calendar()
+
+		with pytest.raises(ValueError):
+			RetailCalendar(pattern=(4, 4, 4))
+		with pytest.raises(ValueError):
+			RetailCalendar(method="first")
+
+
+class TestBusinessCalendar:
+	"""
+	Tests for BusinessCalendar working day counts
+	"""
+
+	def test_counts(self):
+		holidays = [datetime.date(2024, 1, 1), datetime.date(2024, 12, 25)]
+		calendar = BusinessCalendar(holidays=holidays)
+		assert calendar.count(datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)) == 260
+		assert not calendar.is_business_day(datetime.date(2024, 12, 25))
+		assert not calendar.is_business_day(datetime.date(2024, 12, 28))
+		assert calendar.is_business_day(datetime.date(2024, 12, 27))
+
+	def test_counts_outside_table_range(self):
+		calendar = BusinessCalendar(first_year=2000, last_year=2001)
+		for start, end in [((1999, 12, 1), (2000, 1, 31)), ((2001, 12, 1), (2002, 2, 28))]:
+			start, end = datetime.date(*start), datetime.date(*end)
+			expected = sum(
+				calendar.is_business_day(o) for o in range(start.toordinal(), end.toordinal() + 1)
+			)
+			assert calendar.count(start, end) == expected
+		assert calendar.is_business_day(datetime.date(2002, 1, 1))
+
+	def test_nth_business_day(self):
+		calendar = BusinessCalendar(weekends=(4, 5), holidays=[datetime.date(2024, 3, 5)])
+		sunday = datetime.date(2024, 3, 3).toordinal()
+		# Sunday, Monday, (holiday), Wednesday, Thursday, (weekend), Sunday
+		offsets = [calendar.nth_business_day(sunday, n) - sunday for n in range(1, 6)]
+		assert offsets == [0, 1, 3, 4, 7]
+
+	def test_profile_redistribution(self):
+		bins = [(datetime.date(2024, 1, 1), datetime.date(2024, 1, 28))]
+		result = Period().redistribute_data(
+			[Decimal(20)], bins, "Custom Days", custom_period=7, profile=BusinessCalendar()
+		)
+		assert list(result.values()) == [Decimal(5)] * 4
+
+	def test_configure(self):
+		try:
+			calendar = configure_business_calendar(holidays=[datetime.date(2024, 1, 1)])
+			assert get_business_calendar() is calendar
+			assert not calendar.is_business_day(datetime.date(2024, 1, 1))
+		finally:
+			configure_business_calendar()
+
+		with pytest.raises(ValueError):
+			BusinessCalendar(weekends=range(7))
+		with pytest.raises(ValueError):
+			BusinessCalendar(weekends=(7,))
+		with pytest.raises(ValueError):
+			BusinessCalendar(holidays=[datetime.date(2300, 1, 1)])
+
+
+class TestDailyProfile:
+	"""
+	Tests for DailyProfile cumulative weights
+	"""
+
+	def test_weekday_profile(self):
+		profile = DailyProfile([1, 2, 3, 4, 5, 6, 7])
+		monday = datetime.date(2023, 1, 2).toordinal()
+		assert profile.total(monday, monday + 6) == 28
+		assert profile.total(monday - 1, monday + 14) == 7 + 28 * 2 + 1
+		assert profile.total(monday + 5, monday + 5) == 6
+
+	def test_per_date_profile(self):
+		start = datetime.date(2023, 1, 1)
+		profile = DailyProfile(["0.5", 1, 2], start)
+		assert profile.total(start.toordinal(), start.toordinal() + 2) == Decimal("3.5")
+		with pytest.raises(ValueError):
+			profile.total(start.toordinal(), start.toordinal() + 3)
+
+	def test_profile_errors(self):
+		with pytest.raises(ValueError):
+			DailyProfile([1, 2, 3])
+		with pytest.raises(ValueError):
+			DailyProfile(lambda d: 1)
+		with pytest.raises(ValueError):
+			DailyProfile([1, 1, 1, 1, 1, -1, 0])
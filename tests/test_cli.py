@@ -0,0 +1,105 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from forecast import run_method, select_method
+from forecast.cache import ResultCache
+from forecast.cli import main, process_line, run_batch
+
+
+@pytest.fixture
+def series():
+	return [
+		[128, 117, 115, 125, 122, 137],
+		[125, 123, 115, 137, 122, 130],
+		[131, 114, 119, 137, 141, 128],
+	]
+
+
+@pytest.fixture
+def lines(series):
+	return [json.dumps({"id": i, "data": series}) for i in range(25)]
+
+
+def test_process_line_with_method(series):
+	line = json.dumps({"id": "a", "data": series, "params": {"periods": 3}})
+	output = json.loads(process_line(line, method="moving_average"))
+	data = [[Decimal(v) for v in s] for s in series]
+	assert output["id"] == "a" and output["method"] == "moving_average"
+	assert output["forecast"] == [str(v) for v in run_method(data, "moving_average", periods=3)]
+
+
+def test_process_line_auto_selection(series):
+	output = json.loads(process_line(json.dumps({"data": series})))
+	data = [[Decimal(v) for v in s] for s in series]
+	method, params = select_method(data)
+	assert output["method"] == method
+	assert len(output["forecast"]) == len(series[-1])
+
+
+def test_process_line_integer_decimal_params(series):
+	data = [[Decimal(v) for v in s] for s in series]
+	line = json.dumps({"data": series, "params": {"percent": 10}})
+	output = json.loads(process_line(line, method="percent_over_previous_period"))
+	expected = run_method(data, "percent_over_previous_period", percent=Decimal(10))
+	assert output["forecast"] == [str(v) for v in expected]
+
+	params = {"periods": 3, "alpha": 1}
+	output = json.loads(process_line(json.dumps({"data": series}), "exponential_smoothing", params))
+	expected = run_method(data, "exponential_smoothing", periods=3, alpha=Decimal(1))
+	assert "error" not in output and output["forecast"] == [str(v) for v in expected]
+
+
+def test_process_line_error():
+	output = json.loads(process_line(json.dumps({"id": 7, "data": [[1, 2]], "method": "nope"})))
+	assert output["id"] == 7 and "error" in output
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_run_batch_preserves_order(lines, backend):
+	output = [
+		json.loads(line)
+		for line in run_batch(iter(lines), workers=2, chunk_size=4, backend=backend)
+	]
+	assert [o["id"] for o in output] == list(range(25))
+
+
+def test_main(lines, tmp_path, capsys):
+	path = tmp_path / "series.jsonl"
+	path.write_text("\n".join(lines) + "\n")
+	out_path = tmp_path / "out.jsonl"
+	args = [str(path), "-o", str(out_path), "--method", "previous_period_to_current_period"]
+	assert main(args) == 0
+	output = [json.loads(line) for line in out_path.read_text().splitlines()]
+	assert len(output) == 25 and output[0]["forecast"] == ["131", "114", "119", "137", "141", "128"]
+	assert "Processed 25 series" in capsys.readouterr().err
+
+
+def test_main_with_cache(lines, tmp_path, capsys):
+	path = tmp_path / "series.jsonl"
+	path.write_text("\n".join(lines[:3]) + "\n")
+	cache_path = tmp_path / "cache.sqlite3"
+	args = [str(path), "-o", str(tmp_path / "out.jsonl"), "--cache", str(cache_path)]
+	assert main(args) == 0
+	first = (tmp_path / "out.jsonl").read_text()
+	assert main(args) == 0
+	assert (tmp_path / "out.jsonl").read_text() == first
+	assert len(ResultCache(cache_path)) == 1
+
+
+def test_main_integer_decimal_params(lines, tmp_path):
+	path = tmp_path / "series.jsonl"
+	path.write_text(lines[0] + "\n")
+	out_path = tmp_path / "out.jsonl"
+	args = [str(path), "-o", str(out_path), "-m", "exponential_smoothing"]
+	assert main([*args, "-p", '{"periods": 3, "alpha": 1}']) == 0
+	output = json.loads(out_path.read_text())
+	assert "error" not in output and len(output["forecast"]) == 6
+
+
+def test_process_line_null_values():
+	line = json.dumps({"data": [[1, None, 3], [None, 2, 4]]})
+	output = json.loads(process_line(line, method="previous_period_to_current_period"))
+	assert output["forecast"] == ["0.0", "2", "4"]
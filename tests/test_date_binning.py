@@ -1,10 +1,15 @@
 import datetime
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from itertools import islice
 
 import pytest
 
 from forecast import Period
+from forecast.calendars import DailyProfile
+from forecast.date_binning import DateBins, IntradayBins, interval_overlaps, to_epoch_seconds
+from forecast.periodicities import register_periodicity
 
 
 @pytest.fixture
@@ -654,6 +659,348 @@ class TestBins:
 		assert bins == output
 
 
+class TestBinCache:
+	"""
+	Tests for the date bin cache shared by Period() instances
+	"""
+
+	def test_cache_hits_across_instances(self, date_jan_2_23, date_dec_31_23):
+		Period.cache_clear()
+		bins = Period().get_date_bins(date_jan_2_23, date_dec_31_23, "ISO Month (4 + 5 + 4)")
+		assert Period.cache_info()["misses"] == 1
+		assert Period().get_date_bins(date_jan_2_23, date_dec_31_23, "ISO Month (4 + 5 + 4)") == bins
+		info = Period.cache_info()
+		assert info["hits"] == 1 and info["size"] == 1
+
+	def test_cached_bins_cannot_be_corrupted(self, date_jan_2_23, date_dec_31_23):
+		Period.cache_clear()
+		bins = Period().get_date_bins(date_jan_2_23, date_dec_31_23, "Calendar Month")
+		expected = list(bins)
+		bins.pop()
+		bins[0] = None
+		assert Period().get_date_bins(date_jan_2_23, date_dec_31_23, "Calendar Month") == expected
+
+	def test_cached_compact_bins_cannot_be_corrupted(self, date_jan_2_23, date_dec_31_23):
+		Period.cache_clear()
+		p = Period(date_jan_2_23, date_dec_31_23, "Calendar Month")
+		bins = p.get_date_bins(compact=True)
+		expected = list(bins)
+		bins.starts[0] = bins.starts[1]
+		bins.ends.pop()
+		assert p.get_date_bins(compact=True) == expected
+
+		starts = [date_jan_2_23.toordinal()]
+		ends = [date_dec_31_23.toordinal()]
+		bins = DateBins(starts, ends)
+		copied = DateBins(bins.starts, bins.ends)
+		bins.starts[0] += 1
+		assert copied[0] == (date_jan_2_23, date_dec_31_23)
+
+	def test_cache_key_includes_arguments(self, date_jan_2_23, date_mar_31_23):
+		Period.cache_clear()
+		p = Period()
+		a = p.get_date_bins(date_jan_2_23, date_mar_31_23, "Custom Days", custom_period=[3, 4])
+		b = p.get_date_bins(date_jan_2_23, date_mar_31_23, "Custom Days", custom_period=5)
+		c = p.get_date_bins(
+			date_jan_2_23, date_mar_31_23, "Custom Days", custom_period=5, inclusive=False
+		)
+		assert a != b and b != c
+		assert Period.cache_info()["misses"] == 3
+
+	def test_cache_clear(self, date_jan_2_23, date_mar_31_23):
+		Period().get_date_bins(date_jan_2_23, date_mar_31_23)
+		Period.cache_clear()
+		assert Period.cache_info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 1024}
+
+
+class TestIterDateBins:
+	"""
+	Tests for lazily generated date bins
+	"""
+
+	@pytest.mark.parametrize(
+		"periodicity", ["ISO Month (4 + 5 + 4)", "Fiscal Weeks", "Calendar Quarter", "Entire Period"]
+	)
+	def test_matches_get_date_bins(self, date_jan_5_23, date_dec_31_23, periodicity):
+		p = Period(date_jan_5_23, date_dec_31_23, periodicity)
+		for inclusive in (True, False):
+			bins = p.get_date_bins(inclusive=inclusive, custom_period=[4, 5, 4])
+			lazy_bins = p.iter_date_bins(
+				end_date=date_dec_31_23, inclusive=inclusive, custom_period=[4, 5, 4]
+			)
+			assert list(lazy_bins) == bins
+
+	def test_open_end_date(self, date_jan_7_23):
+		bins = Period(date_jan_7_23, periodicity="Calendar Month").iter_date_bins()
+		assert list(islice(bins, 3)) == [
+			(datetime.date(2023, 1, 7), datetime.date(2023, 1, 31)),
+			(datetime.date(2023, 2, 1), datetime.date(2023, 2, 28)),
+			(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31)),
+		]
+
+	def test_open_end_date_stops_at_max_date(self):
+		bins = list(Period().iter_date_bins(datetime.date(9999, 1, 1), periodicity="ISO Week"))
+		assert len(bins) == 52
+
+	def test_errors_are_raised_eagerly(self, date_jan_7_23):
+		with pytest.raises(ValueError):
+			Period().iter_date_bins(periodicity="Calendar Month")
+		with pytest.raises(ValueError):
+			Period(date_jan_7_23).iter_date_bins(periodicity="Entire Period")
+		with pytest.raises(ValueError):
+			Period(date_jan_7_23).iter_date_bins(periodicity="Custom Days", custom_period=0)
+
+
+class TestBinIndex:
+	"""
+	Tests for closed-form bin lookup
+	"""
+
+	@pytest.mark.parametrize(
+		"periodicity,custom_period",
+		[
+			("Custom Days", [3, 4]),
+			("Fiscal Weeks", [4, 5, 4]),
+			("Weekly", 1),
+			("Calendar Month", 1),
+			("Monthly", 1),
+			("Calendar Quarter", 1),
+			("Annually", 1),
+			("ISO Month (4 + 5 + 4)", 1),
+		],
+	)
+	def test_matches_generated_bins(self, date_jan_7_23, periodicity, custom_period):
+		p = Period(date_jan_7_23, periodicity=periodicity)
+		bins = list(islice(p.iter_date_bins(custom_period=custom_period), 40))
+		for i, (start, end) in enumerate(bins):
+			for date in (start, start + (end - start) / 2, end):
+				assert p.bin_index(date, custom_period=custom_period) == i
+				assert p.bin_for(date, custom_period=custom_period) == (start, end)
+
+	def test_month_end_drift(self):
+		# Monthly bins from Jan 31 clamp to Feb 28, then continue from the 28th
+		p = Period(datetime.date(2023, 1, 31), periodicity="Monthly")
+		assert p.bin_for(datetime.date(2023, 3, 27)) == (
+			datetime.date(2023, 2, 28),
+			datetime.date(2023, 3, 27),
+		)
+		assert p.bin_index(datetime.date(2123, 3, 28)) == 1202
+		assert p.bin_for(datetime.date(2123, 3, 28)) == (
+			datetime.date(2123, 3, 28),
+			datetime.date(2123, 4, 27),
+		)
+
+	def test_before_anchor(self, date_jan_7_23):
+		p = Period(date_jan_7_23, periodicity="Weekly")
+		assert p.bin_index(datetime.date(2023, 1, 6)) == -1
+		assert p.bin_for(datetime.date(2023, 1, 6)) is None
+		with pytest.raises(ValueError):
+			p.bin_index(date_jan_7_23, periodicity="Entire Period")
+
+
+class TestExtendBins:
+	"""
+	Tests for extending existing bins to a later end date
+	"""
+
+	@pytest.mark.parametrize(
+		"periodicity,custom_period",
+		[
+			("Custom Days", [3, 4]),
+			("Fiscal Weeks", [4, 5, 4]),
+			("Calendar Month", 1),
+			("Monthly", 1),
+			("Calendar Quarter", 1),
+			("ISO Month (4 + 5 + 4)", 1),
+			("Retail Month (4 + 4 + 5)", 1),
+			("Entire Period", 1),
+		],
+	)
+	def test_matches_full_range(
+		self, date_jan_7_23, date_nov_1_23, date_dec_31_25, periodicity, custom_period
+	):
+		p = Period(periodicity=periodicity)
+		bins = p.get_date_bins(date_jan_7_23, date_nov_1_23, custom_period=custom_period)
+		extended = p.extend_bins(bins, date_dec_31_25, custom_period=custom_period)
+		assert extended == p.get_date_bins(
+			date_jan_7_23, date_dec_31_25, custom_period=custom_period
+		)
+		assert extended[: len(bins) - 1] == bins[:-1]
+
+	def test_compact_bins(self, date_jan_7_23, date_feb_13_23, date_jun_30_23):
+		p = Period(periodicity="Weekly")
+		bins = p.get_date_bins(date_jan_7_23, date_feb_13_23, compact=True)
+		extended = p.extend_bins(bins, date_jun_30_23, inclusive=False)
+		assert isinstance(extended, DateBins)
+		assert extended == p.get_date_bins(date_jan_7_23, date_jun_30_23, inclusive=False)
+
+	def test_errors(self, date_jan_7_23, date_feb_13_23):
+		p = Period(periodicity="Weekly")
+		bins = p.get_date_bins(date_jan_7_23, date_feb_13_23)
+		with pytest.raises(ValueError):
+			p.extend_bins([], date_feb_13_23)
+		with pytest.raises(ValueError):
+			p.extend_bins(bins, bins[-1][0])
+
+
+class TestDateBins:
+	"""
+	Tests for the compact DateBins container
+	"""
+
+	def test_compact_bins_match_list(self, date_jan_1_23, date_dec_31_23):
+		p = Period(date_jan_1_23, date_dec_31_23, "Calendar Month")
+		bins = p.get_date_bins()
+		compact = p.get_date_bins(compact=True)
+		assert isinstance(compact, DateBins)
+		assert compact == bins and list(compact) == bins
+		assert len(compact) == 12
+		assert compact[1] == (datetime.date(2023, 2, 1), datetime.date(2023, 2, 28))
+		assert compact[-1] == bins[-1]
+
+	def test_slicing(self, date_jan_1_23, date_dec_31_23):
+		compact = Period().get_date_bins(date_jan_1_23, date_dec_31_23, "Calendar Quarter", compact=True)
+		head = compact[:2]
+		assert isinstance(head, DateBins)
+		assert head == [
+			(datetime.date(2023, 1, 1), datetime.date(2023, 3, 31)),
+			(datetime.date(2023, 4, 1), datetime.date(2023, 6, 30)),
+		]
+
+	def test_bin_index(self, date_jan_2_23, date_feb_13_23):
+		compact = Period().get_date_bins(date_jan_2_23, date_feb_13_23, "ISO Week", compact=True)
+		assert compact.bin_index(date_jan_2_23) == 0
+		assert compact.bin_index(datetime.date(2023, 1, 15)) == 1
+		assert compact.bin_index(date_feb_13_23.toordinal()) == 6
+		assert compact.bin_index(datetime.date(2023, 1, 1)) == -1
+		assert compact.bin_index(datetime.date(2023, 2, 20)) == -1
+
+	def test_methods_accept_compact_bins(self, date_jan_1_23, date_mar_31_23, data_3_cal_months):
+		p = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		bins = p.get_date_bins()
+		compact = DateBins.from_bins(bins)
+		assert p.get_period_labels(compact) == p.get_period_labels(bins)
+		assert p.assign_bins([datetime.date(2023, 2, 3)], compact) == [1]
+		assert isinstance(p.convert_dates(compact, "ISO Week"), DateBins)
+		assert p.convert_dates(compact, "ISO Week") == p.convert_dates(bins, "ISO Week")
+		assert p.redistribute_data(data_3_cal_months, compact, "ISO Week") == p.redistribute_data(
+			data_3_cal_months, bins, "ISO Week"
+		)
+
+	def test_as_numpy(self, date_jan_1_23, date_mar_31_23):
+		np = pytest.importorskip("numpy")
+		compact = Period().get_date_bins(date_jan_1_23, date_mar_31_23, "Calendar Month", compact=True)
+		starts, ends = compact.as_numpy()
+		assert starts.dtype == np.int32 and not starts.flags.writeable
+		assert list(ends - starts + 1) == [31, 28, 31]
+
+
+class TestIntradayBins:
+	"""
+	Tests for sub-daily bins
+	"""
+
+	@pytest.fixture
+	def hourly_bins(self):
+		return Period().get_intraday_bins(
+			datetime.datetime(2024, 3, 1, 22), datetime.date(2024, 3, 2), "Hourly"
+		)
+
+	def test_hourly_bins(self, hourly_bins):
+		assert isinstance(hourly_bins, IntradayBins) and len(hourly_bins) == 26
+		assert hourly_bins[0] == (
+			datetime.datetime(2024, 3, 1, 22),
+			datetime.datetime(2024, 3, 1, 22, 59, 59),
+		)
+		assert hourly_bins[-1] == (
+			datetime.datetime(2024, 3, 2, 23),
+			datetime.datetime(2024, 3, 2, 23, 59, 59),
+		)
+		assert hourly_bins[1:3] == list(hourly_bins)[1:3]
+
+	def test_partial_last_bin(self):
+		bins = Period().get_intraday_bins(
+			datetime.datetime(2024, 3, 1, 22, 10),
+			datetime.datetime(2024, 3, 1, 23),
+			"15 Minutes",
+			inclusive=False,
+		)
+		assert len(bins) == 4
+		assert bins[-1] == (
+			datetime.datetime(2024, 3, 1, 22, 55),
+			datetime.datetime(2024, 3, 1, 22, 59, 59),
+		)
+
+	def test_epoch_seconds(self):
+		assert to_epoch_seconds(datetime.date(1970, 1, 2)) == 86400
+		assert to_epoch_seconds(datetime.datetime(1970, 1, 1, 1, 0, 1, 999)) == 3601
+		utc_plus_2 = datetime.timezone(datetime.timedelta(hours=2))
+		assert to_epoch_seconds(datetime.datetime(1970, 1, 1, 3, tzinfo=utc_plus_2)) == 3600
+
+	def test_assign_bins(self, hourly_bins):
+		timestamps = [
+			datetime.datetime(2024, 3, 1, 22, 59, 59),
+			datetime.datetime(2024, 3, 1, 23),
+			datetime.datetime(2024, 3, 2, 23, 59, 59),
+			datetime.datetime(2024, 3, 3),
+		]
+		assert Period().assign_bins(timestamps, hourly_bins) == [0, 1, 25, -1]
+		assert hourly_bins.bin_index(timestamps[1]) == 1
+
+	def test_assign_bins_numpy(self, hourly_bins):
+		np = pytest.importorskip("numpy")
+		timestamps = np.array(
+			["2024-03-01T22:59", "2024-03-01T23:00", "2024-03-01T21:00"], dtype="datetime64[m]"
+		)
+		assert Period().assign_bins(timestamps, hourly_bins).tolist() == [0, 1, -1]
+		starts, _ = hourly_bins.as_numpy()
+		assert starts.astype("datetime64[s]")[0] == np.datetime64("2024-03-01T22:00:00")
+
+	def test_redistribute_to_days(self, hourly_bins):
+		result = Period().redistribute_data([Decimal(1)] * 26, hourly_bins, "Custom Days")
+		assert list(result) == [
+			(datetime.date(2024, 3, 1), datetime.date(2024, 3, 1)),
+			(datetime.date(2024, 3, 2), datetime.date(2024, 3, 2)),
+		]
+		assert list(result.values()) == [Decimal(2), Decimal(24)]
+
+	def test_redistribute_to_intraday(self):
+		p = Period()
+		days = p.get_date_bins(datetime.date(2024, 3, 1), datetime.date(2024, 3, 2), "Custom Days")
+		hourly = p.redistribute_data([Decimal(24), Decimal(48)], days, "Hourly")
+		assert len(hourly) == 48 and set(list(hourly.values())[:24]) == {Decimal(1)}
+		quarters = p.get_intraday_bins(
+			datetime.datetime(2024, 3, 1), datetime.datetime(2024, 3, 1, 2), "15 Minutes", False
+		)
+		result = p.redistribute_data([Decimal(1)] * 8, quarters, "Hourly")
+		assert list(result.values()) == [Decimal(4), Decimal(4)]
+
+	def test_labels(self, hourly_bins):
+		p = Period()
+		labels = p.get_period_labels(hourly_bins, "Hourly")
+		assert labels[:2] == ["03/01/24 22:00", "03/01/24 23:00"]
+		assert labels[-1] == "03/02/24 23:00"
+		assert p.get_period_labels(list(hourly_bins[:2]), "Hourly") == labels[:2]
+		assert p.get_period_labels(hourly_bins[:2], use_bin_start_date_for_label=False) == [
+			"03/01/24 22:59",
+			"03/01/24 23:59",
+		]
+		assert p.get_period_labels(hourly_bins[:2], date_format_string="%H:%M") == [
+			"22:00",
+			"23:00",
+		]
+
+	def test_errors(self, hourly_bins):
+		p = Period()
+		start = datetime.datetime(2024, 3, 1, 1)
+		with pytest.raises(ValueError):
+			p.get_intraday_bins(start, datetime.date(2024, 3, 2), "5 Minutes")
+		with pytest.raises(ValueError):
+			p.get_intraday_bins(start, start, inclusive=False)
+		with pytest.raises(ValueError):
+			p.redistribution_plan(hourly_bins, "Custom Days", profile=DailyProfile([1] * 7))
+
+
 class TestConversions:
 	"""
 	Tests for Period() bin and data conversions
@@ -742,6 +1089,156 @@ class TestConversions:
 		new_data = per.redistribute_data(data_3_cal_months, orig_bins, "ISO Week")
 		assert new_data == output
 
+	def test_redistribution_plan(self, date_jan_1_23, date_mar_31_23, data_3_cal_months):
+		per = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		orig_bins = per.get_date_bins(inclusive=True)
+		plan = per.redistribution_plan(orig_bins, "ISO Week")
+		assert plan.apply(data_3_cal_months) == per.redistribute_data(
+			data_3_cal_months, orig_bins, "ISO Week"
+		)
+		# Three weeks straddle two months
+		assert len(plan) == len(plan.new_bins) + 2
+
+		rows = [data_3_cal_months, [31, 28, 31], [0, 0, 0]]
+		many = plan.apply_many(rows)
+		assert many[0] == list(plan.apply(data_3_cal_months).values())
+		assert many[1][:2] == [Decimal(1), Decimal(7)] and sum(many[2]) == 0
+
+		with pytest.raises(ValueError):
+			plan.apply([1, 2])
+
+	def test_redistribution_plan_numpy(self, date_jan_1_23, date_mar_31_23, data_3_cal_months):
+		np = pytest.importorskip("numpy")
+		per = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		plan = per.redistribution_plan(per.get_date_bins(), "ISO Week")
+		weights = plan.to_numpy()
+		assert weights.shape == (14, 3)
+		assert np.allclose(weights.sum(axis=0), 1)
+
+		result = plan.apply_many(np.array([data_3_cal_months, [31, 28, 31]], dtype=float))
+		expected = [float(v) for v in plan.apply(data_3_cal_months).values()]
+		assert result.shape == (2, 14) and np.allclose(result[0], expected)
+
+	def test_data_weekday_profile(self, date_jan_1_23, date_mar_31_23, data_3_cal_months):
+		per = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		orig_bins = per.get_date_bins()
+		weekdays_only = DailyProfile([1, 1, 1, 1, 1, 0, 0])
+		new_data = per.redistribute_data(data_3_cal_months, orig_bins, "ISO Week", profile=weekdays_only)
+		values = list(new_data.values())
+		# Jan 1 2023 is a Sunday, January has 22 weekdays
+		assert values[0] == 0
+		assert values[1] == Decimal(1550) / 22 * 5
+		assert abs(sum(values) - sum(data_3_cal_months)) < Decimal("1e-20")
+
+		# A flat profile matches the uniform distribution
+		flat = per.redistribute_data(
+			data_3_cal_months, orig_bins, "ISO Week", profile=DailyProfile([1] * 7)
+		)
+		assert flat == per.redistribute_data(data_3_cal_months, orig_bins, "ISO Week")
+
+	def test_data_per_date_and_callable_profile(self, date_jan_1_23, date_mar_31_23):
+		per = Period(date_jan_1_23, date_mar_31_23, "Calendar Quarter")
+		orig_bins = per.get_date_bins()
+		n_days = (date_mar_31_23 - date_jan_1_23).days + 1
+		by_date = DailyProfile([1 if d < 31 else 0 for d in range(n_days)], date_jan_1_23)
+		by_callable = DailyProfile(lambda d: int(d.month == 1), date_jan_1_23, date_mar_31_23)
+		for profile in (by_date, by_callable):
+			new_data = per.redistribute_data([Decimal(620)], orig_bins, "Calendar Month", profile=profile)
+			assert list(new_data.values()) == [Decimal(620), Decimal(0), Decimal(0)]
+
+	def test_data_zero_weight_profile_falls_back_to_uniform(self, date_jan_7_23):
+		per = Period()
+		orig_bins = [(date_jan_7_23, datetime.date(2023, 1, 8))]  # a weekend
+		weekdays_only = DailyProfile([1, 1, 1, 1, 1, 0, 0])
+		new_data = per.redistribute_data([Decimal(5)], orig_bins, "Custom Days", profile=weekdays_only)
+		assert list(new_data.values()) == [Decimal("2.5"), Decimal("2.5")]
+
+	def test_interval_overlaps(self):
+		overlaps = list(interval_overlaps([1, 5, 8], [4, 7, 20], [0, 3, 10], [2, 9, 12]))
+		assert overlaps == [(0, 0, 2), (0, 1, 2), (1, 1, 3), (2, 1, 2), (2, 2, 3)]
+
+	def test_data_iso_week_to_cal_month_preserves_total(self, date_jan_1_23, date_dec_31_23):
+		per = Period()
+		orig_bins = per.get_date_bins(date_jan_1_23, date_dec_31_23, "ISO Week")
+		data = [Decimal(i * 7) for i in range(len(orig_bins))]
+		new_data = per.redistribute_data(data, orig_bins, "Calendar Month")
+		assert len(new_data) == 12
+		assert abs(sum(new_data.values()) - sum(data)) < Decimal("1e-20")
+		# Jan 1 (stub, 0) + 4 full weeks (7, 14, 21, 28) + Jan 30-31 from week 5 (35 * 2 / 7)
+		assert new_data[(datetime.date(2023, 1, 1), datetime.date(2023, 1, 31))] == Decimal(80)
+
+
+class TestAssignBins:
+	"""
+	Tests for Period().assign_bins() functionality
+	"""
+
+	def test_assign_dates(self, date_jan_1_23, date_mar_31_23):
+		per = Period()
+		bins = per.get_date_bins(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		dates = [
+			datetime.date(2022, 12, 31),
+			datetime.date(2023, 1, 1),
+			datetime.date(2023, 2, 28),
+			datetime.date(2023, 3, 1),
+			datetime.date(2023, 3, 31),
+			datetime.date(2023, 4, 1),
+		]
+		assert per.assign_bins(dates, bins) == [-1, 0, 1, 2, 2, -1]
+		assert per.assign_bins([d.toordinal() for d in dates], bins) == [-1, 0, 1, 2, 2, -1]
+		assert per.assign_bins(dates, []) == [-1] * 6
+
+	def test_assign_numpy_dates(self, date_jan_1_23, date_mar_31_23):
+		np = pytest.importorskip("numpy")
+		per = Period()
+		bins = per.get_date_bins(date_jan_1_23, date_mar_31_23, "ISO Week")
+		dates = np.arange("2022-12-25", "2023-04-10", dtype="datetime64[D]")
+		expected = per.assign_bins(dates.astype(datetime.date).tolist(), bins)
+		assert per.assign_bins(dates, bins).tolist() == expected
+		ordinals = np.array([d.toordinal() for d in dates.astype(datetime.date).tolist()])
+		assert per.assign_bins(ordinals, bins).tolist() == expected
+		assert per.assign_bins(dates, []).tolist() == [-1] * len(dates)
+
+
+class TestAggregate:
+	"""
+	Tests for Period().aggregate() functionality
+	"""
+
+	def test_aggregate(self, date_jan_1_23, date_mar_31_23):
+		dates = [
+			datetime.date(2022, 12, 31),
+			datetime.date(2023, 1, 1),
+			datetime.date(2023, 1, 31),
+			datetime.date(2023, 3, 15),
+			datetime.date(2023, 1, 2),
+		]
+		values = [100, 1, 2, "3.5", Decimal("4")]
+		totals = Period().aggregate(
+			iter(dates), iter(values), "Calendar Month", date_jan_1_23, date_mar_31_23
+		)
+		assert totals == [Decimal("7"), Decimal("0"), Decimal("3.5")]
+
+	def test_aggregate_keys_and_segments(self, date_jan_1_23, date_dec_31_23):
+		dates = [datetime.date(2023, m, 1) for m in range(1, 13)] * 2
+		values = list(range(1, 13)) + [10] * 12
+		keys = ["a"] * 12 + ["b"] * 12
+		per = Period(date_jan_1_23, date_dec_31_23, "Calendar Quarter")
+		totals = per.aggregate(dates, values, keys=keys, segment_length=2)
+		assert list(totals) == ["a", "b"]
+		assert totals["a"] == [[Decimal(6), Decimal(15)], [Decimal(24), Decimal(33)]]
+		assert totals["b"] == [[Decimal(30)] * 2] * 2
+
+	def test_aggregate_floats(self, date_jan_1_23, date_mar_31_23):
+		dates = [datetime.date(2023, 1, 1), datetime.date(2023, 1, 2), datetime.date(2023, 2, 1)]
+		per = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		assert per.aggregate(dates, [0.1, 0.2, 1.5]) == [Decimal("0.3"), Decimal("1.5"), 0]
+
+	def test_aggregate_empty_stream(self, date_jan_1_23, date_mar_31_23):
+		per = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		assert per.aggregate([], []) == [Decimal(0)] * 3
+		assert per.aggregate([], [], keys=[]) == {}
+
 
 class TestLabels:
 	"""
@@ -958,3 +1455,52 @@ class TestLabels:
 			bins, date_format_string=fmt_str, use_bin_start_date_for_label=False
 		)
 		assert labels == output
+
+	def test_custom_iso_pattern_labels(self, date_jan_2_23):
+		output = ["P1 (8w)-23", "P2 (9w)-23", "P3 (9w)-23", "P4 (9w)-23", "P5 (9w)-23", "P6 (8w)-23"]
+		register_periodicity("ISO Period (6)", iso_weeks=[1, 9, 18, 27, 36, 45], replace=True)
+		p = Period(date_jan_2_23, datetime.date(2024, 1, 1), "ISO Period (6)")
+		bins = p.get_date_bins(inclusive=False)
+		labels = p.get_period_labels(bins)
+		assert labels == output
+
+	def test_cached_labels_cannot_be_corrupted(self, date_jan_1_23, date_mar_31_23):
+		Period.cache_clear()
+		p = Period(date_jan_1_23, date_mar_31_23, "Calendar Month")
+		bins = p.get_date_bins(inclusive=True)
+		labels = p.get_period_labels(bins)
+		labels[0] = None
+		assert p.get_period_labels(bins) == ["Jan-23", "Feb-23", "Mar-23"]
+
+	@pytest.mark.parametrize(
+		"periodicity", ["ISO Week", "ISO Biweekly", "Fiscal Weeks", "Calendar Quarter", "Weekly"]
+	)
+	def test_compact_bin_labels(self, date_jan_2_23, date_dec_31_25, periodicity):
+		p = Period(date_jan_2_23, date_dec_31_25, periodicity)
+		bins = p.get_date_bins()
+		compact = p.get_date_bins(compact=True)
+		assert p.get_period_labels(compact) == p.get_period_labels(bins)
+		labels = p.get_period_labels(
+			compact, date_format_string="%Y-%m-%d", use_bin_start_date_for_label=True
+		)
+		assert labels == [start.strftime("%Y-%m-%d") for start, _ in bins]
+
+	def test_labels_reused_across_bins(self, date_jan_1_23, date_dec_31_25):
+		Period.cache_clear()
+		p = Period(date_jan_1_23, date_dec_31_25, "Calendar Month")
+		labels = p.get_period_labels(p.get_date_bins())
+		later = p.get_date_bins(datetime.date(2025, 1, 1), datetime.date(2026, 3, 31))
+		assert p.get_period_labels(later) == labels[-12:] + ["Jan-26", "Feb-26", "Mar-26"]
+
+	def test_labels_built_concurrently(self, date_jan_1_23):
+		Period.cache_clear()
+		p = Period(periodicity="Weekly")
+		starts = [date_jan_1_23 + datetime.timedelta(days=7 * n) for n in range(0, 2000, 50)]
+
+		def labels(start):
+			bins = p.get_date_bins(start, start + datetime.timedelta(days=2000))
+			expected = [end.strftime("%Y-%m-%d") for _, end in bins]
+			return p.get_period_labels(bins, date_format_string="%Y-%m-%d") == expected
+
+		with ThreadPoolExecutor(max_workers=8) as pool:
+			assert all(pool.map(labels, starts))
@@ -0,0 +1,39 @@
+import datetime
+import random
+
+import pytest
+
+from forecast.date_math import add_days, add_months, add_weeks, add_years, days_in_month
+
+
+def test_days_in_month():
+	assert days_in_month(2024, 2) == 29 and days_in_month(2023, 2) == 28
+	assert days_in_month(1900, 2) == 28 and days_in_month(2000, 2) == 29
+	assert days_in_month(2023, 12) == 31
+
+
+def test_add_days_and_weeks():
+	assert add_days(datetime.date(2023, 12, 31), 1) == datetime.date(2024, 1, 1)
+	assert add_weeks(datetime.date(2023, 12, 25), 2) == datetime.date(2024, 1, 8)
+	with pytest.raises(ValueError):
+		add_days(datetime.date.max, 1)
+
+
+def test_add_months_clamps_to_month_end():
+	assert add_months(datetime.date(2023, 1, 31), 1) == datetime.date(2023, 2, 28)
+	assert add_months(datetime.date(2024, 1, 31), 1) == datetime.date(2024, 2, 29)
+	assert add_months(datetime.date(2023, 11, 30), 3) == datetime.date(2024, 2, 29)
+	assert add_months(datetime.date(2023, 3, 31), -1) == datetime.date(2023, 2, 28)
+	assert add_years(datetime.date(2024, 2, 29), 1) == datetime.date(2025, 2, 28)
+	with pytest.raises(ValueError):
+		add_months(datetime.date(9999, 12, 1), 1)
+
+
+def test_matches_relativedelta():
+	relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+	rng = random.Random(0)
+	for _ in range(5000):
+		date = datetime.date.fromordinal(rng.randrange(700000, 800000))
+		n = rng.randrange(-40, 40)
+		assert add_months(date, n) == date + relativedelta(months=n)
+		assert add_years(date, n) == date + relativedelta(years=n)
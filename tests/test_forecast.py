@@ -1,8 +1,20 @@
+import datetime
 from decimal import Decimal
 
 import pytest
 
-from forecast import Forecast, calculate_seasonality_factors
+from forecast import (
+	Forecast,
+	ForecastModel,
+	Period,
+	calculate_seasonality_factors,
+	croston_sparse,
+	intermittent_batch,
+	run_method,
+	select_method,
+	to_sparse,
+	tsb_sparse,
+)
 
 
 @pytest.fixture
@@ -736,3 +748,201 @@ def test_seasonality_errors():
 	# Test non-Decimal data
 	with pytest.raises(TypeError):
 		s = calculate_seasonality_factors([[0.5, Decimal("0.5")]])
+
+
+# Stateless model testing
+def test_forecast_model_matches_forecast(example_data):
+	model = ForecastModel(example_data.data)
+	fc = example_data.moving_average(periods=4)
+	assert model.moving_average(periods=4) == fc.forecast
+	assert run_method(example_data.data, "moving_average", periods=4) == fc.forecast
+
+
+def test_forecast_model_is_immutable(example_data):
+	model = ForecastModel(example_data.data)
+	with pytest.raises(AttributeError):
+		model.data = ((Decimal(1),),)
+
+	# Methods return results without mutating the model's data
+	before = model.data
+	model.flexible_method(percent=Decimal("10"), periods=4)
+	assert model.data is before
+
+
+def test_forecast_instances_do_not_share_state(example_data, example_data_short):
+	assert example_data.data != example_data_short.data
+	example_data.previous_period_to_current_period()
+	assert example_data_short.forecast is None
+
+
+def test_forecast_model_shared_across_threads(example_data):
+	from concurrent.futures import ThreadPoolExecutor
+
+	model = ForecastModel(example_data.data)
+	expected = model.linear_smoothing(periods=3)
+	with ThreadPoolExecutor(max_workers=4) as executor:
+		results = list(executor.map(lambda _: model.linear_smoothing(periods=3), range(16)))
+	assert all(r == expected for r in results)
+
+
+def test_run_method_errors(example_data):
+	with pytest.raises(ValueError):
+		run_method(example_data.data, "not_a_method")
+
+	with pytest.raises(Exception):
+		ForecastModel([])
+
+
+# Intermittent demand testing
+def test_croston(example_data_with_zeros):
+	alpha = Decimal("0.1")
+	# Dense reference implementation
+	flat = [v for segment in example_data_with_zeros.data for v in segment]
+	size, interval, q = None, None, 0
+	for v in flat:
+		q += 1
+		if v:
+			if size is None:
+				size, interval = v, Decimal(q)
+			else:
+				size += alpha * (v - size)
+				interval += alpha * (Decimal(q) - interval)
+			q = 0
+
+	fc = example_data_with_zeros.croston(alpha=alpha)
+	assert fc.forecast == [size / interval] * 12
+
+	fc = example_data_with_zeros.sba(alpha=alpha, n=3)
+	assert fc.forecast == [(size / interval) * (Decimal(1) - alpha / Decimal(2))] * 3
+
+
+def test_tsb(example_data_with_zeros):
+	alpha, beta = Decimal("0.2"), Decimal("0.3")
+	# Dense reference implementation
+	flat = [v for segment in example_data_with_zeros.data for v in segment]
+	size, probability = None, None
+	for i, v in enumerate(flat):
+		if size is None:
+			if v:
+				size, probability = v, Decimal(1) / Decimal(i + 1)
+			continue
+		probability += beta * ((Decimal(1) if v else Decimal(0)) - probability)
+		if v:
+			size += alpha * (v - size)
+
+	fc = example_data_with_zeros.tsb(alpha=alpha, beta=beta, n=2)
+	assert [round(v, 20) for v in fc.forecast] == [round(probability * size, 20)] * 2
+
+
+def test_tsb_beta_one():
+	# With beta = 1 the probability resets on every period, and there is no zero run to decay
+	alpha, beta = Decimal("0.5"), Decimal("1")
+	assert tsb_sparse([(0, Decimal(1)), (1, Decimal(2))], 2, alpha, beta, 1) == [Decimal("1.5")]
+	assert tsb_sparse([(0, Decimal(1)), (3, Decimal(2))], 4, alpha, beta, 1) == [Decimal("1.5")]
+	assert tsb_sparse([(0, Decimal(1)), (3, Decimal(2))], 5, alpha, beta, 1) == [Decimal(0)]
+
+
+def test_intermittent_sparse_batch():
+	series = [
+		[Decimal(0), Decimal(0), Decimal(4), Decimal(0), Decimal(0), Decimal(0), Decimal(2)],
+		[Decimal(0)] * 5,
+	]
+	sparse = [to_sparse(s) for s in series]
+	assert sparse[0] == ([(2, Decimal(4)), (6, Decimal(2))], 7)
+
+	alpha = Decimal("0.5")
+	croston = intermittent_batch(sparse, "croston", alpha=alpha, n=2)
+	# size = 4 + 0.5 * (2 - 4) = 3, interval = 3 + 0.5 * (4 - 3) = 3.5
+	assert croston[0] == [Decimal(3) / Decimal("3.5")] * 2
+	assert croston[1] == [Decimal(0)] * 2
+	assert croston[0] == croston_sparse(*sparse[0], alpha=alpha, n=2)
+
+	tsb = intermittent_batch(sparse, "tsb", alpha=alpha, beta=alpha, n=1)
+	assert tsb[0] == tsb_sparse(*sparse[0], alpha=alpha, beta=alpha, n=1)
+
+
+def test_intermittent_errors(example_data_with_zeros):
+	with pytest.raises(TypeError):
+		example_data_with_zeros.croston(alpha=0.1)
+
+	with pytest.raises(Exception):
+		example_data_with_zeros.tsb(alpha=Decimal("0.1"), beta=Decimal("1.5"))
+
+	with pytest.raises(ValueError):
+		croston_sparse([(10, Decimal(1))], 5, alpha=Decimal("0.1"), n=1)
+
+	with pytest.raises(ValueError):
+		intermittent_batch([], "holt")
+
+
+def test_horizon_bins(example_data):
+	p = Period(datetime.date(2022, 1, 1), datetime.date(2023, 12, 31), "Calendar Month")
+	history = p.get_date_bins()
+	example_data(bins=history, periodicity="Calendar Month").moving_average(periods=3, n=4)
+	bins = list(example_data.horizon_bins())
+	assert len(bins) == 4
+	assert bins == p.get_date_bins(datetime.date(2024, 1, 1), datetime.date(2024, 4, 30))
+	assert example_data.horizon_labels() == ["Jan-24", "Feb-24", "Mar-24", "Apr-24"]
+	assert len(list(example_data.horizon_bins(n=30))) == 30
+
+
+def test_horizon_bins_resume_pattern():
+	# A truncated last bin is completed, and the custom period cycle continues from it
+	p = Period(periodicity="Fiscal Weeks")
+	history = p.get_date_bins(
+		datetime.date(2023, 1, 2), datetime.date(2023, 5, 31), custom_period=[4, 5, 4]
+	)
+	full = p.get_date_bins(
+		datetime.date(2023, 1, 2), datetime.date(2024, 12, 31), custom_period=[4, 5, 4]
+	)
+	future = list(p.iter_horizon_bins(history, 6, custom_period=[4, 5, 4]))
+	assert history[-1][1] < full[len(history) - 1][1]
+	assert future[0] == (datetime.date(2023, 6, 1), full[len(history) - 1][1])
+	assert future[1:] == full[len(history) : len(history) + 5]
+
+
+def test_horizon_labels_fiscal_weeks(example_data):
+	p = Period(periodicity="Fiscal Weeks")
+	history = p.get_date_bins(
+		datetime.date(2023, 1, 2), datetime.date(2023, 6, 4), custom_period=[4, 5, 4]
+	)
+	full = p.get_date_bins(
+		datetime.date(2023, 1, 2), datetime.date(2023, 12, 31), custom_period=[4, 5, 4]
+	)
+	labels = p.get_period_labels(full)
+	example_data(bins=history, periodicity="Fiscal Weeks", custom_period=[4, 5, 4])
+	example_data.moving_average(periods=3, n=3)
+	assert example_data.horizon_labels() == labels[len(history) : len(history) + 3]
+
+	# The rest of a truncated last bin keeps its number
+	truncated = history[:-1] + [(history[-1][0], datetime.date(2023, 5, 21))]
+	example_data(bins=truncated, periodicity="Fiscal Weeks", custom_period=[4, 5, 4])
+	assert example_data.horizon_labels() == ["5 (2w)-23"] + labels[len(history) : len(history) + 2]
+
+
+def test_new_data_resets_bins(example_data):
+	p = Period(datetime.date(2023, 1, 1), datetime.date(2023, 12, 31), "Calendar Month")
+	example_data(bins=p.get_date_bins(), periodicity="Calendar Month")
+	example_data(data=[[Decimal(1), Decimal(2), Decimal(3)]])
+	assert example_data.bins is None
+	with pytest.raises(ValueError):
+		example_data.horizon_bins(n=1)
+
+
+def test_horizon_bins_errors(example_data):
+	example_data.moving_average(periods=3)
+	with pytest.raises(ValueError):
+		example_data.horizon_bins()
+	with pytest.raises(ValueError):
+		Period().iter_horizon_bins([], 3)
+	bins = Period().get_date_bins(datetime.date(2023, 1, 1), datetime.date(2023, 3, 31), "Monthly")
+	with pytest.raises(ValueError):
+		Period().iter_horizon_bins(bins, -1, "Monthly")
+	with pytest.raises(ValueError):
+		Period().iter_horizon_bins(bins, 3, "Entire Period")
+
+
+def test_select_method_empty_holdout():
+	with pytest.raises(ValueError, match="backtested"):
+		select_method([[Decimal(1), Decimal(2), Decimal(3)], []])
+	assert select_method([[Decimal(1), Decimal(2)], [Decimal(3)]])[0] in ForecastModel.methods
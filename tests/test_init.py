@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import forecast
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(statement: str) -> dict[str, int]:
+	"""Runs `statement` in a new interpreter and returns the cumulative import times by module."""
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", statement],
+		capture_output=True,
+		text=True,
+		cwd=ROOT,
+		check=True,
+	)
+	times = {}
+	for line in result.stderr.splitlines():
+		if not line.startswith("import time:") or "|" not in line:
+			continue
+		_, cumulative, module = line.split("|")
+		if cumulative.strip().isdigit():
+			times[module.strip()] = int(cumulative)
+	return times
+
+
+def test_import_does_not_load_submodules():
+	times = import_times("import forecast")
+	assert "forecast" in times
+	assert "forecast.date_binning" not in times and "forecast.forecast" not in times
+
+
+def test_submodules_load_on_first_access():
+	times = import_times("from forecast import Period")
+	assert "forecast.date_binning" in times and "forecast.forecast" not in times
+	times = import_times("from forecast import Forecast")
+	assert "forecast.forecast" in times and "forecast.date_binning" not in times
+
+
+def test_submodule_attributes():
+	# Submodules are reachable as attributes without importing them explicitly
+	subprocess.run(
+		[
+			sys.executable,
+			"-c",
+			"import forecast; forecast.date_binning.Period; forecast.forecast.Forecast",
+		],
+		cwd=ROOT,
+		check=True,
+	)
+
+
+def test_import_time_benchmark():
+	# Cold start of the bare package should stay far below loading all submodules
+	bare = min(import_times("import forecast")["forecast"] for _ in range(3))
+	full = import_times("import forecast.date_binning, forecast.forecast")
+	loaded = full["forecast.date_binning"] + full["forecast.forecast"]
+	assert bare < loaded
+
+
+def test_public_names():
+	assert set(forecast.__all__) <= set(dir(forecast))
+	for name in forecast.__all__:
+		assert getattr(forecast, name) is not None
+	with pytest.raises(AttributeError):
+		forecast.does_not_exist
@@ -0,0 +1,140 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from forecast import Period
+from forecast.calendars import configure_business_calendar
+from forecast.periodicities import PERIODICITIES, get_periodicity, register_periodicity
+
+
+def test_registry_is_read_only():
+	with pytest.raises(TypeError):
+		PERIODICITIES["Weekly"] = PERIODICITIES["Biweekly"]  # type: ignore[index]
+	with pytest.raises(TypeError):
+		Period().date_math_patterns["Weekly"] = ("weeks", 3)  # type: ignore[index]
+
+
+def test_unknown_periodicity():
+	with pytest.raises(ValueError):
+		get_periodicity("Fortnightly")
+	with pytest.raises(ValueError):
+		Period().get_date_bins(datetime.date(2023, 1, 1), datetime.date(2023, 2, 1), "Fortnightly")
+
+
+def test_custom_period_is_not_stored():
+	p = Period(datetime.date(2023, 1, 1), datetime.date(2023, 1, 31), "Custom Days")
+	p.get_date_bins(custom_period=[2, 3])
+	assert p.date_math_patterns["Custom Days"] == ("days", 1)
+	assert len(p.get_date_bins()) == 31
+
+
+def test_concurrent_custom_periods():
+	p = Period(datetime.date(2023, 1, 2), datetime.date(2024, 12, 29), "Fiscal Weeks")
+	expected = {n: p.get_date_bins(custom_period=n) for n in range(1, 9)}
+	Period.cache_clear()
+	with ThreadPoolExecutor(max_workers=8) as executor:
+		calls = list(range(1, 9)) * 20
+		results = list(executor.map(lambda n: (n, p.get_date_bins(custom_period=n)), calls))
+	assert all(bins == expected[n] for n, bins in results)
+
+
+def test_register_calendar_periodicity():
+	spec = register_periodicity("Semiannually", unit="months", step=6, replace=True)
+	assert PERIODICITIES["Semiannually"] is spec
+	bins = Period().get_date_bins(
+		datetime.date(2023, 2, 15), datetime.date(2024, 2, 14), "Semiannually"
+	)
+	assert bins == [
+		(datetime.date(2023, 2, 15), datetime.date(2023, 8, 14)),
+		(datetime.date(2023, 8, 15), datetime.date(2024, 2, 14)),
+	]
+	with pytest.raises(ValueError):
+		register_periodicity("Semiannually", unit="months", step=6)
+
+
+def test_register_generator_periodicity():
+	def month_starts(spec, start_date, steps):
+		yield start_date
+		date = start_date.replace(day=1)
+		while True:
+			date = (date + datetime.timedelta(days=32)).replace(day=1)
+			yield date
+
+	register_periodicity("Month Starts", month_starts, replace=True)
+	bins = Period().get_date_bins(
+		datetime.date(2023, 1, 10), datetime.date(2023, 3, 31), "Month Starts"
+	)
+	assert bins == [
+		(datetime.date(2023, 1, 10), datetime.date(2023, 1, 31)),
+		(datetime.date(2023, 2, 1), datetime.date(2023, 2, 28)),
+		(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31)),
+	]
+
+
+def test_register_iso_periodicity_mid_year():
+	register_periodicity("ISO Year From W27", iso_weeks=[27], replace=True)
+	bins = Period().get_date_bins(
+		datetime.date(2023, 7, 3), datetime.date(2025, 6, 29), "ISO Year From W27"
+	)
+	assert bins == [
+		(datetime.date(2023, 7, 3), datetime.date(2024, 6, 30)),
+		(datetime.date(2024, 7, 1), datetime.date(2025, 6, 29)),
+	]
+
+
+def test_register_errors():
+	with pytest.raises(ValueError):
+		register_periodicity("Bad", iso_weeks=[5, 1])
+	with pytest.raises(ValueError):
+		register_periodicity("Bad", unit="hours")
+	with pytest.raises(ValueError):
+		register_periodicity("Bad", unit="days", step=0)
+	with pytest.raises(ValueError):
+		register_periodicity("Bad", iso_weeks=[1], unit="days")
+	assert "Bad" not in PERIODICITIES
+
+
+def test_retail_bins_and_labels():
+	p = Period(datetime.date(2023, 1, 29), datetime.date(2024, 2, 3), "Retail Month (4 + 5 + 4)")
+	bins = p.get_date_bins()
+	assert len(bins) == 12
+	assert bins[1] == (datetime.date(2023, 2, 26), datetime.date(2023, 4, 1))
+	assert bins[-1] == (datetime.date(2023, 12, 31), datetime.date(2024, 2, 3))
+	labels = p.get_period_labels(bins)
+	assert labels[:3] == ["Feb (4w)-23", "Mar (5w)-23", "Apr (4w)-23"] and labels[-1] == "Jan (5w)-23"
+
+	weeks = p.get_date_bins(periodicity="Retail Week")
+	assert len(weeks) == 53 and p.get_period_labels(weeks, "Retail Week")[-1] == "Week 53-23"
+	quarters = p.get_date_bins(periodicity="Retail Quarter")
+	assert p.get_period_labels(quarters, "Retail Quarter") == ["Q1-23", "Q2-23", "Q3-23", "Q4-23"]
+
+
+def test_retail_stub_and_52_week_year():
+	p = Period(datetime.date(2024, 12, 1), datetime.date(2025, 3, 15), "Retail Month (4 + 4 + 5)")
+	assert p.get_date_bins() == [
+		(datetime.date(2024, 12, 1), datetime.date(2024, 12, 28)),
+		(datetime.date(2024, 12, 29), datetime.date(2025, 2, 1)),
+		(datetime.date(2025, 2, 2), datetime.date(2025, 3, 1)),
+		(datetime.date(2025, 3, 2), datetime.date(2025, 3, 15)),
+	]
+
+
+def test_business_days():
+	p = Period(datetime.date(2023, 12, 30), datetime.date(2024, 1, 14), "Business Days")
+	# The leading weekend and following non-business days fall in the bin before them
+	assert p.get_date_bins(custom_period=5) == [
+		(datetime.date(2023, 12, 30), datetime.date(2024, 1, 7)),
+		(datetime.date(2024, 1, 8), datetime.date(2024, 1, 14)),
+	]
+	try:
+		configure_business_calendar(holidays=[datetime.date(2024, 1, 1)])
+		bins = p.get_date_bins(custom_period=[2, 3])
+		assert bins[:3] == [
+			(datetime.date(2023, 12, 30), datetime.date(2024, 1, 3)),
+			(datetime.date(2024, 1, 4), datetime.date(2024, 1, 8)),
+			(datetime.date(2024, 1, 9), datetime.date(2024, 1, 10)),
+		]
+		assert p.bin_for(datetime.date(2024, 1, 7), custom_period=[2, 3]) == bins[1]
+	finally:
+		configure_business_calendar()